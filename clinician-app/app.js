@@ -78,8 +78,29 @@ stopBtn.addEventListener('click', stopStreaming);
 toggleVideoBtn.addEventListener('click', toggleVideo);
 toggleAudioBtn.addEventListener('click', toggleAudio);
 
+// Load the Socket.IO client bundle matching the server's wire format (JSON or msgpack)
+let socketIOClientLoaded = null;
+function loadSocketIOClient() {
+    if (!socketIOClientLoaded) {
+        socketIOClientLoaded = fetch(`${SIGNALING_SERVER}/socket.io-config`)
+            .then((res) => res.json())
+            .catch(() => ({ parser: 'json' }))
+            .then(({ parser }) => new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = parser === 'msgpack'
+                    ? 'https://cdn.socket.io/4.6.1/socket.io.msgpack.min.js'
+                    : 'https://cdn.socket.io/4.6.1/socket.io.min.js';
+                script.onload = resolve;
+                script.onerror = () => reject(new Error(`Failed to load ${script.src}`));
+                document.head.appendChild(script);
+            }));
+    }
+    return socketIOClientLoaded;
+}
+
 // Initialize Socket.IO connection
-function initializeSocket() {
+async function initializeSocket() {
+    await loadSocketIOClient();
     socket = io(SIGNALING_SERVER, {
         transports: ['websocket'],
         upgrade: false,
@@ -121,7 +142,7 @@ async function startStreaming() {
 
     if (USE_AR_FEED) {
         // Initialize socket and join room without touching camera
-        initializeSocket();
+        await initializeSocket();
         socket.emit('join-room', {
             roomId,
             role: 'clinician',
@@ -242,7 +263,7 @@ async function startStreaming() {
         });
 
         // Initialize socket connection
-        initializeSocket();
+        await initializeSocket();
 
         // Join room
         socket.emit('join-room', {
@@ -280,7 +301,7 @@ async function startStreaming() {
             try {
                 localStream = await navigator.mediaDevices.getUserMedia({ video: true, audio: true });
                 localVideo.srcObject = localStream;
-                initializeSocket();
+                await initializeSocket();
                 socket.emit('join-room', { roomId, role: 'clinician', userName });
                 setupPanel.style.display = 'none';
                 videoContainer.style.display = 'block';
@@ -104,9 +104,34 @@ let lastSkeletonSentAt = 0;
 const HAND_SKELETON_FPS = 20; // throttle to ~20 fps to reduce CPU + network overhead
 let lastSkeletonSignature = null;
 let lastSkeletonChangeAt = 0;
+// Send landmarks as packed int16 (value * LANDMARK_Q_SCALE) instead of JSON float objects (~4x smaller).
+// The scale leaves int16 headroom for [-2, 2) so off-screen points and z are not clipped.
+const HAND_SKELETON_QUANTIZE = true;
+const LANDMARK_Q_SCALE = 16384;
+
+// Load the Socket.IO client bundle matching the server's wire format (JSON or msgpack)
+let socketIOClientLoaded = null;
+function loadSocketIOClient() {
+    if (!socketIOClientLoaded) {
+        socketIOClientLoaded = fetch(`${SIGNALING_SERVER}/socket.io-config`)
+            .then((res) => res.json())
+            .catch(() => ({ parser: 'json' }))
+            .then(({ parser }) => new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = parser === 'msgpack'
+                    ? 'https://cdn.socket.io/4.6.1/socket.io.msgpack.min.js'
+                    : 'https://cdn.socket.io/4.6.1/socket.io.min.js';
+                script.onload = resolve;
+                script.onerror = () => reject(new Error(`Failed to load ${script.src}`));
+                document.head.appendChild(script);
+            }));
+    }
+    return socketIOClientLoaded;
+}
 
 // Initialize Socket.IO connection
-function initializeSocket() {
+async function initializeSocket() {
+    await loadSocketIOClient();
     socket = io(SIGNALING_SERVER, {
         transports: ['websocket'],
         upgrade: false,
@@ -142,7 +167,7 @@ async function joinSession() {
     }
 
     // Initialize socket connection
-    initializeSocket();
+    await initializeSocket();
 
     // Join room
     socket.emit('join-room', {
@@ -588,6 +613,18 @@ function disableHandGuidance() {
     }
 }
 
+function quantizeLandmarks(landmarks) {
+    const q = new Int16Array(landmarks.length * 3);
+    const toQ = (v) => Math.max(-32768, Math.min(32767, Math.round(v * LANDMARK_Q_SCALE)));
+    for (let i = 0; i < landmarks.length; i++) {
+        const p = landmarks[i];
+        q[i * 3] = toQ(p.x);
+        q[i * 3 + 1] = toQ(p.y);
+        q[i * 3 + 2] = toQ(p.z);
+    }
+    return q.buffer;
+}
+
 function onHandsResults(results) {
     // Throttle send rate
     const now = Date.now();
@@ -603,7 +640,11 @@ function onHandsResults(results) {
         for (let i = 0; i < handsCount; i++) {
             const landmarks = results.multiHandLandmarks[i] || [];
             const handedness = (results.multiHandedness && results.multiHandedness[i] && results.multiHandedness[i].label) || null;
-            skeletons.push({
+            skeletons.push(HAND_SKELETON_QUANTIZE ? {
+                landmarksQ: quantizeLandmarks(landmarks),
+                handedness,
+                ts: now
+            } : {
                 landmarks: landmarks.map(p => ({ x: round2(p.x), y: round2(p.y), z: round2(p.z) })),
                 handedness,
                 ts: now
@@ -616,10 +657,11 @@ function onHandsResults(results) {
 
     // Lightweight change detection: only send if significant movement or periodic refresh (every 300ms)
     const sig = (() => {
-        if (!singleSkeleton || !singleSkeleton.landmarks) return 'none';
+        const firstLandmarks = skeletons.length > 0 ? results.multiHandLandmarks[0] : null;
+        if (!firstLandmarks) return 'none';
         const idx = [0, 5, 9, 13, 17];
         return idx.map(i => {
-            const p = singleSkeleton.landmarks[i] || { x: 0, y: 0 };
+            const p = firstLandmarks[i] || { x: 0, y: 0 };
             return `${p.x.toFixed(2)},${p.y.toFixed(2)}`;
         }).join('|');
     })();
@@ -1,23 +1,192 @@
 import cv2
 import mediapipe as mp
 import numpy as np
-import math
+import bisect
 from typing import List, Tuple, Optional
+from collections import OrderedDict, defaultdict
+import math
 import time
 import os
 import requests
 import threading
+import queue
 import socketio
 import asyncio
 import av
 from aiortc import RTCPeerConnection, RTCSessionDescription, VideoStreamTrack, RTCConfiguration, RTCIceServer
 from renderer_3d import Renderer3D
-from virtual_object_3d import VirtualObject3D
+from virtual_object_3d import VirtualObject3D, Scene, RenderMode
+import hand_kernel
+
+# Scale of int16-packed landmarks (`landmarksQ`) sent by the expert app; must match expert-app/app.js
+LANDMARK_Q_SCALE = 16384.0
+
+# Gesture name per 5-bit extended-finger mask (bit 0 = thumb ... bit 4 = pinky); '' = no gesture
+_GESTURE_LUT = [''] * 32
+_GESTURE_LUT[0b00000] = 'fist'
+_GESTURE_LUT[0b00010] = 'pointing'   # Only index finger
+_GESTURE_LUT[0b00011] = 'pinch'      # Thumb + index
+_GESTURE_LUT[0b00110] = 'peace'      # Index + middle
+_GESTURE_LUT[0b11111] = 'open_hand'
+
+# Hand slots for per-hand interaction state (grab / pinch), indexed by hand_idx
+MAX_HANDS = 2
+# Hand indices set in each grabbed_by_hand_mask value (bit h = hand h), in increasing order
+_MASK_HANDS = tuple(tuple(h for h in range(MAX_HANDS) if mask >> h & 1) for mask in range(1 << MAX_HANDS))
+
+# Minimum pinch movement (px) before a grabbed 3D object follows the hand, squared for sqrt-free compares
+MOVEMENT_THRESHOLD_SQ = 0.5 * 0.5
+
+# Screen-space cell size (px) of the broad-phase grid for 3D grabs
+GRAB_GRID_CELL = 64
+
+# Rotation axis driven by each hand (0=x, 1=y); other labels fall back to -1 (none)
+_AXIS_BY_LABEL = {'left': 0, 'right': 1}
+_AXIS_LABELS = {0: "ROTATE X", 1: "ROTATE Y"}
+# Pixel size of each rotation-indicator label (FONT_HERSHEY_SIMPLEX, scale 0.6, thickness 2)
+_AXIS_LABEL_SIZES = {text: cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
+                     for text in ("ROTATE X", "ROTATE Y", "ROTATOR")}
+
+
+def _arrow_curve(p1, p2, tip_length: float = 0.3) -> list:
+    """Open polyline (shaft + tip) that draws the same pixels as cv2.arrowedLine(p1, p2)"""
+    tip = math.hypot(p1[0] - p2[0], p1[1] - p2[1]) * tip_length
+    angle = math.atan2(p1[1] - p2[1], p1[0] - p2[0])
+    a = (round(p2[0] + tip * math.cos(angle + math.pi / 4)), round(p2[1] + tip * math.sin(angle + math.pi / 4)))
+    b = (round(p2[0] + tip * math.cos(angle - math.pi / 4)), round(p2[1] + tip * math.sin(angle - math.pi / 4)))
+    return [p1, p2, a, p2, b]
+
+
+# Rotation-indicator arrows as (2, 5, 2) palm-relative polylines, one cv2.polylines call per object:
+# up/down for the X axis, left/right (beside the palm) for Y
+_ROT_ARROW_LEN = 35
+_ROT_ARROWS = {
+    0: np.array([_arrow_curve((0, -10), (0, -10 - _ROT_ARROW_LEN)),
+                 _arrow_curve((0, 10), (0, 10 + _ROT_ARROW_LEN))], dtype=np.int32),
+    1: np.array([_arrow_curve((50 + _ROT_ARROW_LEN, 0), (50, 0)),
+                 _arrow_curve((50, 0), (50 + _ROT_ARROW_LEN, 0))], dtype=np.int32),
+}
+
+# Keyboard shortcuts (cv2.waitKey codes)
+K_QUIT = ord('q')
+K_RESET = ord('r')
+K_ADD_OBJECT = ord('c')
+K_TOGGLE_2D = ord('1')
+K_TOGGLE_3D = ord('2')
+K_TOGGLE_RENDER = ord('w')
+K_TOGGLE_ROTATE = ord('t')
+K_RESET_X = ord('x')
+K_RESET_Y = ord('y')
+K_RESET_Z = ord('z')
+K_JARVIS = ord('j')
+K_CYCLE_3D = ord(' ')  # Spacebar
+K_CYCLE_2D = ord('s')
+
+# Key-handler status lines, indexed by the new on/off state
+_AUTO_MSG = ("Auto-rotation: OFF", "Auto-rotation: ON")
+_2D_MSG = ("2D objects: OFF", "2D objects: ON")
+_3D_MSG = ("3D objects: OFF", "3D objects: ON")
+
+class ObjectStore:
+    """Structure-of-arrays storage for VirtualObject state.
+
+    Position, size, grab state and color of every object live in parallel arrays so
+    hit tests run as one vectorized expression over all objects. `objects` holds the
+    VirtualObject views in store order (row i of every array belongs to objects[i]).
+    """
+    
+    # Spatial-hash cell size; matches the 200 px size clamp so any object containing a
+    # point is centered within the 3x3 cells around it
+    cell_size = 200.0
+    
+    def __init__(self, capacity: int = 16):
+        self.objects: List['VirtualObject'] = []
+        self.pos_xy = np.zeros((capacity, 2), dtype=np.float64)
+        self.size = np.zeros(capacity, dtype=np.float64)
+        self.grab_state = np.zeros(capacity, dtype=np.int8)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self._grid = defaultdict(set)  # (cx, cy) -> rows centered in that cell
+        self._cells: List[Tuple[int, int]] = []  # row -> its current cell
+    
+    def __len__(self) -> int:
+        return len(self.objects)
+    
+    def add(self, obj: 'VirtualObject') -> int:
+        """Register obj and return its row, growing the arrays when full"""
+        i = len(self.objects)
+        if i == len(self.size):
+            cap = max(1, 2 * i)
+            self.pos_xy = np.resize(self.pos_xy, (cap, 2))
+            self.size = np.resize(self.size, cap)
+            self.grab_state = np.resize(self.grab_state, cap)
+            self.color = np.resize(self.color, (cap, 3))
+        self.objects.append(obj)
+        self._cells.append((0, 0))
+        self._grid[(0, 0)].add(i)
+        return i
+    
+    def move(self, i: int, x: float, y: float):
+        """Set the position of row i and rehash it if it changed cell"""
+        self.pos_xy[i] = (x, y)
+        self._rehash(i)
+    
+    def _rehash(self, i: int):
+        cell = (int(self.pos_xy[i, 0] // self.cell_size), int(self.pos_xy[i, 1] // self.cell_size))
+        old = self._cells[i]
+        if cell != old:
+            self._grid[old].discard(i)
+            self._grid[cell].add(i)
+            self._cells[i] = cell
+    
+    def hit(self, x: float, y: float) -> np.ndarray:
+        """Boolean mask of the objects containing the point (x, y)"""
+        n = len(self.objects)
+        d2 = ((self.pos_xy[:n] - (x, y)) ** 2).sum(axis=1)
+        return d2 <= self.size[:n] ** 2
+    
+    def closest_grabbable(self, x: float, y: float) -> int:
+        """Row of the closest object containing (x, y) that isn't held by two hands, or -1"""
+        # Only objects hashed into the 3x3 cells around the point can contain it
+        cx, cy = int(x // self.cell_size), int(y // self.cell_size)
+        rows = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                cell = self._grid.get((gx, gy))
+                if cell:
+                    rows.extend(cell)
+        if not rows:
+            return -1
+        rows.sort()  # ties go to the earliest object, as with a linear scan
+        rows = np.asarray(rows)
+        d2 = ((self.pos_xy[rows] - (x, y)) ** 2).sum(axis=1)
+        d2[(d2 > self.size[rows] ** 2) | (self.grab_state[rows] >= 2)] = np.inf
+        k = int(np.argmin(d2))
+        return int(rows[k]) if np.isfinite(d2[k]) else -1
+
 
 class VirtualObject:
-    """Represents a virtual object that can be manipulated in AR space"""
+    """Represents a virtual object that can be manipulated in AR space.
+
+    x, y, size, color and is_grabbed are views into a row of an ObjectStore.
+    """
+    
+    __slots__ = ('_store', '_i', 'original_size', 'shape', 'grabbed_by_hand_mask', 'z_depth', 'selected',
+                 '_draw_fn', '_draw_radius', '_draw_stable')
     
-    def __init__(self, x: float, y: float, size: float = 50, color: Tuple[int, int, int] = (0, 255, 255), shape: str = "circle"):
+    # (size, color) -> (sprite, mask), shared across instances and kept in LRU order
+    _sprite_cache: "OrderedDict[Tuple[int, Tuple[int, int, int]], Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+    _sprite_cache_max = 64
+    # Frames with an unchanged radius before draw() switches to a specialized closure
+    _draw_specialize_after = 5
+    
+    def __init__(self, x: float, y: float, size: float = 50, color: Tuple[int, int, int] = (0, 255, 255), shape: str = "circle",
+                 store: Optional[ObjectStore] = None):
+        # Registers itself in the store (a private one if none is given)
+        self._store = store if store is not None else ObjectStore(1)
+        self._i = self._store.add(self)
+        self._draw_fn = None
+        self._draw_radius = -1
+        self._draw_stable = 0
         self.x = x
         self.y = y
         self.size = size
@@ -25,39 +194,145 @@ class VirtualObject:
         self.color = color
         self.shape = shape
         self.is_grabbed = 0  # 0 = not grabbed, 1 = grabbed with 1 hand, 2 = grabbed with 2 hands
-        self.grabbed_by_hand = []  # List of hand indices that are grabbing this object
+        self.grabbed_by_hand_mask = 0  # Bit h set = hand h is grabbing this object
         self.z_depth = 0.0 
-        
+        self.selected = False
+    
+    @property
+    def x(self) -> float:
+        return float(self._store.pos_xy[self._i, 0])
+    
+    @x.setter
+    def x(self, value: float):
+        self._store.pos_xy[self._i, 0] = value
+        self._store._rehash(self._i)
+    
+    @property
+    def y(self) -> float:
+        return float(self._store.pos_xy[self._i, 1])
+    
+    @y.setter
+    def y(self, value: float):
+        self._store.pos_xy[self._i, 1] = value
+        self._store._rehash(self._i)
+    
+    @property
+    def size(self) -> float:
+        return float(self._store.size[self._i])
+    
+    @size.setter
+    def size(self, value: float):
+        self._store.size[self._i] = value
+    
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        return tuple(self._store.color[self._i].tolist())
+    
+    @color.setter
+    def color(self, value: Tuple[int, int, int]):
+        self._store.color[self._i] = value
+        self._draw_fn = None
+    
+    @property
+    def is_grabbed(self) -> int:
+        return int(self._store.grab_state[self._i])
+    
+    @is_grabbed.setter
+    def is_grabbed(self, value: int):
+        self._store.grab_state[self._i] = value
+        
+    @classmethod
+    def _get_sprite(cls, radius: int, color: Tuple[int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the cached radial-gradient sprite and its disc mask for (radius, color)"""
+        key = (radius, tuple(color))
+        cached = cls._sprite_cache.get(key)
+        if cached is not None:
+            cls._sprite_cache.move_to_end(key)
+            return cached
+        
+        # Same banding as the old concentric-circle loop: each pixel takes the
+        # smallest ring (radius, radius-2, ...) that still covers it
+        yy, xx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+        dist = np.sqrt(xx * xx + yy * yy, dtype=np.float32)
+        ring = radius - 2 * np.floor((radius - dist) / 2.0)
+        ring = np.clip(ring, radius % 2 or 2, radius)
+        alpha = 0.8 * ring / radius
+        sprite = (alpha[..., None] * np.asarray(color, dtype=np.float32)).astype(np.uint8)
+        mask = dist <= radius
+        
+        cls._sprite_cache[key] = (sprite, mask)
+        if len(cls._sprite_cache) > cls._sprite_cache_max:
+            cls._sprite_cache.popitem(last=False)
+        return sprite, mask
+        
+    @staticmethod
+    def _draw_circle(frame: np.ndarray, center: Tuple[int, int], radius: int,
+                     sprite: np.ndarray, mask: np.ndarray, is_grabbed: int) -> np.ndarray:
+        """Blit a gradient sprite at center and add the grab ring"""
+        # Clip the sprite to the frame so objects near the edges still draw
+        h, w = frame.shape[:2]
+        x0, y0 = center[0] - radius, center[1] - radius
+        x1, y1 = x0 + sprite.shape[1], y0 + sprite.shape[0]
+        fx0, fy0, fx1, fy1 = max(x0, 0), max(y0, 0), min(x1, w), min(y1, h)
+        if fx0 < fx1 and fy0 < fy1:
+            sx0, sy0 = fx0 - x0, fy0 - y0
+            sx1, sy1 = sx0 + (fx1 - fx0), sy0 + (fy1 - fy0)
+            np.copyto(frame[fy0:fy1, fx0:fx1], sprite[sy0:sy1, sx0:sx1],
+                      where=mask[sy0:sy1, sx0:sx1, None])
+            
+        # Draw grab indicator based on grab state
+        if is_grabbed == 1:
+            cv2.circle(frame, center, radius + 5, (255, 255, 255), 3)  # White ring for 1 hand
+        elif is_grabbed == 2:
+            cv2.circle(frame, center, radius + 5, (255, 255, 0), 5)  # Yellow ring for 2 hands
+        return frame
+    
+    def _build_draw_fn(self, radius: int):
+        """Draw routine specialized for the current radius and color (sprite bound up front)"""
+        sprite, mask = self._get_sprite(radius, self.color)
+        store, i = self._store, self._i
+        draw_circle = self._draw_circle
+        
+        def draw_fn(frame: np.ndarray) -> np.ndarray:
+            x, y = store.pos_xy[i]
+            return draw_circle(frame, (int(x), int(y)), radius, sprite, mask, store.grab_state[i])
+        return draw_fn
+    
     def draw(self, frame: np.ndarray) -> np.ndarray:
         """Draw the virtual object on the frame"""
-        center = (int(self.x), int(self.y))
-        radius = int(self.size)
-        
-        if self.shape == "circle":
-            for i in range(radius, 0, -2):
-                alpha = 0.8 * (i / radius)
-                color = tuple(int(c * alpha) for c in self.color)
-                cv2.circle(frame, center, i, color, -1)
-                
-            # Draw grab indicator based on grab state
-            if self.is_grabbed == 1:
-                cv2.circle(frame, center, radius + 5, (255, 255, 255), 3)  # White ring for 1 hand
-            elif self.is_grabbed == 2:
-                cv2.circle(frame, center, radius + 5, (255, 255, 0), 5)  # Yellow ring for 2 hands
+        radius = int(self._store.size[self._i])
+        if radius == self._draw_radius:
+            if self._draw_fn is not None:
+                return self._draw_fn(frame)
+            self._draw_stable += 1
+        else:
+            self._draw_radius = radius
+            self._draw_stable = 0
+            self._draw_fn = None
+        
+        if self.shape == "circle" and radius > 0:
+            # Once the size has held for a few frames, switch to the specialized routine
+            if self._draw_stable >= self._draw_specialize_after:
+                self._draw_fn = self._build_draw_fn(radius)
+                return self._draw_fn(frame)
+            sprite, mask = self._get_sprite(radius, self.color)
+            self._draw_circle(frame, (int(self.x), int(self.y)), radius, sprite, mask, self.is_grabbed)
                 
         return frame
     
     def is_point_inside(self, x: float, y: float) -> bool:
         """Check if a point is inside the object"""
-        distance = math.sqrt((x - self.x) ** 2 + (y - self.y) ** 2)
-        return distance <= self.size
+        dx = x - self.x
+        dy = y - self.y
+        size = self.size
+        return dx * dx + dy * dy <= size * size
     
     def move_to(self, x: float, y: float):
-        self.x = x
-        self.y = y
+        self._store.move(self._i, x, y)
     
     def scale(self, scale_factor: float):
         self.size = max(10, min(200, self.original_size * scale_factor))
+        self._draw_fn = None
 
 
 class HandGestureDetector:
@@ -68,6 +343,7 @@ class HandGestureDetector:
         # Optional: use Socket.IO direct stream from signaling server
         self.use_socketio = os.environ.get("USE_SOCKETIO_HANDS", "1") in ("1", "true", "True")
         self.signaling_base = os.environ.get("SIGNALING_BASE_URL", "http://localhost:3001")
+        self.socketio_serializer = os.environ.get("SOCKETIO_SERIALIZER", "default")
         self.flask_base = os.environ.get("FLASK_BASE_URL", "http://127.0.0.1:5001")
         self.room_id = os.environ.get("ROOM_ID", "demo")
         self.session = requests.Session()
@@ -75,6 +351,16 @@ class HandGestureDetector:
         self.latest_skeletons = []  # list of skeleton dicts
         self.latest_skeleton_ms = 0
         self._skel_lock = threading.Lock()
+        self.latest_hands = []  # [(hand_idx, (21, 3) landmark array, handedness)] decoded from latest_skeletons
+        self._polled_hands = []  # Flask fallback hands, written by the poll thread
+        # Memoized _detect_socketio result, reused until a new skeleton arrives
+        self._last_hands_src = None
+        self._last_frame_wh = None
+        self._last_hands_info = []
+        self._flask_etag = None
+        self._poll_thread = None
+        self._log_ctr = 0  # hand-skeleton messages since the last log line
+        self._last_log = time.monotonic()
         self._sio = None
         self._sio_thread = None
         # The AR view is mirrored (frame flipped horizontally). Mirror incoming remote X to match.
@@ -83,6 +369,15 @@ class HandGestureDetector:
         self._rtc_loop = None
         self._pcs = {}  # peerId -> RTCPeerConnection
         self._video_track = None
+        # The backend never changes after construction, so bind detect_hands once instead of branching per frame
+        if self.use_socketio:
+            self.detect_hands = self._detect_socketio
+        elif self.use_remote:
+            self.detect_hands = self._detect_flask
+        else:
+            self.detect_hands = self._detect_local
+        # Compile the hand kernel now rather than on the first tracked frame
+        hand_kernel.warmup()
         if self.use_socketio:
             self._start_socketio_client()
         if not self.use_remote:
@@ -94,9 +389,13 @@ class HandGestureDetector:
                 min_tracking_confidence=0.5
             )
             self.mp_drawing = mp.solutions.drawing_utils
+            self._rgb_buf = None  # reusable RGB frame handed to MediaPipe
     
     def _start_socketio_client(self):
-        self._sio = socketio.Client(reconnection=True, logger=False, engineio_logger=False)
+        # 'msgpack' sends landmarks as binary floats instead of JSON text; the signaling
+        # server must be started with SOCKETIO_PARSER=msgpack to match
+        self._sio = socketio.Client(reconnection=True, logger=False, engineio_logger=False,
+                                    serializer=self.socketio_serializer)
         @self._sio.event
         def connect():
             try:
@@ -109,25 +408,32 @@ class HandGestureDetector:
         @self._sio.on('hand-skeleton')
         def on_hand_skeleton(msg):
             try:
+                # msg: { skeleton?: {...}, skeletons?: [...], senderId, timestamp }
+                skel_single = msg.get('skeleton')
+                skel_list = msg.get('skeletons')
+                if isinstance(skel_list, list):
+                    skeletons = skel_list
+                elif skel_single is not None:
+                    skeletons = [skel_single]
+                else:
+                    skeletons = []
+                # Decode to landmark arrays here, off the render thread
+                hands = self._decode_skeletons(skeletons)
                 with self._skel_lock:
-                    # msg: { skeleton?: {...}, skeletons?: [...], senderId, timestamp }
-                    skel_single = msg.get('skeleton')
-                    skel_list = msg.get('skeletons')
-                    if isinstance(skel_list, list):
-                        self.latest_skeletons = skel_list
-                    elif skel_single is not None:
-                        self.latest_skeletons = [skel_single]
-                    else:
-                        self.latest_skeletons = []
+                    self.latest_skeletons = skeletons
+                    self.latest_hands = hands
                     self.latest_skeleton = skel_single  # backward compatible
-                    self.latest_skeleton_ms = int(time.time() * 1000)
-                 # Print only occasionally to avoid spam
-                if self.latest_skeletons:
-                    try:
-                        total = sum(len(s.get('landmarks') or []) for s in self.latest_skeletons)
-                        print(f"[AR] Received hand-skeletons (hands={len(self.latest_skeletons)}, totalPts={total})")
-                    except Exception:
-                        pass
+                    self.latest_skeleton_ms = time.monotonic_ns() // 1_000_000  # monotonic: immune to NTP steps
+                    # A later stale period must not replay hands polled before this event
+                    self._polled_hands = []
+                    self._flask_etag = None
+                # Print at most once per second; stdout I/O on every message stalls this thread
+                self._log_ctr += 1
+                now = time.monotonic()
+                if now - self._last_log > 1.0:
+                    print(f"[AR] Received {self._log_ctr} hand-skeletons in {now - self._last_log:.1f}s (hands={len(hands)})")
+                    self._log_ctr = 0
+                    self._last_log = now
             except Exception:
                 print("[AR] Error handling hand-skeleton message")
         @self._sio.event
@@ -176,6 +482,52 @@ class HandGestureDetector:
                 print("[AR] Socket.IO thread terminated unexpectedly")
         self._sio_thread = threading.Thread(target=run, daemon=True)
         self._sio_thread.start()
+        # Flask fallback is polled off the render thread; detect_hands only reads the result
+        if self.use_remote:
+            self._poll_thread = threading.Thread(target=self._poll_flask_fallback, daemon=True)
+            self._poll_thread.start()
+
+    def _poll_flask_fallback(self):
+        """Poll Flask for skeletons while Socket.IO is stale, using conditional GETs on a kept-alive session."""
+        url = f"{self.flask_base.rstrip('/')}/landmarks/latest"
+        while True:
+            time.sleep(0.05)
+            with self._skel_lock:
+                last_ms = self.latest_skeleton_ms
+            # Only fall back if no socket events for > 800ms
+            if time.monotonic_ns() // 1_000_000 - last_ms <= 800:
+                continue
+            try:
+                headers = {'If-None-Match': self._flask_etag} if self._flask_etag else None
+                resp = self.session.get(url, params={"room_id": self.room_id}, headers=headers, timeout=0.3)
+                if resp.status_code == 304:
+                    continue
+                if not resp.ok:
+                    self._clear_polled_hands()
+                    continue
+                self._flask_etag = resp.headers.get('ETag')
+                payload = resp.json() or {}
+                data = payload.get("data") or {}
+                skel_list = []
+                if isinstance(data, dict):
+                    if isinstance(data.get("skeletons"), list):
+                        skel_list = data.get("skeletons") or []
+                    else:
+                        skel_single = data.get("skeleton") or {}
+                        if skel_single:
+                            skel_list = [skel_single]
+                hands = self._decode_skeletons(skel_list)
+                with self._skel_lock:
+                    self._polled_hands = hands
+            except Exception:
+                self._clear_polled_hands()
+    
+    def _clear_polled_hands(self):
+        """Forget the polled hands after a failed fetch (as the old synchronous fallback returned []),
+        along with their ETag so the next success sends the full payload again"""
+        with self._skel_lock:
+            self._polled_hands = []
+            self._flask_etag = None
 
     # ---------- WebRTC (aiortc) ----------
     class _ARVideoTrack(VideoStreamTrack):
@@ -242,214 +594,165 @@ class HandGestureDetector:
         except Exception as e:
             print("[AR] _handle_offer error:", e)
         
-    def detect_hands(self, frame: np.ndarray) -> List[dict]:
-        if self.use_socketio:
-            try:
-                with self._skel_lock:
-                    skel_list = list(self.latest_skeletons) if self.latest_skeletons else []
-                    last_ms = self.latest_skeleton_ms
-                if not skel_list:
-                    # Timed fallback to Flask if configured and stale
-                    if self.use_remote:
-                        now_ms = int(time.time() * 1000)
-                        # If no socket events for > 800ms, try one-off Flask fetch
-                        if now_ms - last_ms > 800:
-                            try:
-                                url = f"{self.flask_base.rstrip('/')}/landmarks/latest"
-                                resp = self.session.get(url, params={"room_id": self.room_id}, timeout=0.5)
-                                if resp.ok:
-                                    payload = resp.json() or {}
-                                    data = payload.get("data") or {}
-                                    if isinstance(data, dict):
-                                        if isinstance(data.get("skeletons"), list):
-                                            skel_list = data.get("skeletons") or []
-                                        else:
-                                            skel_single = data.get("skeleton") or {}
-                                            if skel_single:
-                                                skel_list = [skel_single]
-                            except Exception:
-                                pass
-                if not skel_list:
-                    return []
-                hands_info = []
-                for idx, skel in enumerate(skel_list):
-                    landmarks = skel.get("landmarks") or []
-                    if not landmarks:
-                        continue
-                    hand_info = self._extract_hand_info_from_normalized(landmarks, frame.shape, skel.get("handedness"))
-                    hand_info['hand_idx'] = idx
-                    hands_info.append(hand_info)
-                return hands_info
-            except Exception:
-                return []
-        elif self.use_remote:
-            # Fetch latest skeleton from Flask and adapt to hands_info
-            try:
-                url = f"{self.flask_base.rstrip('/')}/landmarks/latest"
-                resp = self.session.get(url, params={"room_id": self.room_id}, timeout=2.5)
-                resp.raise_for_status()
-                payload = resp.json() or {}
-                data = payload.get("data") or {}
-                skel = data.get("skeleton") or {}
-                landmarks = skel.get("landmarks") or []
-                if not landmarks:
-                    return []
-                hand_info = self._extract_hand_info_from_normalized(landmarks, frame.shape, skel.get("handedness"))
-                hand_info['hand_idx'] = 0
-                return [hand_info]
-            except Exception:
+    def _detect_socketio(self, frame: np.ndarray, frame_wh: Optional[Tuple[int, int]] = None) -> List[dict]:
+        """Hands from the Socket.IO stream (with the polled Flask fallback when stale)"""
+        # (width, height) is read once per frame and shared by every hand
+        if frame_wh is None:
+            frame_wh = (frame.shape[1], frame.shape[0])
+        try:
+            with self._skel_lock:
+                hands = self.latest_hands
+                last_ms = self.latest_skeleton_ms
+                polled = self._polled_hands
+            if not hands:
+                # Timed fallback to Flask if configured and stale (filled by _poll_flask_fallback)
+                if self.use_remote:
+                    now_ms = time.monotonic_ns() // 1_000_000
+                    if now_ms - last_ms > 800:
+                        hands = polled
+            if not hands:
                 return []
-        else:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
-            
+            # Every new skeleton (socket or polled) is published as a new list, so the same
+            # list at the same frame size means the previous result is still exact
+            if hands is self._last_hands_src and frame_wh == self._last_frame_wh:
+                return self._last_hands_info
             hands_info = []
-            if results.multi_hand_landmarks:
-                handedness_list = results.multi_handedness or []
-                for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                    hand_info = self._extract_hand_info(hand_landmarks, frame.shape)
-                    hand_info['landmarks'] = hand_landmarks
-                    hand_info['hand_idx'] = hand_idx
+            for idx, lm, handedness in hands:
+                hand_info = self._extract_hand_info(lm, frame_wh, self.mirror_coordinates)
+                self._set_handedness(hand_info, handedness, 1.0)
+                hand_info['hand_idx'] = idx
+                hands_info.append(hand_info)
+            self._last_hands_src = hands
+            self._last_frame_wh = frame_wh
+            self._last_hands_info = hands_info
+            return hands_info
+        except Exception:
+            return []
+    
+    def _detect_flask(self, frame: np.ndarray, frame_wh: Optional[Tuple[int, int]] = None) -> List[dict]:
+        """Fetch latest skeleton from Flask and adapt to hands_info"""
+        if frame_wh is None:
+            frame_wh = (frame.shape[1], frame.shape[0])
+        try:
+            url = f"{self.flask_base.rstrip('/')}/landmarks/latest"
+            resp = self.session.get(url, params={"room_id": self.room_id}, timeout=2.5)
+            resp.raise_for_status()
+            payload = resp.json() or {}
+            data = payload.get("data") or {}
+            skel = data.get("skeleton") or {}
+            landmarks = skel.get("landmarks") or []
+            if not landmarks:
+                return []
+            lm = self._landmarks_to_array(landmarks)
+            hand_info = self._extract_hand_info(lm, frame_wh, self.mirror_coordinates)
+            self._set_handedness(hand_info, skel.get("handedness"), 1.0)
+            hand_info['hand_idx'] = 0
+            return [hand_info]
+        except Exception:
+            return []
+    
+    def _detect_local(self, frame: np.ndarray, frame_wh: Optional[Tuple[int, int]] = None) -> List[dict]:
+        """Run MediaPipe on the frame locally"""
+        if frame_wh is None:
+            frame_wh = (frame.shape[1], frame.shape[0])
+        # MediaPipe needs RGB; convert into a reused buffer rather than allocating a
+        # fresh frame every call (the Socket.IO / Flask paths never need this)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        results = self.hands.process(self._rgb_buf)
+        
+        hands_info = []
+        if results.multi_hand_landmarks:
+            handedness_list = results.multi_handedness or []
+            for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
+                lm = self._landmarks_to_array(hand_landmarks)
+                hand_info = self._extract_hand_info(lm, frame_wh)
+                hand_info['landmarks'] = hand_landmarks
+                hand_info['hand_idx'] = hand_idx
 
-                    if hand_idx < len(handedness_list) and handedness_list[hand_idx].classification:
-                        classification = handedness_list[hand_idx].classification[0]
-                        label = classification.label.lower()
-                        hand_info['hand_label'] = label
-                        hand_info['hand_confidence'] = classification.score
-                        hand_info['hand_is_left'] = label == "left"
-                        hand_info['hand_is_right'] = label == "right"
-                    else:
-                        hand_info['hand_label'] = "unknown"
-                        hand_info['hand_confidence'] = 0.0
-                        hand_info['hand_is_left'] = False
-                        hand_info['hand_is_right'] = False
+                if hand_idx < len(handedness_list) and handedness_list[hand_idx].classification:
+                    classification = handedness_list[hand_idx].classification[0]
+                    self._set_handedness(hand_info, classification.label, classification.score)
+                else:
+                    self._set_handedness(hand_info, None, 0.0)
 
-                    hands_info.append(hand_info)
-                    
-            return hands_info
+                hands_info.append(hand_info)
+                
+        return hands_info
     
-    def _extract_hand_info(self, landmarks, frame_shape) -> dict:
-        h, w = frame_shape[:2]
-        
-        thumb_tip = landmarks.landmark[4]
-        index_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        ring_tip = landmarks.landmark[16]
-        pinky_tip = landmarks.landmark[20]
-        
-        wrist = landmarks.landmark[0]
-        index_mcp = landmarks.landmark[5]
-        
-        # Convert to pixel coordinates
-        thumb_pos = (int(thumb_tip.x * w), int(thumb_tip.y * h))
-        index_pos = (int(index_tip.x * w), int(index_tip.y * h))
-        middle_pos = (int(middle_tip.x * w), int(middle_tip.y * h))
-        wrist_pos = (int(wrist.x * w), int(wrist.y * h))
-        
-        # Calculate palm center
-        palm_x = int((wrist.x + index_mcp.x) * w / 2)
-        palm_y = int((wrist.y + index_mcp.y) * h / 2)
-        palm_center = (palm_x, palm_y)
-        
-        # Detect gestures
-        gestures = self._detect_gestures(landmarks)
-        
-        pinch_distance = math.sqrt((thumb_pos[0] - index_pos[0]) ** 2 + (thumb_pos[1] - index_pos[1]) ** 2)
-        
-        # Calculate pinch center for better tracking
-        pinch_center = ((thumb_pos[0] + index_pos[0]) // 2, (thumb_pos[1] + index_pos[1]) // 2)
-        
-        # More reliable pinch detection with multiple criteria
-        # Check if fingers are actually bent (not just close together)
-        thumb_bent = thumb_tip.x < landmarks.landmark[3].x  # Thumb is bent inward
-        index_bent = index_tip.y > landmarks.landmark[6].y  # Index finger is bent down
-        
-        # Much more lenient pinch detection - prioritize distance over finger position
-        # Primary method: distance-based
-        is_pinching = (pinch_distance < 60 and  # Increased distance threshold
-                      pinch_distance > 10 and  # Not too close (avoid noise)
-                      (thumb_bent or index_bent or pinch_distance < 35))  # Either finger bent OR very close
-        
-        # Fallback method: if distance is very close, always consider it pinching
-        if pinch_distance < 25:
-            is_pinching = True
+    def _decode_skeletons(self, skeletons: List[dict]) -> List[tuple]:
+        """Convert skeleton dicts (plain or int16-packed landmarks) to (hand_idx, landmark array, handedness),
+        skipping hands without landmarks"""
+        hands = []
+        for idx, skel in enumerate(skeletons):
+            packed = skel.get("landmarksQ")
+            if packed:
+                # int16-quantized coordinates arrive as a binary blob
+                landmarks = np.frombuffer(packed, dtype='<i2').astype(np.float32) * (1.0 / LANDMARK_Q_SCALE)
+            else:
+                landmarks = skel.get("landmarks") or []
+            if len(landmarks) == 0:
+                continue
+            hands.append((idx, self._landmarks_to_array(landmarks), skel.get("handedness")))
+        return hands
+    
+    @staticmethod
+    def _landmarks_to_array(landmarks) -> np.ndarray:
+        """Pack MediaPipe landmarks, normalized landmark dicts ({x,y,z}) or a flat [x,y,z,...] list
+        into a (21, 3) float32 array.
+        
+        Missing points are zero-padded so every backend feeds the same fixed-shape kernel.
+        """
+        arr = np.zeros((21, 3), dtype=np.float32)
+        if hasattr(landmarks, 'landmark'):
+            points = landmarks.landmark
+            n = min(len(points), 21)
+            values = (v for p in points[:n] for v in (p.x, p.y, p.z))
+        elif not isinstance(landmarks[0], dict):
+            # Flat float list (msgpack payloads) - reshape directly
+            flat = np.asarray(landmarks, dtype=np.float32)[:63]
+            n = flat.size // 3
+            arr[:n] = flat[:n * 3].reshape(n, 3)
+            return arr
+        else:
+            n = min(len(landmarks), 21)
+            values = (v for p in landmarks[:n] for v in (p['x'], p['y'], p.get('z', 0.0)))
+        arr[:n] = np.fromiter(values, dtype=np.float32, count=n * 3).reshape(n, 3)
+        return arr
+    
+    def _extract_hand_info(self, lm: np.ndarray, frame_wh: Tuple[int, int], mirror: bool = False) -> dict:
+        """Build hand info from a (21, 3) array of normalized landmarks (shared by all backends)."""
+        w, h = frame_wh
+        (px, palm_x, palm_y, pinch_distance, is_pinching,
+         thumb_bent, index_bent, ext_bits) = hand_kernel.compute(lm, w, h, mirror)
+        pixel_landmarks = list(map(tuple, px.tolist()))
+        thumb_pos = pixel_landmarks[4]
+        index_pos = pixel_landmarks[8]
         
         return {
             'thumb_pos': thumb_pos,
             'index_pos': index_pos,
-            'middle_pos': middle_pos,
-            'palm_center': palm_center,
-            'pinch_center': pinch_center,
-            'wrist_pos': wrist_pos,
-            'gestures': gestures,
-            'pinch_distance': pinch_distance,
-            'is_pinching': is_pinching,
-            'thumb_bent': thumb_bent,
-            'index_bent': index_bent
-        }
-    
-    def _extract_hand_info_from_normalized(self, lm_list: List[dict], frame_shape, handedness: Optional[str]) -> dict:
-        """Build the same structure as _extract_hand_info using normalized landmark dicts ({x,y,z})."""
-        h, w = frame_shape[:2]
-        def get(i):
-            if i < 0 or i >= len(lm_list): 
-                return {'x': 0.0, 'y': 0.0, 'z': 0.0}
-            return lm_list[i]
-        def to_px_x(x_norm: float) -> int:
-            # Mirror X if our rendered frame is mirrored
-            x_use = (1.0 - x_norm) if getattr(self, 'mirror_coordinates', False) else x_norm
-            return int(x_use * w)
-        def to_px_y(y_norm: float) -> int:
-            return int(y_norm * h)
-        thumb_tip = get(4)
-        index_tip = get(8)
-        middle_tip = get(12)
-        ring_tip = get(16)
-        pinky_tip = get(20)
-        wrist = get(0)
-        index_mcp = get(5)
-        # Pixel coords (with optional mirroring for X)
-        thumb_pos = (to_px_x(thumb_tip['x']), to_px_y(thumb_tip['y']))
-        index_pos = (to_px_x(index_tip['x']), to_px_y(index_tip['y']))
-        middle_pos = (to_px_x(middle_tip['x']), to_px_y(middle_tip['y']))
-        wrist_pos = (to_px_x(wrist['x']), to_px_y(wrist['y']))
-        palm_x = int(((1.0 - wrist['x'] if getattr(self, 'mirror_coordinates', False) else wrist['x']) + 
-                      (1.0 - index_mcp['x'] if getattr(self, 'mirror_coordinates', False) else index_mcp['x'])) * w / 2)
-        palm_y = int((wrist['y'] + index_mcp['y']) * h / 2)
-        palm_center = (palm_x, palm_y)
-        pinch_distance = math.sqrt((thumb_pos[0] - index_pos[0]) ** 2 + (thumb_pos[1] - index_pos[1]) ** 2)
-        pinch_center = ((thumb_pos[0] + index_pos[0]) // 2, (thumb_pos[1] + index_pos[1]) // 2)
-        # Bent heuristics
-        # Note: for bent checks, compare in normalized, but mirror X consistently if enabled
-        thumb_bent = ((1.0 - thumb_tip['x']) if getattr(self, 'mirror_coordinates', False) else thumb_tip['x']) < \
-                     ((1.0 - get(3)['x']) if getattr(self, 'mirror_coordinates', False) else get(3)['x'])
-        index_bent = index_tip['y'] > get(6)['y']
-        # Pinch heuristic
-        is_pinching = (pinch_distance < 60 and pinch_distance > 10 and (thumb_bent or index_bent or pinch_distance < 35))
-        if pinch_distance < 25:
-            is_pinching = True
-        gestures = self._detect_gestures_from_list(lm_list)
-        # Full pixel landmark list for drawing overlay
-        pixel_landmarks = [(to_px_x(get(i)['x']), to_px_y(get(i)['y'])) for i in range(21)]
-        info = {
-            'thumb_pos': thumb_pos,
-            'index_pos': index_pos,
-            'middle_pos': middle_pos,
-            'palm_center': palm_center,
-            'pinch_center': pinch_center,
-            'wrist_pos': wrist_pos,
-            'gestures': gestures,
-            'pinch_distance': pinch_distance,
-            'is_pinching': is_pinching,
-            'thumb_bent': thumb_bent,
-            'index_bent': index_bent,
+            'middle_pos': pixel_landmarks[12],
+            'palm_center': (palm_x, palm_y),
+            # Pinch center for better tracking
+            'pinch_center': ((thumb_pos[0] + index_pos[0]) // 2, (thumb_pos[1] + index_pos[1]) // 2),
+            'wrist_pos': pixel_landmarks[0],
+            'gestures': self._detect_gestures(ext_bits),
+            'pinch_distance': float(pinch_distance),
+            'is_pinching': bool(is_pinching),
+            'thumb_bent': bool(thumb_bent),
+            'index_bent': bool(index_bent),
             'pixel_landmarks': pixel_landmarks
         }
-        # Handedness mapping
-        if handedness:
-            label = handedness.lower()
+    
+    @staticmethod
+    def _set_handedness(info: dict, label: Optional[str], confidence: float) -> dict:
+        """Attach handedness fields to a hand info dict"""
+        if label:
+            label = label.lower()
             info['hand_label'] = label
-            info['hand_confidence'] = 1.0
+            info['hand_confidence'] = confidence
             info['hand_is_left'] = label == 'left'
             info['hand_is_right'] = label == 'right'
         else:
@@ -459,71 +762,10 @@ class HandGestureDetector:
             info['hand_is_right'] = False
         return info
     
-    def _detect_gestures(self, landmarks) -> List[str]:
-        """Detect specific hand gestures"""
-        gestures = []
-        
-        # Get finger tip and pip positions
-        fingertips = [4, 8, 12, 16, 20]  # thumb, index, middle, ring, pinky
-        pip_joints = [3, 6, 10, 14, 18]
-        
-        # Count extended fingers
-        extended_fingers = []
-        
-        # Thumb (special case - check x coordinate)
-        if landmarks.landmark[4].x > landmarks.landmark[3].x:
-            extended_fingers.append(True)
-        else:
-            extended_fingers.append(False)
-            
-        # Other fingers
-        for i in range(1, 5):
-            if landmarks.landmark[fingertips[i]].y < landmarks.landmark[pip_joints[i]].y:
-                extended_fingers.append(True)
-            else:
-                extended_fingers.append(False)
-        
-        extended_count = sum(extended_fingers)
-        
-        # Classify gestures
-        if extended_count == 0:
-            gestures.append("fist")
-        elif extended_count == 1 and extended_fingers[1]:  # Only index finger
-            gestures.append("pointing")
-        elif extended_count == 2 and extended_fingers[0] and extended_fingers[1]:  # Thumb + index
-            gestures.append("pinch")
-        elif extended_count == 5:
-            gestures.append("open_hand")
-        elif extended_count == 2 and extended_fingers[1] and extended_fingers[2]:  # Index + middle
-            gestures.append("peace")
-            
-        return gestures
-    
-    def _detect_gestures_from_list(self, lm_list: List[dict]) -> List[str]:
-        """Detect gestures given a list of normalized dicts."""
-        gestures = []
-        def y(i): 
-            return lm_list[i]['y'] if 0 <= i < len(lm_list) else 0.0
-        def x(i): 
-            return lm_list[i]['x'] if 0 <= i < len(lm_list) else 0.0
-        fingertips = [4, 8, 12, 16, 20]
-        pip_joints = [3, 6, 10, 14, 18]
-        extended_fingers = []
-        extended_fingers.append(x(4) > x(3))  # thumb
-        for i in range(1, 5):
-            extended_fingers.append(y(fingertips[i]) < y(pip_joints[i]))
-        extended_count = sum(1 for f in extended_fingers if f)
-        if extended_count == 0:
-            gestures.append("fist")
-        elif extended_count == 1 and extended_fingers[1]:
-            gestures.append("pointing")
-        elif extended_count == 2 and extended_fingers[0] and extended_fingers[1]:
-            gestures.append("pinch")
-        elif extended_count == 5:
-            gestures.append("open_hand")
-        elif extended_count == 2 and extended_fingers[1] and extended_fingers[2]:
-            gestures.append("peace")
-        return gestures
+    def _detect_gestures(self, ext_bits: int) -> List[str]:
+        """Detect specific hand gestures from the 5-bit extended-finger mask (bit 0 = thumb)"""
+        gesture = _GESTURE_LUT[ext_bits]
+        return [gesture] if gesture else []
     
     def draw_landmarks(self, frame: np.ndarray, hands_info: List[dict]) -> np.ndarray:
         """Draw hand landmarks on frame for both local (MediaPipe) and remote (normalized) inputs"""
@@ -554,6 +796,31 @@ class HandGestureDetector:
         return frame
 
 
+class GrabState3D:
+    """Per-hand 3D grab state; instances are recycled through a pool instead of reallocated per grab"""
+    __slots__ = ('object', 'initial_pinch_distance', 'initial_scale', 'initial_world_pos',
+                 'grab_offset_x', 'grab_offset_y', 'last_pinch_center', 'last_thumb_pos',
+                 'last_index_pos', 'movement_sensitivity', 'initial_rotation', 'rotation_sensitivity',
+                 'initial_two_hand_distance_sq')
+    
+    def reset(self, obj, pinch_distance: float, pinch_center, thumb_pos, index_pos, screen_pos):
+        """(Re)initialize this state for a fresh grab of obj"""
+        self.object = obj
+        self.initial_pinch_distance = pinch_distance
+        self.initial_scale = obj.scale
+        self.initial_world_pos = (obj.x, obj.y, obj.z)
+        self.grab_offset_x = pinch_center[0] - screen_pos[0] if screen_pos else 0
+        self.grab_offset_y = pinch_center[1] - screen_pos[1] if screen_pos else 0
+        self.last_pinch_center = pinch_center
+        self.last_thumb_pos = thumb_pos
+        self.last_index_pos = index_pos
+        self.movement_sensitivity = 0.015  # Controls how much screen movement affects 3D position (increased for better responsiveness)
+        self.initial_rotation = (obj.rotation_x, obj.rotation_y, obj.rotation_z)
+        self.rotation_sensitivity = 0.01  # Controls rotation sensitivity
+        self.initial_two_hand_distance_sq = None  # Set when a two-hand scale starts
+        return self
+
+
 class ARHandController:
     """Main AR application for hand-controlled object manipulation"""
     
@@ -563,22 +830,56 @@ class ARHandController:
         # Make detector aware of controller for AR video track frames
         setattr(self.detector, '_controller_ref', self)
         
-        # Virtual objects
-        self.objects: List[VirtualObject] = []
+        # Verbose per-event logging (rotation mode enter/exit); off by default
+        self.debug = os.environ.get("AR_DEBUG", "0") in ("1", "true", "True")
+        # Opt-in OpenCL (Transparent API) for the final overlay pass; only pays off on
+        # GPUs where the upload/download is cheaper than the CPU-side drawing
+        self.use_opencl = (os.environ.get("AR_OPENCL", "0") in ("1", "true", "True")
+                           and cv2.ocl.haveOpenCL())
+        cv2.ocl.setUseOpenCL(self.use_opencl)
+        
+        # Virtual objects; VirtualObject(..., store=self.object_store) registers itself in self.objects
+        self.object_store = ObjectStore()
+        self.objects: List[VirtualObject] = self.object_store.objects
         
         # Test mode for JARVIS without camera
         self.test_mode = False
         self.jarvis_activated = False
+        self._test_bgs = None  # (idle, active) pre-rendered test backgrounds
+        self._test_frame = None
+        self._screenshot_q = queue.Queue(maxsize=1)  # latest pending JARVIS screenshot
+        self._screenshot_thread = None
+        
+        # JARVIS status strings rasterized once: (image, alpha, origin) blended on each 'j' press
+        self._overlay_jarvis_on = self._render_text_overlay(
+            "JARVIS ACTIVATED - Voice Assistant Ready", 0.7, (0, 255, 0))
+        self._overlay_screenshot = self._render_text_overlay(
+            "Screenshot saved for analysis", 0.5, (0, 255, 255))
+        self._overlay_jarvis_off = self._render_text_overlay(
+            "JARVIS DEACTIVATED", 0.7, (0, 0, 255))
+        # Rotation-indicator labels pre-rendered on their black box
+        self._rotation_label_overlays = {
+            text: self._render_boxed_text_overlay(text, 0.6, (0, 255, 255))
+            for text in _AXIS_LABEL_SIZES}
         
         # Interaction state
-        self.grab_states = {}  # hand_idx -> {object, initial_pinch_distance, initial_size}
-        self.grab_states_3d = {}  # hand_idx -> {object, initial_pinch_distance, initial_size, last_hand_pos}
+        # Per-hand state is indexed by hand_idx; None = no state for that hand
+        self.grab_states = [None] * MAX_HANDS  # {object, initial_pinch_distance, initial_size}
+        self.grab_states_3d = [None] * MAX_HANDS  # GrabState3D per hand
+        self._grab_state_pool = [GrabState3D() for _ in range(MAX_HANDS)]
         self.last_frame_time = time.time()
         self._latest_frame = None
         self._frame_lock = threading.Lock()
         
         # Pinch state tracking for hysteresis
-        self.pinch_states = {}  # hand_idx -> {'was_pinching': bool, 'pinch_frames': int}
+        self.pinch_states = [None] * MAX_HANDS  # {'was_pinching': bool, 'pinch_frames': int}
+        self._hands_by_idx = {}  # hand_idx -> hand_info for the current frame
+        self._pinching_set = set()  # hand indices pinching in the current frame
+        # Broad phase for 3D grabs: (cell -> object rows, screen_pos, radii); None = stale
+        self._grab_grid = None
+        # Per-hand status line state -> (text, color), kept in LRU order
+        self._status_cache = OrderedDict()
+        self._status_cache_max = 32
         
         # Selection system tracking (two-hand selection)
         self.selection_mode_objects = set()  # Set of objects currently in selection mode (grabbed by 2 hands)
@@ -589,13 +890,32 @@ class ARHandController:
         self.show_2d_objects = False
 
         self._create_initial_objects()
+        
+        # Keyboard dispatch: key code -> handler(frame)
+        self._key_handlers = {
+            K_QUIT: self._on_quit,
+            K_RESET: self._on_reset_objects,
+            K_ADD_OBJECT: self._on_add_object,
+            K_TOGGLE_2D: self._on_toggle_2d,
+            K_TOGGLE_3D: self._on_toggle_3d,
+            K_TOGGLE_RENDER: self._on_toggle_render_mode,
+            K_TOGGLE_ROTATE: self._on_toggle_auto_rotation,
+            K_RESET_X: self._on_reset_rotation_x,
+            K_RESET_Y: self._on_reset_rotation_y,
+            K_RESET_Z: self._on_reset_rotation_z,
+            K_JARVIS: self._on_toggle_jarvis,
+            K_CYCLE_3D: self._on_cycle_3d,
+            K_CYCLE_2D: self._on_cycle_2d,
+        }
 
             
     def _create_initial_objects(self):
         """Create initial virtual objects"""
         
-        # 3D objects
-        self.objects_3d = []
+        # 3D objects; VirtualObject3D(..., scene=self.scene_3d) registers itself in self.objects_3d
+        self.scene_3d = Scene()
+        self.objects_3d: List[VirtualObject3D] = self.scene_3d.objects
+        self._rotation_mode_objs = set()  # 3D objects currently in rotation mode
         
         # Load multiple CAD components for testing
         cad_models = [
@@ -617,12 +937,12 @@ class ARHandController:
                     y=model_info["position"][1], 
                     z=model_info["position"][2],
                     scale=model_info["scale"], 
-                    color=model_info["color"]
+                    color=model_info["color"],
+                    scene=self.scene_3d
                 )
                 obj_3d.set_render_mode("solid")
                 # Set different auto-rotation speeds for variety
-                obj_3d.auto_rotation_speed = 0.01 + len(self.objects_3d) * 0.005
-                self.objects_3d.append(obj_3d)
+                obj_3d.auto_rotation_speed = 0.01 + (len(self.objects_3d) - 1) * 0.005
                 print(f"✅ Loaded {model_info['name']} from {model_info['path']}")
             else:
                 print(f"⚠️  {model_info['name']} not found at {model_path}")
@@ -705,8 +1025,8 @@ class ARHandController:
             
         self._cleanup()
     
-    def _create_test_frame(self):
-        """Create a synthetic frame for testing JARVIS without camera"""
+    def _render_test_background(self, jarvis_active: bool) -> np.ndarray:
+        """Render the static text of the synthetic test frame"""
         # Create a black frame with 3D objects rendered
         frame = np.zeros((720, 1280, 3), dtype=np.uint8)
         
@@ -714,7 +1034,7 @@ class ARHandController:
         cv2.putText(frame, "AR Hand Control - JARVIS Test Mode", 
                    (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
         
-        if self.jarvis_activated:
+        if jarvis_active:
             cv2.putText(frame, "JARVIS ACTIVE - Voice Assistant Ready", 
                        (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
             cv2.putText(frame, "Say 'What is this?' to analyze 3D objects", 
@@ -728,17 +1048,80 @@ class ARHandController:
         
         return frame
     
+    def _create_test_frame(self):
+        """Create a synthetic frame for testing JARVIS without camera"""
+        # Both backgrounds (JARVIS idle / active) are rendered once; each frame just copies
+        # one into a reused buffer, since the frame is flipped and drawn on in place
+        if self._test_bgs is None:
+            self._test_bgs = (self._render_test_background(False), self._render_test_background(True))
+            self._test_frame = np.empty_like(self._test_bgs[0])
+        np.copyto(self._test_frame, self._test_bgs[bool(self.jarvis_activated)])
+        return self._test_frame
+    
     def save_screenshot_for_jarvis(self, frame):
-        """Save current frame as screenshot for JARVIS analysis"""
+        """Queue the current frame to be saved as a screenshot for JARVIS analysis.
+
+        Encoding happens on a background worker so the camera loop never waits on it;
+        if a previous screenshot is still pending, it is replaced by this one.
+        """
+        screenshot_path = "jarvis_screenshot.jpg"
         try:
-            screenshot_path = "jarvis_screenshot.png"
-            cv2.imwrite(screenshot_path, frame)
-            print(f"📸 Screenshot saved for JARVIS analysis: {screenshot_path}")
+            if self._screenshot_thread is None:
+                self._screenshot_thread = threading.Thread(target=self._screenshot_worker, daemon=True)
+                self._screenshot_thread.start()
+            try:
+                self._screenshot_q.get_nowait()  # drop the stale pending frame
+            except queue.Empty:
+                pass
+            self._screenshot_q.put_nowait((screenshot_path, frame.copy()))
             return screenshot_path
         except Exception as e:
             print(f"❌ Failed to save screenshot: {e}")
             return None
     
+    def _screenshot_worker(self):
+        """Write queued screenshots to disk off the render thread"""
+        while True:
+            screenshot_path, frame = self._screenshot_q.get()
+            try:
+                # JPEG encodes several times faster than PNG and is plenty for vision analysis
+                cv2.imwrite(screenshot_path, frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                print(f"📸 Screenshot saved for JARVIS analysis: {screenshot_path}")
+            except Exception as e:
+                print(f"❌ Failed to save screenshot: {e}")
+    
+    def _project_3d_centers(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Project every 3D object's center to the screen in a single batch.
+
+        Returns (screen_pos (K,2), hit_radius (K,), valid (K,)) where valid is False for
+        objects behind the camera or without geometry.
+        """
+        objs = self.objects_3d
+        renderer = self.renderer_3d
+        scene = self.scene_3d
+        screen_pos, valid = scene.project_centers(renderer)
+        
+        # Hand the results to the objects so their own hit tests and overlays reuse them
+        centers = scene.pos[:len(objs)].tolist()
+        for o, center, pos, ok in zip(objs, centers, screen_pos.tolist(), valid.tolist()):
+            o.cache_screen_position(renderer, center, tuple(pos) if ok else None)
+        
+        radii = scene.hit_radii()
+        valid &= np.array([len(o.vertices) > 0 for o in objs], dtype=bool)
+        return screen_pos, radii, valid
+    
+    def _rebuild_grab_grid(self):
+        """Bin each 3D object's projected hit circle into GRAB_GRID_CELL screen cells"""
+        screen_pos, radii, valid = self._project_3d_centers()
+        cells = defaultdict(list)
+        for k in np.flatnonzero(valid):
+            x, y, r = screen_pos[k, 0], screen_pos[k, 1], radii[k]
+            # Rows are appended in object order, so each cell lists candidates in grab priority
+            for cx in range(int((x - r) // GRAB_GRID_CELL), int((x + r) // GRAB_GRID_CELL) + 1):
+                for cy in range(int((y - r) // GRAB_GRID_CELL), int((y + r) // GRAB_GRID_CELL) + 1):
+                    cells[(cx, cy)].append(k)
+        self._grab_grid = (cells, screen_pos, radii)
+    
     def _process_frame(self):
         """Process a single frame"""
         if self.test_mode or self.cap is None:
@@ -751,18 +1134,17 @@ class ARHandController:
                 self.is_running = False
                 return
         
-        # Flip frame horizontally for mirror effect
-        frame = cv2.flip(frame, 1)
+        # Flip frame horizontally for mirror effect, in place: the captured buffer is ours,
+        # and a strided frame[:, ::-1] view can't be drawn on by OpenCV without a full copy
+        frame = cv2.flip(frame, 1, dst=frame)
         
         # Detect hands
-        hands_info = self.detector.detect_hands(frame)
+        self._frame_wh = (frame.shape[1], frame.shape[0])
+        hands_info = self.detector.detect_hands(frame, self._frame_wh)
         
         # Process interactions
         self._process_interactions(hands_info)
         
-        # Store hands_info for scaling calculations
-        self.current_hands_info = hands_info
-        
         # Draw 2D objects
         if self.show_2d_objects:
             for obj in self.objects:
@@ -777,21 +1159,24 @@ class ARHandController:
                 else:
                     obj_3d.selected = None  # Hide radius for objects beyond the first two
                 frame = obj_3d.draw(frame, self.renderer_3d)
-                
-                # Draw targeting indicator for 3D objects when pinching near them
-                for hand_info in hands_info:
-                    if (hand_info['is_pinching'] and 
-                        not obj_3d.is_grabbed and 
-                        obj_3d.is_point_inside(hand_info['pinch_center'][0], hand_info['pinch_center'][1], self.renderer_3d)):
+            
+            # Draw targeting indicator for 3D objects when pinching near them.
+            # All object centers are projected in one batch, then each pinching hand is
+            # hit-tested against every object at once.
+            pinch_points = [h['pinch_center'] for h in hands_info if h['is_pinching']]
+            if pinch_points and self.objects_3d:
+                screen_pos, radii, valid = self._project_3d_centers()
+                valid &= np.array([not o.is_grabbed for o in self.objects_3d], dtype=bool)
+                for pinch in pinch_points:
+                    d2 = ((screen_pos - np.asarray(pinch, dtype=np.float64)) ** 2).sum(axis=1)
+                    for k in np.flatnonzero(valid & (d2 <= radii * radii)):
+                        target = (int(screen_pos[k, 0]), int(screen_pos[k, 1]))
+                        # Draw targeting circle
+                        cv2.circle(frame, target, 60, (255, 255, 0), 3)
+                        cv2.circle(frame, target, 40, (255, 255, 0), 2)
                         
-                        screen_pos = obj_3d.get_screen_position(self.renderer_3d)
-                        if screen_pos:
-                            # Draw targeting circle
-                            cv2.circle(frame, (int(screen_pos[0]), int(screen_pos[1])), 60, (255, 255, 0), 3)
-                            cv2.circle(frame, (int(screen_pos[0]), int(screen_pos[1])), 40, (255, 255, 0), 2)
-                            
-                            # Draw line from pinch center to object center
-                            cv2.line(frame, hand_info['pinch_center'], (int(screen_pos[0]), int(screen_pos[1])), (255, 255, 0), 2)
+                        # Draw line from pinch center to object center
+                        cv2.line(frame, pinch, target, (255, 255, 0), 2)
             
         # Draw hand landmarks
         frame = self.detector.draw_landmarks(frame, hands_info)
@@ -799,8 +1184,11 @@ class ARHandController:
         # Draw UI
         frame = self._draw_ui(frame, hands_info)
         
-        # Draw rotation hand indicators
-        frame = self._draw_rotation_hand_indicators(frame, hands_info)
+        # Draw rotation hand indicators (on a UMat the labels fall back to OpenCV drawing)
+        if self.use_opencl and self._rotation_mode_objs:
+            frame = self._draw_rotation_hand_indicators(cv2.UMat(frame), hands_info).get()
+        else:
+            frame = self._draw_rotation_hand_indicators(frame, hands_info)
         
         # store latest frame for WebRTC track
         try:
@@ -814,115 +1202,157 @@ class ARHandController:
         
         # Handle keyboard input
         key = cv2.waitKey(1) & 0xFF
-        if key == ord('q'):
-            self.is_running = False
-        elif key == ord('r'):
-            self._create_initial_objects()
-            self.grab_states.clear()
-            self.grab_states_3d.clear()
-        elif key == ord('c'):
-            self._add_random_object()
-        elif key == ord('1'):
-            self.show_2d_objects = not self.show_2d_objects
-            print(f"2D objects: {'ON' if self.show_2d_objects else 'OFF'}")
-        elif key == ord('2'):
-            self.show_3d_objects = not self.show_3d_objects
-            print(f"3D objects: {'ON' if self.show_3d_objects else 'OFF'}")
-        elif key == ord('w'):
-            # Toggle wireframe/solid for 3D objects
-            for obj_3d in self.objects_3d:
-                if obj_3d.render_mode == "solid":
-                    obj_3d.set_render_mode("wireframe")
-                else:
-                    obj_3d.set_render_mode("solid")
-            print(f"3D render mode: {self.objects_3d[0].render_mode if self.objects_3d else 'N/A'}")
-        elif key == ord('t'):
-            # Toggle auto-rotation for 3D objects
-            for obj_3d in self.objects_3d:
-                obj_3d.toggle_auto_rotation()
-            auto_rotate_status = self.objects_3d[0].auto_rotate if self.objects_3d else False
-            print(f"Auto-rotation: {'ON' if auto_rotate_status else 'OFF'}")
-        elif key == ord('x'):
-            # Reset X-axis rotation for all 3D objects
-            for obj_3d in self.objects_3d:
-                obj_3d.rotation_x = 0.0
-            print("Reset X-axis rotation")
-        elif key == ord('y'):
-            # Reset Y-axis rotation for all 3D objects
-            for obj_3d in self.objects_3d:
-                obj_3d.rotation_y = 0.0
-            print("Reset Y-axis rotation")
-        elif key == ord('z'):
-            # Reset Z-axis rotation for all 3D objects
-            for obj_3d in self.objects_3d:
-                obj_3d.rotation_z = 0.0
-            print("Reset Z-axis rotation")
-        elif key == ord('j'):
-            # Activate JARVIS voice assistant
-            print("🤖 Activating JARVIS voice assistant...")
-            self.jarvis_activated = not self.jarvis_activated
-            if self.jarvis_activated:
-                print("✅ JARVIS activated - Voice assistant ready")
-                print("🗣️  Say 'What is this?' to analyze the 3D objects")
-                print("📸 JARVIS will take a screenshot and analyze what you're looking at")
-                
-                # Save screenshot for JARVIS analysis
-                screenshot_path = self.save_screenshot_for_jarvis(frame)
-                if screenshot_path:
-                    print("🧠 Screenshot ready for JARVIS vision analysis")
-                    print("💡 Open the web interface and activate JARVIS to analyze this image")
-                
-                cv2.putText(frame, "JARVIS ACTIVATED - Voice Assistant Ready", 
-                           (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-                cv2.putText(frame, "Screenshot saved for analysis", 
-                           (50, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 2)
-            else:
-                print("🤖 JARVIS deactivated")
-                cv2.putText(frame, "JARVIS DEACTIVATED", 
-                           (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-        elif key == ord(' '):  # Spacebar
-            # Cycle through 3D objects (select next one)
-            if self.objects_3d:
-                # Find currently selected object or start with first
-                current_selected = -1
-                for i, obj_3d in enumerate(self.objects_3d):
-                    if obj_3d.selected and not obj_3d.is_grabbed:  # Don't cycle away from grabbed objects
-                        current_selected = i
-                        obj_3d.selected = False
-                        break
-                
-                # Select next object (skip grabbed objects)
-                next_index = (current_selected + 1) % len(self.objects_3d)
-                attempts = 0
-                while self.objects_3d[next_index].is_grabbed and attempts < len(self.objects_3d):
-                    next_index = (next_index + 1) % len(self.objects_3d)
-                    attempts += 1
-                
-                self.objects_3d[next_index].selected = True
-                print(f"Selected 3D object {next_index + 1}/{len(self.objects_3d)}")
-        elif key == ord('s'):  # 'S' key for cycling 2D objects
-            # Cycle through 2D objects (select next one)
-            if self.objects:
-                # Find currently selected object or start with first
-                current_selected = -1
-                for i, obj in enumerate(self.objects):
-                    if obj.selected and not obj.is_grabbed:  # Don't cycle away from grabbed objects
-                        current_selected = i
-                        obj.selected = False
-                        break
-                
-                # Select next object (skip grabbed objects)
-                next_index = (current_selected + 1) % len(self.objects)
-                attempts = 0
-                while self.objects[next_index].is_grabbed and attempts < len(self.objects):
-                    next_index = (next_index + 1) % len(self.objects)
-                    attempts += 1
-                
-                self.objects[next_index].selected = True
-                print(f"Selected 2D object {next_index + 1}/{len(self.objects)}")
+        handler = self._key_handlers.get(key)
+        if handler is not None:
+            handler(frame)
+    
+    def _on_quit(self, frame):
+        self.is_running = False
+    
+    def _on_reset_objects(self, frame):
+        self._create_initial_objects()
+        self.grab_states = [None] * MAX_HANDS
+        self._free_grab_states_3d()
+    
+    def _on_add_object(self, frame):
+        self._add_random_object()
+    
+    def _on_toggle_2d(self, frame):
+        self.show_2d_objects = not self.show_2d_objects
+        print(_2D_MSG[self.show_2d_objects])
+    
+    def _on_toggle_3d(self, frame):
+        self.show_3d_objects = not self.show_3d_objects
+        print(_3D_MSG[self.show_3d_objects])
+    
+    def _on_toggle_render_mode(self, frame):
+        # Toggle wireframe/solid for 3D objects (anything not solid goes back to solid)
+        modes = self.scene_3d.render_mode[:len(self.scene_3d)]
+        modes[modes > RenderMode.WIREFRAME] = RenderMode.WIREFRAME
+        np.bitwise_xor(modes, 1, out=modes)
+        print(f"3D render mode: {self.objects_3d[0].render_mode if self.objects_3d else 'N/A'}")
+    
+    def _on_toggle_auto_rotation(self, frame):
+        # Toggle auto-rotation for 3D objects
+        for obj_3d in self.objects_3d:
+            obj_3d.toggle_auto_rotation()
+        auto_rotate_status = self.objects_3d[0].auto_rotate if self.objects_3d else False
+        print(_AUTO_MSG[bool(auto_rotate_status)])
+    
+    def _on_reset_rotation_x(self, frame):
+        # Reset X-axis rotation for all 3D objects
+        self.scene_3d.rot[:, 0] = 0.0
+        print("Reset X-axis rotation")
+    
+    def _on_reset_rotation_y(self, frame):
+        # Reset Y-axis rotation for all 3D objects
+        self.scene_3d.rot[:, 1] = 0.0
+        print("Reset Y-axis rotation")
+    
+    def _on_reset_rotation_z(self, frame):
+        # Reset Z-axis rotation for all 3D objects
+        self.scene_3d.rot[:, 2] = 0.0
+        print("Reset Z-axis rotation")
+    
+    def _on_toggle_jarvis(self, frame):
+        # Activate JARVIS voice assistant
+        print("🤖 Activating JARVIS voice assistant...")
+        self.jarvis_activated = not self.jarvis_activated
+        if self.jarvis_activated:
+            print("✅ JARVIS activated - Voice assistant ready")
+            print("🗣️  Say 'What is this?' to analyze the 3D objects")
+            print("📸 JARVIS will take a screenshot and analyze what you're looking at")
+            
+            # Save screenshot for JARVIS analysis
+            screenshot_path = self.save_screenshot_for_jarvis(frame)
+            if screenshot_path:
+                print("🧠 Screenshot ready for JARVIS vision analysis")
+                print("💡 Open the web interface and activate JARVIS to analyze this image")
+            
+            self._blit_overlay(frame, self._overlay_jarvis_on, 50, 50)
+            self._blit_overlay(frame, self._overlay_screenshot, 50, 80)
+        else:
+            print("🤖 JARVIS deactivated")
+            self._blit_overlay(frame, self._overlay_jarvis_off, 50, 50)
+    
+    @staticmethod
+    def _render_text_overlay(text: str, font_scale: float, color: Tuple[int, int, int],
+                             thickness: int = 2):
+        """Rasterize text once; returns (image, alpha, origin) for _blit_overlay"""
+        (w, h), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
+        # Pad by the stroke thickness so glyph edges aren't clipped
+        pad = thickness
+        alpha = np.zeros((h + baseline + 2 * pad, w + 2 * pad), dtype=np.uint8)
+        cv2.putText(alpha, text, (pad, pad + h), cv2.FONT_HERSHEY_SIMPLEX, font_scale, 255, thickness)
+        img = np.empty(alpha.shape + (3,), dtype=np.uint8)
+        img[:] = color
+        return img, alpha[:, :, None], (pad, pad + h)
+    
+    @staticmethod
+    def _render_boxed_text_overlay(text: str, font_scale: float, color: Tuple[int, int, int],
+                                   thickness: int = 2, box_pad: int = 5):
+        """Rasterize text on an opaque black box extending box_pad px around it (alpha None = opaque)"""
+        (w, h), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
+        img = np.zeros((h + 2 * box_pad + 1, w + 2 * box_pad + 1, 3), dtype=np.uint8)
+        cv2.putText(img, text, (box_pad, box_pad + h), cv2.FONT_HERSHEY_SIMPLEX, font_scale, color, thickness)
+        return img, None, (box_pad, box_pad + h)
+    
+    @staticmethod
+    def _blit_overlay(frame: np.ndarray, overlay, x: int, y: int):
+        """Blend a pre-rendered text overlay so its baseline origin lands at (x, y), like putText"""
+        img, alpha, (ox, oy) = overlay
+        top, left = y - oy, x - ox
+        fh, fw = frame.shape[:2]
+        # Clip to the frame
+        y0, x0 = max(top, 0), max(left, 0)
+        y1, x1 = min(top + img.shape[0], fh), min(left + img.shape[1], fw)
+        if y0 >= y1 or x0 >= x1:
+            return
+        roi = frame[y0:y1, x0:x1]
+        if alpha is None:
+            # Opaque overlay: a plain copy
+            roi[:] = img[y0 - top:y1 - top, x0 - left:x1 - left]
+            return
+        a = alpha[y0 - top:y1 - top, x0 - left:x1 - left].astype(np.uint16)
+        fg = img[y0 - top:y1 - top, x0 - left:x1 - left]
+        # Blend by glyph coverage so anti-aliased edges match putText; background stays untouched
+        blended = (roi * (255 - a) + fg * a + 127) // 255
+        np.copyto(roi, blended, where=a > 0, casting='unsafe')
+    
+    def _on_cycle_3d(self, frame):
+        # Cycle through 3D objects (select next one)
+        self._cycle_selection(self.objects_3d, "3D")
+    
+    def _on_cycle_2d(self, frame):
+        # Cycle through 2D objects (select next one)
+        self._cycle_selection(self.objects, "2D")
+    
+    def _cycle_selection(self, objects: list, label: str):
+        """Move the selection to the next object that isn't grabbed"""
+        # Grabbed objects are never cycled to (or away from)
+        candidates = [i for i, obj in enumerate(objects) if not obj.is_grabbed]
+        n_candidates = len(candidates)
+        if not n_candidates:
+            return
+        
+        # Find currently selected object or start with first
+        current_selected = next((i for i in candidates if objects[i].selected), -1)
+        if current_selected >= 0:
+            objects[current_selected].selected = False
+        
+        next_index = candidates[bisect.bisect_right(candidates, current_selected) % n_candidates]
+        objects[next_index].selected = True
+        print(f"Selected {label} object {next_index + 1}/{len(objects)}")
     
     def _process_interactions(self, hands_info: List[dict]):
         """Process hand interactions with objects"""
+        # Per-hand state arrays hold MAX_HANDS slots; extra hands are not interactive
+        if any(h['hand_idx'] >= MAX_HANDS for h in hands_info):
+            hands_info = [h for h in hands_info if h['hand_idx'] < MAX_HANDS]
+        # Per-frame hand lookups shared by every interaction helper below
+        self._hands_by_idx = {h['hand_idx']: h for h in hands_info}
+        self._pinching_set = {h['hand_idx'] for h in hands_info if h['is_pinching']}
+        self._grab_grid = None  # objects may have moved since last frame
         current_grabs = set()
         current_grabs_3d = set()
         
@@ -931,7 +1361,7 @@ class ARHandController:
             is_pinching = hand_info['is_pinching']
             
             # Initialize pinch state if not exists
-            if hand_idx not in self.pinch_states:
+            if self.pinch_states[hand_idx] is None:
                 self.pinch_states[hand_idx] = {'was_pinching': False, 'pinch_frames': 0}
             
             pinch_state = self.pinch_states[hand_idx]
@@ -959,82 +1389,44 @@ class ARHandController:
             
             else:
                 # Release any grabbed 2D object
-                if hand_idx in self.grab_states:
-                    obj = self.grab_states[hand_idx]['object']
-                    # Remove this hand from the grabbed_by_hand list
-                    if hand_idx in obj.grabbed_by_hand:
-                        obj.grabbed_by_hand.remove(hand_idx)
-                    # Update grab state based on remaining hands
-                    obj.is_grabbed = len(obj.grabbed_by_hand)
+                if self.grab_states[hand_idx] is not None:
+                    obj = self._release_grab(self.grab_states, hand_idx, 'initial_size')
                     # Deselect object when completely released
                     if obj.is_grabbed == 0:
                         obj.selected = False
-                    
-                    # Reset scaling state if transitioning from two-hand to one-hand or no hands
-                    if obj.is_grabbed < 2:
-                        # Clear two-hand scaling state from all hands grabbing this object
-                        for other_hand_idx in obj.grabbed_by_hand:
-                            if other_hand_idx in self.grab_states:
-                                other_hand_state = self.grab_states[other_hand_idx]
-                                if 'initial_two_hand_distance' in other_hand_state:
-                                    del other_hand_state['initial_two_hand_distance']
-                                if 'initial_size' in other_hand_state:
-                                    del other_hand_state['initial_size']
-                    
-                    del self.grab_states[hand_idx]
                 
                 # Release any grabbed 3D object
-                if hand_idx in self.grab_states_3d:
-                    obj_3d = self.grab_states_3d[hand_idx]['object']
+                if self.grab_states_3d[hand_idx] is not None:
                     grab_state = self.grab_states_3d[hand_idx]
+                    obj_3d = grab_state.object
                     
                     # Check if this release would create a rotation mode opportunity
                     # (transitioning from 2-hand to 1-hand grab)
-                    if obj_3d.is_grabbed == 2 and len(obj_3d.grabbed_by_hand) == 2:
+                    if obj_3d.is_grabbed == 2 and obj_3d.grabbed_by_hand_mask.bit_count() == 2:
                         # This is a 2-hand grab, check if we should enter rotation mode
-                        other_hand_idx = None
-                        for other_hand in obj_3d.grabbed_by_hand:
-                            if other_hand != hand_idx:
-                                other_hand_idx = other_hand
-                                break
+                        other_hands = _MASK_HANDS[obj_3d.grabbed_by_hand_mask & ~(1 << hand_idx)]
+                        other_hand_idx = other_hands[0] if other_hands else None
                         
                         if other_hand_idx is not None:
                             # Check if the other hand is still pinching
-                            other_hand_pinching = any(hand['hand_idx'] == other_hand_idx and hand['is_pinching'] for hand in hands_info)
+                            other_hand_pinching = other_hand_idx in self._pinching_set
                             
                             if other_hand_pinching:
                                 # Other hand is still pinching - enter rotation mode with released hand
-                                obj_3d.is_in_rotation_mode = True
-                                obj_3d.rotation_hand_idx = hand_idx
-                                
-                                # Get initial position of rotation hand
-                                rotation_hand_info = next((hand for hand in hands_info if hand['hand_idx'] == hand_idx), None)
-                                if rotation_hand_info:
-                                    obj_3d.last_rotation_hand_pos = rotation_hand_info['palm_center']
-                                self._update_rotation_axis_from_hand(obj_3d, hands_info)
+                                self._enter_rotation_mode(obj_3d, hand_idx, hands_info)
                                 
-                                print(f"Object entered rotation mode - Hand {hand_idx} controlling rotation")
-                                
-                                # Remove this hand from grabbed_by_hand but keep it in grab_states_3d for rotation tracking
-                                if hand_idx in obj_3d.grabbed_by_hand:
-                                    obj_3d.grabbed_by_hand.remove(hand_idx)
-                                obj_3d.is_grabbed = len(obj_3d.grabbed_by_hand)
+                                # Remove this hand from the grab mask but keep it in grab_states_3d for rotation tracking
+                                obj_3d.grabbed_by_hand_mask &= ~(1 << hand_idx)
+                                obj_3d.is_grabbed = obj_3d.grabbed_by_hand_mask.bit_count()
                                 
                                 # Clear scaling state
-                                if 'initial_two_hand_distance' in grab_state:
-                                    del grab_state['initial_two_hand_distance']
-                                if 'initial_scale' in grab_state:
-                                    del grab_state['initial_scale']
+                                grab_state.initial_two_hand_distance_sq = None
                                 
                                 # Don't delete from grab_states_3d - keep for rotation tracking
                                 continue
                     
                     # Normal release logic (not transitioning to rotation mode)
-                    # Remove this hand from the grabbed_by_hand list
-                    if hand_idx in obj_3d.grabbed_by_hand:
-                        obj_3d.grabbed_by_hand.remove(hand_idx)
-                    # Update grab state based on remaining hands
-                    obj_3d.is_grabbed = len(obj_3d.grabbed_by_hand)
+                    self._release_grab(self.grab_states_3d, hand_idx, 'initial_scale')
                     
                     # Handle rotation mode exit if this hand was controlling rotation
                     if obj_3d.is_in_rotation_mode and obj_3d.rotation_hand_idx == hand_idx:
@@ -1044,138 +1436,112 @@ class ARHandController:
                     if obj_3d.is_grabbed == 0:
                         obj_3d.selected = False
                         obj_3d.is_in_rotation_mode = False
+                        self._rotation_mode_objs.discard(obj_3d)
                         obj_3d.rotation_hand_idx = None
                         obj_3d.last_rotation_hand_pos = None
-                    
-                    # Reset scaling state if transitioning from two-hand to one-hand or no hands
-                    if obj_3d.is_grabbed < 2:
-                        # Clear two-hand scaling state from all hands grabbing this object
-                        for other_hand_idx in obj_3d.grabbed_by_hand:
-                            if other_hand_idx in self.grab_states_3d:
-                                other_hand_state = self.grab_states_3d[other_hand_idx]
-                                if 'initial_two_hand_distance' in other_hand_state:
-                                    del other_hand_state['initial_two_hand_distance']
-                                if 'initial_scale' in other_hand_state:
-                                    del other_hand_state['initial_scale']
-                    
-                    # Only delete if the hand is still in grab_states_3d (might have been removed by rotation mode logic)
-                    if hand_idx in self.grab_states_3d:
-                        del self.grab_states_3d[hand_idx]
-        
         
         # Clean up grab states for hands that are no longer detected
-        hands_to_remove = []
-        for hand_idx in self.grab_states:
-            if hand_idx not in current_grabs:
-                obj = self.grab_states[hand_idx]['object']
-                # Remove this hand from the grabbed_by_hand list
-                if hand_idx in obj.grabbed_by_hand:
-                    obj.grabbed_by_hand.remove(hand_idx)
-                # Update grab state based on remaining hands
-                obj.is_grabbed = len(obj.grabbed_by_hand)
-                
-                # Reset scaling state if transitioning from two-hand to one-hand or no hands
-                if obj.is_grabbed < 2:
-                    # Clear two-hand scaling state from all hands grabbing this object
-                    for other_hand_idx in obj.grabbed_by_hand:
-                        if other_hand_idx in self.grab_states:
-                            other_hand_state = self.grab_states[other_hand_idx]
-                            if 'initial_two_hand_distance' in other_hand_state:
-                                del other_hand_state['initial_two_hand_distance']
-                            if 'initial_size' in other_hand_state:
-                                del other_hand_state['initial_size']
-                
-                hands_to_remove.append(hand_idx)
-        
-        for hand_idx in hands_to_remove:
-            del self.grab_states[hand_idx]
+        for hand_idx in self._cleanup_grabs(self.grab_states, current_grabs, 'initial_size'):
             # Also clean up pinch state
-            if hand_idx in self.pinch_states:
-                del self.pinch_states[hand_idx]
-        
-        # Clean up 3D grab states
-        hands_to_remove_3d = []
-        for hand_idx in self.grab_states_3d:
-            if hand_idx not in current_grabs_3d:
-                obj_3d = self.grab_states_3d[hand_idx]['object']
-                # Remove this hand from the grabbed_by_hand list
-                if hand_idx in obj_3d.grabbed_by_hand:
-                    obj_3d.grabbed_by_hand.remove(hand_idx)
-                # Update grab state based on remaining hands
-                obj_3d.is_grabbed = len(obj_3d.grabbed_by_hand)
-                
-                # Reset scaling state if transitioning from two-hand to one-hand or no hands
-                if obj_3d.is_grabbed < 2:
-                    # Clear two-hand scaling state from all hands grabbing this object
-                    for other_hand_idx in obj_3d.grabbed_by_hand:
-                        if other_hand_idx in self.grab_states_3d:
-                            other_hand_state = self.grab_states_3d[other_hand_idx]
-                            if 'initial_two_hand_distance' in other_hand_state:
-                                del other_hand_state['initial_two_hand_distance']
-                            if 'initial_scale' in other_hand_state:
-                                del other_hand_state['initial_scale']
-                
-                hands_to_remove_3d.append(hand_idx)
-        
-        for hand_idx in hands_to_remove_3d:
-            del self.grab_states_3d[hand_idx]
+            self.pinch_states[hand_idx] = None
+        self._cleanup_grabs(self.grab_states_3d, current_grabs_3d, 'initial_scale')
         
         # Handle selection mode interactions for 3D objects
         if self.show_3d_objects:
             self._handle_selection_mode_3d(hands_info)
         
         # Clean up rotation mode for objects that are no longer grabbed
-        for obj_3d in self.objects_3d:
-            if obj_3d.is_in_rotation_mode and obj_3d.is_grabbed == 0:
+        # or whose rotation hand is no longer detected
+        for obj_3d in list(self._rotation_mode_objs):
+            if obj_3d.is_grabbed == 0:
+                self._exit_rotation_mode(obj_3d)
+        for obj_3d in list(self._rotation_mode_objs):
+            hand = obj_3d.rotation_hand_idx
+            if hand is not None and hand not in self._hands_by_idx:
                 self._exit_rotation_mode(obj_3d)
-        
-        # Clean up rotation mode for hands that are no longer detected
-        for obj_3d in self.objects_3d:
-            if obj_3d.is_in_rotation_mode and obj_3d.rotation_hand_idx is not None:
-                # Check if rotation hand is still detected
-                rotation_hand_detected = any(hand['hand_idx'] == obj_3d.rotation_hand_idx for hand in hands_info)
-                if not rotation_hand_detected:
-                    self._exit_rotation_mode(obj_3d)
         
         # Additional safety: release objects if no hands are detected
         if not hands_info:
-            for obj in self.objects:
-                if obj.is_grabbed > 0:
-                    obj.is_grabbed = 0
-                    obj.grabbed_by_hand = []
-            for obj_3d in self.objects_3d:
-                if obj_3d.is_grabbed > 0:
-                    obj_3d.is_grabbed = 0
-                    obj_3d.grabbed_by_hand = []
-            self.grab_states.clear()
-            self.grab_states_3d.clear()
-            self.pinch_states.clear()
+            store = self.object_store
+            for i in np.flatnonzero(store.grab_state[:len(store)]):
+                self.objects[i].grabbed_by_hand_mask = 0
+            store.grab_state[:] = 0
+            scene = self.scene_3d
+            for i in np.flatnonzero(scene.grabbed[:len(scene)]):
+                self.objects_3d[i].grabbed_by_hand_mask = 0
+            scene.grabbed[:] = 0
+            self.grab_states = [None] * MAX_HANDS
+            self._free_grab_states_3d()
+            self.pinch_states = [None] * MAX_HANDS
+    
+    def _release_grab(self, grabs: list, hand_idx: int, scale_key: str):
+        """Drop hand_idx's grab slot and detach the hand from its object.
+
+        scale_key is the per-hand two-hand scaling baseline of the 2D state dicts
+        ('initial_size'); 3D states are GrabState3D and go back to the pool.
+        Returns the released object.
+        """
+        state = grabs[hand_idx]
+        grabs[hand_idx] = None
+        if isinstance(state, GrabState3D):
+            obj = state.object
+            state.object = None
+            self._grab_state_pool.append(state)
+        else:
+            obj = state['object']
+        obj.grabbed_by_hand_mask &= ~(1 << hand_idx)
+        remaining = _MASK_HANDS[obj.grabbed_by_hand_mask]
+        # Update grab state based on remaining hands
+        obj.is_grabbed = len(remaining)
+        
+        # Reset scaling state if transitioning from two-hand to one-hand or no hands
+        if len(remaining) < 2:
+            # Clear two-hand scaling state from all hands grabbing this object
+            for other_hand_idx in remaining:
+                other_hand_state = grabs[other_hand_idx]
+                if isinstance(other_hand_state, GrabState3D):
+                    other_hand_state.initial_two_hand_distance_sq = None
+                elif other_hand_state is not None:
+                    other_hand_state.pop('initial_two_hand_distance_sq', None)
+                    other_hand_state.pop(scale_key, None)
+        return obj
+    
+    def _free_grab_state_3d(self, hand_idx: int):
+        """Clear hand_idx's 3D grab slot, returning its state to the pool"""
+        state = self.grab_states_3d[hand_idx]
+        if state is not None:
+            state.object = None
+            self._grab_state_pool.append(state)
+            self.grab_states_3d[hand_idx] = None
+    
+    def _free_grab_states_3d(self):
+        for hand_idx in range(MAX_HANDS):
+            self._free_grab_state_3d(hand_idx)
+    
+    def _cleanup_grabs(self, grabs: list, current: set, scale_key: str) -> List[int]:
+        """Release grabs held by hands that didn't grab this frame; returns their indices"""
+        stale = [h for h, grab_state in enumerate(grabs) if grab_state is not None and h not in current]
+        for hand_idx in stale:
+            self._release_grab(grabs, hand_idx, scale_key)
+        return stale
     
     def _handle_pinch_interaction(self, hand_info: dict, hand_idx: int):
         """Handle pinch gesture interaction with improved tracking"""
         pinch_center = hand_info['pinch_center']
         pinch_distance = hand_info['pinch_distance']
         
-        if hand_idx not in self.grab_states:
-            # Try to grab an object - use pinch center for better accuracy
-            closest_obj = None
-            closest_distance = float('inf')
-            
-            for obj in self.objects:
-                if obj.is_grabbed < 2:  # Allow grabbing if not already grabbed by 2 hands
-                    # Use actual object size for grab radius to match pinchable radius
-                    grab_radius = obj.size
-                    distance = math.sqrt((obj.x - pinch_center[0]) ** 2 + (obj.y - pinch_center[1]) ** 2)
-                    if distance <= grab_radius and distance < closest_distance:
-                        closest_distance = distance
-                        closest_obj = obj
+        if self.grab_states[hand_idx] is None:
+            # Try to grab an object - use pinch center for better accuracy.
+            # Grab radius is the object size (matches the pinchable radius); objects
+            # already held by two hands are skipped.
+            closest_idx = self.object_store.closest_grabbable(pinch_center[0], pinch_center[1])
+            closest_obj = self.objects[closest_idx] if closest_idx >= 0 else None
             
             if closest_obj:
-                # Add this hand to the grabbed_by_hand list
-                if hand_idx not in closest_obj.grabbed_by_hand:
-                    closest_obj.grabbed_by_hand.append(hand_idx)
+                # Add this hand to the grab mask
+                closest_obj.grabbed_by_hand_mask |= 1 << hand_idx
                 # Update grab state based on number of hands
-                closest_obj.is_grabbed = len(closest_obj.grabbed_by_hand)
+                closest_obj.is_grabbed = closest_obj.grabbed_by_hand_mask.bit_count()
                 # Mark object as selected when grabbed
                 closest_obj.selected = True
                 self.grab_states[hand_idx] = {
@@ -1202,7 +1568,7 @@ class ARHandController:
     def _handle_two_hand_scaling_2d(self, obj):
         """Handle scaling when 2D object is grabbed by two hands"""
         # Get the two hands that are grabbing this object
-        grabbing_hands = [hand_idx for hand_idx in obj.grabbed_by_hand if hand_idx in self.grab_states]
+        grabbing_hands = [hand_idx for hand_idx in _MASK_HANDS[obj.grabbed_by_hand_mask] if self.grab_states[hand_idx] is not None]
         
         if len(grabbing_hands) == 2:
             hand1_idx, hand2_idx = grabbing_hands[0], grabbing_hands[1]
@@ -1210,39 +1576,32 @@ class ARHandController:
             hand2_state = self.grab_states[hand2_idx]
             
             # Get current hand positions from the detector
-            hand1_info = None
-            hand2_info = None
-            
-            for hand_info in self.current_hands_info:
-                if hand_info['hand_idx'] == hand1_idx:
-                    hand1_info = hand_info
-                elif hand_info['hand_idx'] == hand2_idx:
-                    hand2_info = hand_info
+            hand1_info = self._hands_by_idx.get(hand1_idx)
+            hand2_info = self._hands_by_idx.get(hand2_idx)
             
             if hand1_info and hand2_info:
                 # Calculate current distance between the two hands using pinch centers
                 hand1_pos = hand1_info['pinch_center']
                 hand2_pos = hand2_info['pinch_center']
-                current_distance = math.sqrt((hand2_pos[0] - hand1_pos[0]) ** 2 + (hand2_pos[1] - hand1_pos[1]) ** 2)
+                dx = hand2_pos[0] - hand1_pos[0]
+                dy = hand2_pos[1] - hand1_pos[1]
+                current_d2 = dx * dx + dy * dy
                 
-                # Get initial distance when two-hand grab started
-                if 'initial_two_hand_distance' not in hand1_state:
+                # Get initial (squared) distance when two-hand grab started
+                if 'initial_two_hand_distance_sq' not in hand1_state:
                     # Initialize the two-hand scaling
-                    hand1_state['initial_two_hand_distance'] = current_distance
+                    hand1_state['initial_two_hand_distance_sq'] = current_d2
                     hand1_state['initial_size'] = obj.size
-                    hand2_state['initial_two_hand_distance'] = current_distance
+                    hand2_state['initial_two_hand_distance_sq'] = current_d2
                     hand2_state['initial_size'] = obj.size
                 
-                initial_distance = hand1_state['initial_two_hand_distance']
+                initial_d2 = hand1_state['initial_two_hand_distance_sq']
                 
-                # Calculate scale factor based on distance change
-                if initial_distance > 0:
-                    scale_factor = current_distance / initial_distance
-                    target_size = hand1_state['initial_size'] * scale_factor
-                    
-                    # Apply scaling with smoothing
-                    obj.size = obj.size * 0.7 + target_size * 0.3  # Smooth scaling
-                    obj.size = max(20, min(200, obj.size))  # Clamp size
+                # Smoothed, clamped scale step from the distance ratio (compiled kernel)
+                if initial_d2 > 0:
+                    obj.size = hand_kernel.two_hand_scale_update(
+                        float(current_d2), float(initial_d2), float(hand1_state['initial_size']),
+                        obj.size, 20.0, 200.0)
     
     
     def _handle_selection_mode_3d(self, hands_info: List[dict]):
@@ -1259,72 +1618,64 @@ class ARHandController:
     
     def _update_selection_mode_objects(self):
         """Update which objects are in selection mode (grabbed by exactly 2 hands)"""
-        # Clear current selection mode
-        self.selection_mode_objects.clear()
-        
-        # Add objects that are grabbed by exactly 2 hands
-        for obj_3d in self.objects_3d:
-            if obj_3d.is_grabbed == 2:
-                self.selection_mode_objects.add(obj_3d)
-                obj_3d.is_selected = True  # Mark as selected for visual feedback
-            else:
-                obj_3d.is_selected = False  # Clear selection state
+        scene = self.scene_3d
+        n = len(scene)
+        # Objects grabbed by exactly 2 hands are selected (also drives the visual feedback)
+        np.equal(scene.grabbed[:n], 2, out=scene.is_selected[:n])
+        self.selection_mode_objects = {self.objects_3d[i] for i in np.flatnonzero(scene.is_selected[:n])}
     
     def _handle_selection_mode_interactions(self, obj_3d, hands_info: List[dict]):
         """Handle scaling for objects in selection mode (2 hands grabbing)"""
         # Get the two hands that are currently grabbing this object
-        grabbing_hands = [hand_idx for hand_idx in obj_3d.grabbed_by_hand if hand_idx in self.grab_states_3d]
+        grabbing_hands = [hand_idx for hand_idx in _MASK_HANDS[obj_3d.grabbed_by_hand_mask] if self.grab_states_3d[hand_idx] is not None]
         
         if len(grabbing_hands) == 2:
             hand1_idx, hand2_idx = grabbing_hands[0], grabbing_hands[1]
             
             # Check if both hands are still pinching (scaling mode)
-            hand1_pinching = any(hand['hand_idx'] == hand1_idx and hand['is_pinching'] for hand in hands_info)
-            hand2_pinching = any(hand['hand_idx'] == hand2_idx and hand['is_pinching'] for hand in hands_info)
+            hand1_pinching = hand1_idx in self._pinching_set
+            hand2_pinching = hand2_idx in self._pinching_set
             
             if hand1_pinching and hand2_pinching:
                 # Both hands pinching - scaling mode
                 self._handle_selection_scaling(obj_3d, hand1_idx, hand2_idx, hands_info)
             elif hand1_pinching or hand2_pinching:
                 # One hand released - transition to rotation mode
-                self._transition_to_rotation_mode(obj_3d, hand1_idx, hand2_idx, hands_info)
+                self._transition_to_rotation_mode(obj_3d, hand1_idx, hand2_idx, hand1_pinching, hand2_pinching, hands_info)
     
     def _handle_selection_scaling(self, obj_3d, hand1_idx: int, hand2_idx: int, hands_info: List[dict]):
         """Handle scaling when both hands are pinching in selection mode"""
         # Get hand positions
-        hand1_info = next((hand for hand in hands_info if hand['hand_idx'] == hand1_idx), None)
-        hand2_info = next((hand for hand in hands_info if hand['hand_idx'] == hand2_idx), None)
+        hand1_info = self._hands_by_idx.get(hand1_idx)
+        hand2_info = self._hands_by_idx.get(hand2_idx)
         
         if hand1_info and hand2_info:
             # Calculate current distance between the two hands
             hand1_pos = hand1_info['pinch_center']
             hand2_pos = hand2_info['pinch_center']
-            current_distance = math.sqrt((hand2_pos[0] - hand1_pos[0]) ** 2 + (hand2_pos[1] - hand1_pos[1]) ** 2)
+            dx = hand2_pos[0] - hand1_pos[0]
+            dy = hand2_pos[1] - hand1_pos[1]
+            current_d2 = dx * dx + dy * dy
             
-            # Get initial distance when two-hand grab started
+            # Get initial (squared) distance when two-hand grab started
             hand1_state = self.grab_states_3d[hand1_idx]
-            if 'initial_two_hand_distance' not in hand1_state:
-                hand1_state['initial_two_hand_distance'] = current_distance
-                hand1_state['initial_scale'] = obj_3d.scale
+            if hand1_state.initial_two_hand_distance_sq is None:
+                hand1_state.initial_two_hand_distance_sq = current_d2
+                hand1_state.initial_scale = obj_3d.scale
             
-            initial_distance = hand1_state['initial_two_hand_distance']
+            initial_d2 = hand1_state.initial_two_hand_distance_sq
             
-            # Calculate scale factor based on distance change
-            if initial_distance > 0:
-                scale_factor = current_distance / initial_distance
-                target_scale = hand1_state['initial_scale'] * scale_factor
-                
-                # Apply scaling with smoothing
-                obj_3d.scale = obj_3d.scale * 0.7 + target_scale * 0.3  # Smooth scaling
-                obj_3d.scale = max(0.1, min(5.0, obj_3d.scale))  # Clamp scale
+            # Smoothed, clamped scale step from the distance ratio (compiled kernel)
+            if initial_d2 > 0:
+                obj_3d.scale = hand_kernel.two_hand_scale_update(
+                    float(current_d2), float(initial_d2), float(hand1_state.initial_scale),
+                    float(obj_3d.scale), 0.1, 5.0)
     
     
-    def _transition_to_rotation_mode(self, obj_3d, hand1_idx: int, hand2_idx: int, hands_info: List[dict]):
+    def _transition_to_rotation_mode(self, obj_3d, hand1_idx: int, hand2_idx: int,
+                                     hand1_pinching: bool, hand2_pinching: bool, hands_info: List[dict]):
         """Transition object to rotation mode when one hand releases from 2-hand grab"""
         # Determine which hand is still pinching and which is released
-        hand1_pinching = any(hand['hand_idx'] == hand1_idx and hand['is_pinching'] for hand in hands_info)
-        hand2_pinching = any(hand['hand_idx'] == hand2_idx and hand['is_pinching'] for hand in hands_info)
-        
         if hand1_pinching and not hand2_pinching:
             # Hand1 still pinching, Hand2 released - Hand2 controls rotation
             rotation_hand = hand2_idx
@@ -1335,45 +1686,45 @@ class ARHandController:
             # Both hands released or both still pinching - no rotation mode
             return
         
-        # Set rotation mode
+        self._enter_rotation_mode(obj_3d, rotation_hand, hands_info)
+    
+    def _enter_rotation_mode(self, obj_3d, rotation_hand_idx: int, hands_info: List[dict]):
+        """Put an object in rotation mode, driven by the open hand rotation_hand_idx"""
         obj_3d.is_in_rotation_mode = True
-        obj_3d.rotation_hand_idx = rotation_hand
+        obj_3d.rotation_hand_idx = rotation_hand_idx
+        self._rotation_mode_objs.add(obj_3d)
         
         # Get initial position of rotation hand
-        rotation_hand_info = next((hand for hand in hands_info if hand['hand_idx'] == rotation_hand), None)
+        rotation_hand_info = self._hands_by_idx.get(rotation_hand_idx)
         if rotation_hand_info:
             obj_3d.last_rotation_hand_pos = rotation_hand_info['palm_center']
         self._update_rotation_axis_from_hand(obj_3d, hands_info)
         
-        print(f"Object entered rotation mode - Hand {rotation_hand} controlling rotation")
+        if self.debug:
+            print(f"Object entered rotation mode - Hand {rotation_hand_idx} controlling rotation")
     
     def _update_rotation_axis_from_hand(self, obj_3d, hands_info: List[dict]):
         """Set the active rotation axis based on the controlling hand's handedness"""
         if obj_3d.rotation_hand_idx is None:
-            obj_3d.rotation_axis = None
+            obj_3d.rotation_axis = -1
             return
 
-        rotation_hand_info = next((hand for hand in hands_info if hand['hand_idx'] == obj_3d.rotation_hand_idx), None)
+        rotation_hand_info = self._hands_by_idx.get(obj_3d.rotation_hand_idx)
         if not rotation_hand_info:
-            obj_3d.rotation_axis = None
+            obj_3d.rotation_axis = -1
             return
 
-        label = rotation_hand_info.get('hand_label', 'unknown')
-        if label == 'left':
-            obj_3d.rotation_axis = 'x'
-        elif label == 'right':
-            obj_3d.rotation_axis = 'y'
-        else:
-            obj_3d.rotation_axis = None
+        obj_3d.rotation_axis = _AXIS_BY_LABEL.get(rotation_hand_info.get('hand_label', 'unknown'), -1)
 
     def _handle_rotation_mode_3d(self, hands_info: List[dict]):
         """Handle rotation mode for 3D objects"""
-        for obj_3d in self.objects_3d:
-            if obj_3d.is_in_rotation_mode and obj_3d.rotation_hand_idx is not None:
+        # Objects outside rotation mode need no work
+        for obj_3d in list(self._rotation_mode_objs):
+            if obj_3d.rotation_hand_idx is not None:
                 # Refresh rotation axis in case handedness changed ordering
                 self._update_rotation_axis_from_hand(obj_3d, hands_info)
 
-                rotation_hand_info = next((hand for hand in hands_info if hand['hand_idx'] == obj_3d.rotation_hand_idx), None)
+                rotation_hand_info = self._hands_by_idx.get(obj_3d.rotation_hand_idx)
                 if not rotation_hand_info:
                     self._exit_rotation_mode(obj_3d)
                     continue
@@ -1399,33 +1750,32 @@ class ARHandController:
                 delta_y = current_pos[1] - last_pos[1]
                 movement_threshold = 4
                 rotation_sensitivity = 0.01
-                axis = getattr(obj_3d, 'rotation_axis', None)
 
-                if axis == 'x':
+                # Left hand drives X from vertical motion; otherwise Y from horizontal motion
+                if obj_3d.rotation_axis == 0:
                     if abs(delta_y) > movement_threshold:
-                        obj_3d.rotation_x -= delta_y * rotation_sensitivity
-                        obj_3d.rotation_x = obj_3d.rotation_x % (2 * math.pi)
+                        obj_3d.rotate_axis(0, -delta_y * rotation_sensitivity)
                 else:
                     if abs(delta_x) > movement_threshold:
-                        obj_3d.rotation_y -= delta_x * rotation_sensitivity
-                        obj_3d.rotation_y = obj_3d.rotation_y % (2 * math.pi)
+                        obj_3d.rotate_axis(1, -delta_x * rotation_sensitivity)
 
                 obj_3d.last_rotation_hand_pos = current_pos
             else:
-                if obj_3d.is_in_rotation_mode:
-                    self._exit_rotation_mode(obj_3d)
+                self._exit_rotation_mode(obj_3d)
     
     def _exit_rotation_mode(self, obj_3d):
         """Exit rotation mode for an object"""
         # Clean up the rotation hand's grab state if it exists
-        if obj_3d.rotation_hand_idx is not None and obj_3d.rotation_hand_idx in self.grab_states_3d:
-            del self.grab_states_3d[obj_3d.rotation_hand_idx]
+        if obj_3d.rotation_hand_idx is not None:
+            self._free_grab_state_3d(obj_3d.rotation_hand_idx)
         
         obj_3d.is_in_rotation_mode = False
         obj_3d.rotation_hand_idx = None
         obj_3d.last_rotation_hand_pos = None
-        obj_3d.rotation_axis = None
-        print(f"Object exited rotation mode")
+        obj_3d.rotation_axis = -1
+        self._rotation_mode_objs.discard(obj_3d)
+        if self.debug:
+            print("Object exited rotation mode")
                 
     
     def _handle_pinch_interaction_3d(self, hand_info: dict, hand_idx: int) -> bool:
@@ -1435,75 +1785,65 @@ class ARHandController:
         thumb_pos = hand_info['thumb_pos']
         index_pos = hand_info['index_pos']
         
-        if hand_idx not in self.grab_states_3d:
-            # Try to grab a 3D object
+        if self.grab_states_3d[hand_idx] is None:
+            # Try to grab a 3D object: only objects whose hit circle overlaps the pinch's
+            # grid cell are tested; the first object containing the pinch wins
             closest_obj_3d = None
-            closest_distance = float('inf')
-            
-            for obj_3d in self.objects_3d:
-                if obj_3d.is_grabbed < 2 and obj_3d.is_point_inside(pinch_center[0], pinch_center[1], self.renderer_3d):
-                    # For 3D objects, we use a simpler distance check
-                    distance = 0  # If point is inside, it's the closest
-                    if distance < closest_distance:
-                        closest_distance = distance
-                        closest_obj_3d = obj_3d
+            if self.objects_3d:
+                if self._grab_grid is None:
+                    self._rebuild_grab_grid()
+                cells, screen_pos, radii = self._grab_grid
+                cell = (pinch_center[0] // GRAB_GRID_CELL, pinch_center[1] // GRAB_GRID_CELL)
+                for k in cells.get(cell, ()):
+                    dx = screen_pos[k, 0] - pinch_center[0]
+                    dy = screen_pos[k, 1] - pinch_center[1]
+                    if dx * dx + dy * dy <= radii[k] * radii[k] and self.objects_3d[k].is_grabbed < 2:
+                        closest_obj_3d = self.objects_3d[k]
+                        break
             
             if closest_obj_3d:
-                # Add this hand to the grabbed_by_hand list
-                if hand_idx not in closest_obj_3d.grabbed_by_hand:
-                    closest_obj_3d.grabbed_by_hand.append(hand_idx)
+                # Add this hand to the grab mask
+                closest_obj_3d.grabbed_by_hand_mask |= 1 << hand_idx
                 # Update grab state based on number of hands
-                closest_obj_3d.is_grabbed = len(closest_obj_3d.grabbed_by_hand)
+                closest_obj_3d.is_grabbed = closest_obj_3d.grabbed_by_hand_mask.bit_count()
                 # Mark object as selected when grabbed
                 closest_obj_3d.selected = True
                 
                 # Get the current 3D object's screen position for calculating grab offset
                 current_screen_pos = closest_obj_3d.get_screen_position(self.renderer_3d)
                 
-                self.grab_states_3d[hand_idx] = {
-                    'object': closest_obj_3d,
-                    'initial_pinch_distance': pinch_distance,
-                    'initial_scale': closest_obj_3d.scale,
-                    'initial_world_pos': (closest_obj_3d.x, closest_obj_3d.y, closest_obj_3d.z),
-                    'grab_offset_x': pinch_center[0] - current_screen_pos[0] if current_screen_pos else 0,
-                    'grab_offset_y': pinch_center[1] - current_screen_pos[1] if current_screen_pos else 0,
-                    'last_pinch_center': pinch_center,
-                    'last_thumb_pos': thumb_pos,
-                    'last_index_pos': index_pos,
-                    'movement_sensitivity': 0.015,  # Controls how much screen movement affects 3D position (increased for better responsiveness)
-                    'initial_rotation': (closest_obj_3d.rotation_x, closest_obj_3d.rotation_y, closest_obj_3d.rotation_z),
-                    'rotation_sensitivity': 0.01  # Controls rotation sensitivity
-                }
+                pool = self._grab_state_pool
+                state = pool.pop() if pool else GrabState3D()
+                self.grab_states_3d[hand_idx] = state.reset(
+                    closest_obj_3d, pinch_distance, pinch_center, thumb_pos, index_pos, current_screen_pos)
                 return True
         else:
             # Continue interaction with grabbed 3D object
             grab_state = self.grab_states_3d[hand_idx]
-            obj_3d = grab_state['object']
+            obj_3d = grab_state.object
             
             # Only move the object if the hand has actually moved
-            last_pinch_center = grab_state['last_pinch_center']
+            last_pinch_center = grab_state.last_pinch_center
             pinch_delta_x = pinch_center[0] - last_pinch_center[0]
             pinch_delta_y = pinch_center[1] - last_pinch_center[1]
             
-            # Calculate movement magnitude to determine if hand actually moved
-            movement_magnitude = math.sqrt(pinch_delta_x**2 + pinch_delta_y**2)
-            movement_threshold = 0.5  # pixels - minimum movement to trigger object movement (reduced for better responsiveness)
-            
-            if movement_magnitude > movement_threshold:
+            # Compare squared movement against the squared threshold (no sqrt needed)
+            if pinch_delta_x * pinch_delta_x + pinch_delta_y * pinch_delta_y > MOVEMENT_THRESHOLD_SQ:
                 # Convert screen movement to world space movement
-                sensitivity = grab_state['movement_sensitivity']
+                sensitivity = grab_state.movement_sensitivity
                 world_delta_x = pinch_delta_x * sensitivity
                 world_delta_y = -pinch_delta_y * sensitivity  # Invert Y for correct direction
                 
                 # Apply movement directly without smoothing for immediate response
                 obj_3d.x += world_delta_x
                 obj_3d.y += world_delta_y
+                self._grab_grid = None
             
             
             # Track finger positions for better interaction feedback
-            grab_state['last_pinch_center'] = pinch_center
-            grab_state['last_thumb_pos'] = thumb_pos
-            grab_state['last_index_pos'] = index_pos
+            grab_state.last_pinch_center = pinch_center
+            grab_state.last_thumb_pos = thumb_pos
+            grab_state.last_index_pos = index_pos
             
             return True
         
@@ -1519,7 +1859,7 @@ class ARHandController:
         color = (random.randint(50, 255), random.randint(50, 255), random.randint(50, 255))
         shape = random.choice(["circle", "cube"])
         
-        self.objects.append(VirtualObject(x, y, size, color, shape))
+        VirtualObject(x, y, size, color, shape, store=self.object_store)
     
     def _draw_ui(self, frame: np.ndarray, hands_info: List[dict]) -> np.ndarray:
         """Draw user interface elements"""
@@ -1550,32 +1890,11 @@ class ARHandController:
             
             # Show pinch status with more detail
             is_pinching = hand_info['is_pinching']
-            stabilized_pinching = hand_idx in self.pinch_states and self.pinch_states[hand_idx]['was_pinching']
+            pinch_state = self.pinch_states[hand_idx] if hand_idx < MAX_HANDS else None
+            stabilized_pinching = pinch_state is not None and pinch_state['was_pinching']
+            status, color = self._hand_status(hand_idx, is_pinching, stabilized_pinching)
             
-            if stabilized_pinching:
-                status = "PINCHING ✓"
-                color = (0, 255, 0)  # Green for successful pinch
-                if hand_idx in self.grab_states:
-                    obj = self.grab_states[hand_idx]['object']
-                    grab_state_text = ["Not grabbed", "1 hand", "2 hands"][obj.is_grabbed]
-                    scaling_text = " (SCALING)" if obj.is_grabbed == 2 else ""
-                    status = f"2D GRABBED ✓ ({grab_state_text}{scaling_text}, Size: {int(obj.size)})"
-                    color = (255, 255, 0)  # Yellow for grabbed 2D
-                elif hand_idx in self.grab_states_3d:
-                    obj_3d = self.grab_states_3d[hand_idx]['object']
-                    grab_state_text = ["Not grabbed", "1 hand", "2 hands"][obj_3d.is_grabbed]
-                    scaling_text = " (SCALING)" if obj_3d.is_grabbed == 2 else ""
-                    rotation_text = f" (ROTATING - Hand {obj_3d.rotation_hand_idx})" if obj_3d.is_in_rotation_mode else ""
-                    status = f"3D GRABBED ✓ ({grab_state_text}{scaling_text}{rotation_text}, Scale: {obj_3d.scale:.1f})"
-                    color = (0, 255, 255)  # Cyan for grabbed 3D
-            elif is_pinching:
-                status = "PINCHING..."
-                color = (0, 255, 255)  # Cyan for detecting
-            else:
-                status = "OPEN"
-                color = (128, 128, 128)  # Gray for open
-            
-            cv2.putText(frame, f"Hand {hand_idx}: {status}", 
+            cv2.putText(frame, status, 
                        (palm_pos[0] - 60, palm_pos[1] - 25),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
             
@@ -1586,7 +1905,7 @@ class ARHandController:
                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
         
         # Show object counts and mode info
-        info_y = frame.shape[0] - 80
+        info_y = self._frame_wh[1] - 80
         cv2.putText(frame, f"2D Objects: {len(self.objects)} {'(ON)' if self.show_2d_objects else '(OFF)'}", 
                    (10, info_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         cv2.putText(frame, f"3D Objects: {len(self.objects_3d)} {'(ON)' if self.show_3d_objects else '(OFF)'}", 
@@ -1600,12 +1919,61 @@ class ARHandController:
         
         return frame
     
+    def _hand_status(self, hand_idx: int, is_pinching: bool, stabilized_pinching: bool):
+        """Status line text and color for a hand, formatted only when its state changes"""
+        # The key holds exactly the values the text is built from
+        obj = obj_3d = None
+        if not stabilized_pinching:
+            key = (hand_idx, 'pinching' if is_pinching else 'open')
+        elif self.grab_states[hand_idx] is not None:
+            obj = self.grab_states[hand_idx]['object']
+            key = (hand_idx, '2d', obj.is_grabbed, int(obj.size))
+        elif self.grab_states_3d[hand_idx] is not None:
+            obj_3d = self.grab_states_3d[hand_idx].object
+            rotating = obj_3d.rotation_hand_idx if obj_3d.is_in_rotation_mode else -1
+            # Scale is shown to one decimal, so key on tenths: it changes every frame while scaling
+            key = (hand_idx, '3d', obj_3d.is_grabbed, rotating, round(obj_3d.scale * 10))
+        else:
+            key = (hand_idx, 'pinched')
+        
+        cache = self._status_cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+        
+        if stabilized_pinching:
+            status = "PINCHING ✓"
+            color = (0, 255, 0)  # Green for successful pinch
+            if obj is not None:
+                grab_state_text = ["Not grabbed", "1 hand", "2 hands"][obj.is_grabbed]
+                scaling_text = " (SCALING)" if obj.is_grabbed == 2 else ""
+                status = f"2D GRABBED ✓ ({grab_state_text}{scaling_text}, Size: {int(obj.size)})"
+                color = (255, 255, 0)  # Yellow for grabbed 2D
+            elif obj_3d is not None:
+                grab_state_text = ["Not grabbed", "1 hand", "2 hands"][obj_3d.is_grabbed]
+                scaling_text = " (SCALING)" if obj_3d.is_grabbed == 2 else ""
+                rotation_text = f" (ROTATING - Hand {obj_3d.rotation_hand_idx})" if obj_3d.is_in_rotation_mode else ""
+                status = f"3D GRABBED ✓ ({grab_state_text}{scaling_text}{rotation_text}, Scale: {key[-1] / 10:.1f})"
+                color = (0, 255, 255)  # Cyan for grabbed 3D
+        elif is_pinching:
+            status = "PINCHING..."
+            color = (0, 255, 255)  # Cyan for detecting
+        else:
+            status = "OPEN"
+            color = (128, 128, 128)  # Gray for open
+        
+        cached = cache[key] = (f"Hand {hand_idx}: {status}", color)
+        if len(cache) > self._status_cache_max:
+            cache.popitem(last=False)
+        return cached
+    
     def _draw_rotation_hand_indicators(self, frame: np.ndarray, hands_info: List[dict]) -> np.ndarray:
         """Draw visual indicators for hands controlling rotation"""
-        for obj_3d in self.objects_3d:
-            if obj_3d.is_in_rotation_mode and obj_3d.rotation_hand_idx is not None:
+        for obj_3d in self._rotation_mode_objs:
+            if obj_3d.rotation_hand_idx is not None:
                 # Find the rotation hand
-                rotation_hand_info = next((hand for hand in hands_info if hand['hand_idx'] == obj_3d.rotation_hand_idx), None)
+                rotation_hand_info = self._hands_by_idx.get(obj_3d.rotation_hand_idx)
                 
                 if rotation_hand_info:
                     # Draw a large circle around the rotation hand
@@ -1614,74 +1982,36 @@ class ARHandController:
                     cv2.circle(frame, hand_center, 25, (0, 255, 255), -1)  # Filled cyan circle
                     
                     # Choose label based on active axis for quick user feedback
-                    axis = getattr(obj_3d, 'rotation_axis', None)
-                    if axis == 'x':
-                        text = "ROTATE X"
-                    elif axis == 'y':
-                        text = "ROTATE Y"
-                    else:
-                        text = "ROTATOR"
+                    text = _AXIS_LABELS.get(obj_3d.rotation_axis, "ROTATOR")
+                    text_size = _AXIS_LABEL_SIZES[text]
                     font = cv2.FONT_HERSHEY_SIMPLEX
-                    font_scale = 0.6
-                    font_thickness = 2
-                    text_size = cv2.getTextSize(text, font, font_scale, font_thickness)[0]
                     text_x = hand_center[0] - text_size[0] // 2
                     text_y = hand_center[1] - 40
                     
-                    # Draw text background
-                    cv2.rectangle(frame, 
-                                (text_x - 5, text_y - text_size[1] - 5), 
-                                (text_x + text_size[0] + 5, text_y + 5), 
-                                (0, 0, 0), -1)
-                    
-                    # Draw text
-                    cv2.putText(frame, text, (text_x, text_y), font, font_scale, (0, 255, 255), font_thickness)
+                    if isinstance(frame, cv2.UMat):
+                        # A UMat can't be sliced for blitting: draw the box and text directly
+                        cv2.rectangle(frame, (text_x - 5, text_y - text_size[1] - 5),
+                                      (text_x + text_size[0] + 5, text_y + 5), (0, 0, 0), -1)
+                        cv2.putText(frame, text, (text_x, text_y), font, 0.6, (0, 255, 255), 2)
+                    else:
+                        # Label and its background box are one pre-rendered overlay
+                        self._blit_overlay(frame, self._rotation_label_overlays[text], text_x, text_y)
                     
-                    # Draw directional hints based on axis mapping
+                    # Directional hints based on axis mapping; both arrows go in one polylines call
+                    # (the short hint words are cheaper to putText than to alpha-blend)
                     arrow_color = (0, 255, 255)
-                    arrow_length = 35
-                    if axis == 'x':
+                    axis = 0 if obj_3d.rotation_axis == 0 else 1
+                    cv2.polylines(frame, _ROT_ARROWS[axis] + np.int32(hand_center), False, arrow_color, 3)
+                    if axis == 0:
                         # Up/down arrows for X-axis tilt
-                        cv2.arrowedLine(
-                            frame,
-                            (hand_center[0], hand_center[1] - 10),
-                            (hand_center[0], hand_center[1] - 10 - arrow_length),
-                            arrow_color,
-                            3,
-                            tipLength=0.3,
-                        )
-                        cv2.arrowedLine(
-                            frame,
-                            (hand_center[0], hand_center[1] + 10),
-                            (hand_center[0], hand_center[1] + 10 + arrow_length),
-                            arrow_color,
-                            3,
-                            tipLength=0.3,
-                        )
-                        cv2.putText(frame, "UP", (hand_center[0] - 20, hand_center[1] - 15 - arrow_length), font, 0.4, arrow_color, 1)
-                        cv2.putText(frame, "DOWN", (hand_center[0] - 30, hand_center[1] + 25 + arrow_length), font, 0.4, arrow_color, 1)
+                        cv2.putText(frame, "UP", (hand_center[0] - 20, hand_center[1] - 15 - _ROT_ARROW_LEN), font, 0.4, arrow_color, 1)
+                        cv2.putText(frame, "DOWN", (hand_center[0] - 30, hand_center[1] + 25 + _ROT_ARROW_LEN), font, 0.4, arrow_color, 1)
                     else:
                         # Left/right arrows for Y-axis yaw
                         arrow_x = hand_center[0] + 50
                         arrow_y = hand_center[1]
-                        cv2.arrowedLine(
-                            frame,
-                            (arrow_x + arrow_length, arrow_y),
-                            (arrow_x, arrow_y),
-                            arrow_color,
-                            3,
-                            tipLength=0.3,
-                        )
-                        cv2.arrowedLine(
-                            frame,
-                            (arrow_x, arrow_y),
-                            (arrow_x + arrow_length, arrow_y),
-                            arrow_color,
-                            3,
-                            tipLength=0.3,
-                        )
                         cv2.putText(frame, "CW", (arrow_x - 15, arrow_y - 10), font, 0.4, arrow_color, 1)
-                        cv2.putText(frame, "CCW", (arrow_x + arrow_length - 5, arrow_y - 10), font, 0.4, arrow_color, 1)
+                        cv2.putText(frame, "CCW", (arrow_x + _ROT_ARROW_LEN - 5, arrow_y - 10), font, 0.4, arrow_color, 1)
         
         return frame
     
@@ -1,11 +1,40 @@
 import os
+import json
 import time
+import struct
 import threading
 import requests
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+from werkzeug.http import generate_etag
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
+try:
+    import socketio
+except ImportError:  # python-socketio is optional - fall back to REST polling
+    socketio = None
 
 app = Flask(__name__)
 
+if orjson is not None:
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson (jsonify, request.get_json)"""
+        
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+    
+    app.json = OrjsonProvider(app)
+    _json_loads = orjson.loads
+else:
+    _json_loads = json.loads
+
 # Configuration via environment variables
 # Example:
 #   export EXPERT_BASE_URL="https://bentlee-recriminatory-theresa.ngrok-free.dev"
@@ -13,21 +42,45 @@ app = Flask(__name__)
 EXPERT_BASE_URL = os.environ.get('EXPERT_BASE_URL', 'http://localhost:3001')
 DEFAULT_ROOM_ID = os.environ.get('ROOM_ID', 'demo')
 POLL_INTERVAL_SEC = float(os.environ.get('POLL_INTERVAL_SEC', '1.0'))
+# Subscribe to Node's Socket.IO 'hand-skeleton' stream instead of polling the REST endpoint
+USE_SOCKETIO = os.environ.get('USE_SOCKETIO', '1') in ('1', 'true', 'True')
+# Must match the signaling server's SOCKETIO_PARSER ('msgpack' there -> 'msgpack' here)
+SOCKETIO_SERIALIZER = os.environ.get('SOCKETIO_SERIALIZER', 'default')
+# Scale of int16-packed landmarks (`landmarksQ`); must match expert-app/app.js
+LANDMARK_Q_SCALE = 16384.0
+
+# room_id -> (body, etag): the /landmarks/latest response for the latest payload from Node
+# (/api/hand-landmarks), serialized once by the feed thread. Entries are immutable and swapped
+# with a single dict assignment, so request threads read them without a lock.
+_last_by_room = {}
+_session = requests.Session()  # keep-alive: reuse the TCP/TLS connection across polls
+_etag_by_room = {}  # room_id -> (ETag, parsed response) of the last 200 from Node
+
+def _publish(room_id: str, payload):
+    """Serialize the /landmarks/latest body for a room's new payload and swap it in."""
+    body = app.json.dumps({'room_id': room_id, 'data': payload})
+    _last_by_room[room_id] = (body, generate_etag(body.encode()))
 
-_last_by_room = {}  # room_id -> latest payload from Node (/api/hand-landmarks)
 
 def fetch_landmarks_once(server_base: str, room_id: str):
     """Fetch once from Node server endpoint and return parsed JSON (or None)."""
     try:
         # Prefer API route to avoid collisions with static '/expert' path
         url = f"{server_base.rstrip('/')}/api/hand-landmarks"
-        resp = requests.get(url, params={'roomId': room_id}, timeout=5)
+        etag, cached = _etag_by_room.get(room_id, (None, None))
+        # Conditional GET: Node (Express) answers 304 with no body when nothing changed
+        headers = {'If-None-Match': etag} if etag else None
+        resp = _session.get(url, params={'roomId': room_id}, headers=headers, timeout=5)
+        if resp.status_code == 304 and cached is not None:
+            return cached  # same object as last time, so callers can skip unchanged payloads
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
+        if resp.headers.get('ETag'):
+            _etag_by_room[room_id] = (resp.headers['ETag'], data)
         # Cache latest by room
         try:
             rid = data.get('roomId') or room_id
-            _last_by_room[rid] = data.get('data')
+            _publish(rid, data.get('data'))
         except Exception:
             pass
         return data
@@ -39,22 +92,84 @@ def fetch_landmarks_once(server_base: str, room_id: str):
 def poll_loop(server_base: str, room_id: str, stop_event: threading.Event):
     """Background loop to poll and print landmarks periodically."""
     print(f"[Flask] Starting poll loop → base={server_base}, roomId={room_id}")
+    last_data = None
     while not stop_event.is_set():
         data = fetch_landmarks_once(server_base, room_id)
-        if data is not None:
-            # For now, just print it
+        if data is not None and data is not last_data:
+            # For now, just print it (unchanged payloads come back as the same object)
             print(f"[Flask] Landmarks ({room_id}): {data}")
+            last_data = data
         time.sleep(POLL_INTERVAL_SEC)
     print("[Flask] Poll loop stopped.")
 
 
+def _dequantize_skeleton(skel):
+    """Expand int16-packed `landmarksQ` into {x, y, z} landmarks, like Node does for its REST cache."""
+    if not isinstance(skel, dict) or not skel.get('landmarksQ'):
+        return skel
+    packed = bytes(skel['landmarksQ'])
+    out = {k: v for k, v in skel.items() if k != 'landmarksQ'}
+    out['landmarks'] = [{'x': x / LANDMARK_Q_SCALE, 'y': y / LANDMARK_Q_SCALE, 'z': z / LANDMARK_Q_SCALE}
+                        for x, y, z in struct.iter_unpack('<3h', packed[:len(packed) // 6 * 6])]
+    return out
+
+
+def subscribe_loop(server_base: str, room_id: str, stop_event: threading.Event):
+    """Receive landmarks as Node pushes them over Socket.IO; falls back to poll_loop if it can't connect."""
+    sio = socketio.Client(reconnection=True, logger=False, engineio_logger=False,
+                          serializer=SOCKETIO_SERIALIZER)
+    stats = {'count': 0, 'since': time.monotonic()}
+
+    @sio.event
+    def connect():
+        # Any role other than 'expert' keeps the clinician from offering us a WebRTC call
+        sio.emit('join-room', {'roomId': room_id, 'role': 'observer', 'userName': 'Flask relay'})
+        print(f"[Flask] Subscribed to hand-skeleton stream → base={server_base}, roomId={room_id}")
+
+    @sio.on('hand-skeleton')
+    def on_hand_skeleton(msg):
+        # Same shape Node caches for /api/hand-landmarks
+        skeleton = msg.get('skeleton')
+        skeletons = msg.get('skeletons')
+        if not isinstance(skeletons, list):
+            skeletons = [skeleton] if skeleton else []
+        data = {
+            'skeleton': _dequantize_skeleton(skeleton),
+            'skeletons': [_dequantize_skeleton(s) for s in skeletons],
+            'updatedAt': msg.get('timestamp'),
+            'senderId': msg.get('senderId'),
+        }
+        _publish(room_id, data)
+        # Updates arrive at the expert's frame rate, so log a summary at most once per second
+        stats['count'] += 1
+        now = time.monotonic()
+        if now - stats['since'] > 1.0:
+            print(f"[Flask] Received {stats['count']} hand-skeletons in {now - stats['since']:.1f}s ({room_id})")
+            stats['count'] = 0
+            stats['since'] = now
+
+    @sio.event
+    def disconnect():
+        print("[Flask] Socket.IO disconnected")
+
+    try:
+        sio.connect(server_base, transports=['websocket'])
+    except Exception as e:
+        print(f"[Flask] Socket.IO connect failed ({e}); polling instead")
+        poll_loop(server_base, room_id, stop_event)
+        return
+    stop_event.wait()
+    sio.disconnect()
+    print("[Flask] Subscription stopped.")
+
+
 poll_thread = None
 poll_stop_event = threading.Event()
 
 
 @app.route('/poll/start', methods=['POST'])
 def start_poll():
-    """Start background polling. Body/params: server_base, room_id"""
+    """Start the background landmark feed (Socket.IO push, or polling). Body/params: server_base, room_id"""
     global poll_thread, poll_stop_event
     if poll_thread and poll_thread.is_alive():
         return jsonify({'status': 'already_running'})
@@ -65,14 +180,16 @@ def start_poll():
     room_id = room_id or DEFAULT_ROOM_ID
 
     poll_stop_event = threading.Event()
-    poll_thread = threading.Thread(target=poll_loop, args=(server_base, room_id, poll_stop_event), daemon=True)
+    target = subscribe_loop if USE_SOCKETIO and socketio is not None else poll_loop
+    poll_thread = threading.Thread(target=target, args=(server_base, room_id, poll_stop_event), daemon=True)
     poll_thread.start()
-    return jsonify({'status': 'started', 'server_base': server_base, 'room_id': room_id})
+    return jsonify({'status': 'started', 'mode': 'socketio' if target is subscribe_loop else 'poll',
+                    'server_base': server_base, 'room_id': room_id})
 
 
 @app.route('/poll/stop', methods=['POST'])
 def stop_poll():
-    """Stop background polling."""
+    """Stop the background landmark feed."""
     global poll_thread, poll_stop_event
     if poll_thread and poll_thread.is_alive():
         poll_stop_event.set()
@@ -101,12 +218,25 @@ def latest():
     room_id = request.args.get('room_id', DEFAULT_ROOM_ID)
     # The cached structure is whatever Node returned at `data`:
     # { skeleton: { landmarks:[{x,y,z}], handedness?, clear?, ts? }, updatedAt, senderId }
-    payload = _last_by_room.get(room_id)
-    return jsonify({'room_id': room_id, 'data': payload})
+    entry = _last_by_room.get(room_id)  # one atomic read; the entry itself never changes
+    if entry is None:
+        resp = jsonify({'room_id': room_id, 'data': None})
+        resp.add_etag()
+    else:
+        # Pre-serialized body and ETag: no JSON encoding or hashing on the read path
+        body, etag = entry
+        resp = Response(body, mimetype='application/json')
+        resp.set_etag(etag)
+    # ETag lets pollers send If-None-Match and get a bodyless 304 when nothing changed
+    return resp.make_conditional(request)
 
 
 if __name__ == '__main__':
+    # Threaded server so concurrent /landmarks/latest readers don't queue behind each other.
+    # For production, serve with one gthread worker (the poll thread and cache are per-process):
+    #   gunicorn -w 1 -k gthread --threads 4 -b 0.0.0.0:5001 flask_server:app
+    from werkzeug.serving import run_simple
     port = int(os.environ.get('PORT', '5001'))
-    app.run(host='0.0.0.0', port=port)
+    run_simple('0.0.0.0', port, app, threaded=True)
 
 
@@ -0,0 +1,82 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# Fingertip / pip landmark indices for index, middle, ring, pinky
+_TIPS = np.array([8, 12, 16, 20], dtype=np.int64)
+_PIPS = np.array([6, 10, 14, 18], dtype=np.int64)
+
+
+@njit(cache=True, fastmath=True)
+def extended_finger_bits(lm):
+    """Pack the extended-finger flags into a 5-bit mask (bit 0 = thumb ... bit 4 = pinky)"""
+    bits = 0
+    if lm[4, 0] > lm[3, 0]:
+        bits |= 1
+    for i in range(4):
+        if lm[_TIPS[i], 1] < lm[_PIPS[i], 1]:
+            bits |= 1 << (i + 1)
+    return bits
+
+
+@njit(cache=True, fastmath=True)
+def compute(lm, w, h, mirror):
+    """Per-frame hand metrics from a (21, 3) float32 array of normalized landmarks.
+
+    Returns (px, palm_x, palm_y, pinch_distance, is_pinching, thumb_bent, index_bent, ext_bits)
+    where px is a (21, 2) int32 array of pixel coordinates.
+    """
+    n = lm.shape[0]
+    px = np.empty((n, 2), dtype=np.int32)
+    for i in range(n):
+        x = 1.0 - lm[i, 0] if mirror else lm[i, 0]
+        px[i, 0] = np.int32(x * w)
+        px[i, 1] = np.int32(lm[i, 1] * h)
+
+    wrist_x = 1.0 - lm[0, 0] if mirror else lm[0, 0]
+    mcp_x = 1.0 - lm[5, 0] if mirror else lm[5, 0]
+    palm_x = int((wrist_x + mcp_x) * w / 2)
+    palm_y = int((lm[0, 1] + lm[5, 1]) * h / 2)
+
+    dx = float(px[4, 0] - px[8, 0])
+    dy = float(px[4, 1] - px[8, 1])
+    d2 = dx * dx + dy * dy
+
+    # Bent heuristics (thumb compared in mirrored space when mirroring)
+    if mirror:
+        thumb_bent = lm[4, 0] > lm[3, 0]
+    else:
+        thumb_bent = lm[4, 0] < lm[3, 0]
+    index_bent = lm[8, 1] > lm[6, 1]
+
+    # Distance window with a finger-bent / very-close requirement, or always when very close.
+    # Thresholds are squared (25, 10, 60, 35 px) so the test needs no sqrt.
+    # Bitwise ops on the flags keep this a single branch-free expression.
+    is_pinching = (d2 < 625.0) | ((d2 > 100.0) & (d2 < 3600.0) & (thumb_bent | index_bent | (d2 < 1225.0)))
+
+    # The real distance is only needed by the caller
+    return px, palm_x, palm_y, np.sqrt(d2), is_pinching, thumb_bent, index_bent, extended_finger_bits(lm)
+
+
+@njit(cache=True)
+def two_hand_scale_update(current_d2, init_d2, init_size, current_size, lo, hi):
+    """Smoothed two-hand scale step from squared hand distances, clamped to [lo, hi].
+
+    The caller guarantees init_d2 > 0.
+    """
+    sf = np.sqrt(current_d2 / init_d2)
+    target = init_size * sf
+    return min(hi, max(lo, current_size * 0.7 + target * 0.3))
+
+
+def warmup():
+    """Trigger JIT compilation up front so the first tracked frame doesn't pay for it"""
+    compute(np.zeros((21, 3), dtype=np.float32), 1280, 720, True)
+    compute(np.zeros((21, 3), dtype=np.float32), 1280, 720, False)
+    two_hand_scale_update(1.0, 1.0, 1.0, 1.0, 0.0, 2.0)
@@ -1,15 +1,274 @@
 import numpy as np
 from typing import List, Tuple, Optional
 import os
+import warnings
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - faces then go through the numpy parser
+    njit = None
+
+_SPACE, _TAB, _NL = ord(' '), ord('\t'), ord('\n')
+
+
+def _split_records(data: bytes) -> dict:
+    """Group the lines of an OBJ file by record type ("v", "vn", "vt", "f") in one vectorized pass.
+
+    Returns tag -> (bodies, count): the newline-separated record bodies (tag blanked out)
+    and how many records there are.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    starts = np.concatenate(([0], np.flatnonzero(buf == _NL) + 1))
+    spans = np.diff(np.append(starts, len(buf)))
+    
+    # The first three bytes of every line identify its record type
+    padded = np.concatenate((buf, np.zeros(3, dtype=np.uint8)))
+    c0, c1, c2 = padded[starts], padded[starts + 1], padded[starts + 2]
+    if ((c0 == _SPACE) | (c0 == _TAB)).any():
+        # Indented records are rare; strip them and rescan
+        return _split_records(b'\n'.join(line.lstrip() for line in data.splitlines()))
+    blank1 = (c1 == _SPACE) | (c1 == _TAB)
+    blank2 = (c2 == _SPACE) | (c2 == _TAB)
+    kinds = {
+        b'v': (c0 == ord('v')) & blank1,
+        b'vn': (c0 == ord('v')) & (c1 == ord('n')) & blank2,
+        b'vt': (c0 == ord('v')) & (c1 == ord('t')) & blank2,
+        b'f': (c0 == ord('f')) & blank1,
+    }
+    
+    work = buf.copy()
+    records = {}
+    for tag, lines in kinds.items():
+        line_starts = starts[lines]
+        for k in range(len(tag)):
+            work[line_starts + k] = _SPACE
+        records[tag] = (work[np.repeat(lines, spans)].tobytes(), len(line_starts))
+    return records
+
+
+def _parse_numbers(buf: bytes, dtype) -> Optional[np.ndarray]:
+    """Parse whitespace-separated numbers in C; None if any token is not a number"""
+    with warnings.catch_warnings():
+        # numpy reports a partial parse with a DeprecationWarning (a ValueError in later versions)
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            return np.fromstring(buf, dtype=dtype, sep=' ')
+        except (DeprecationWarning, ValueError):
+            return None
+
+
+def _face_refs(buf, count, width):
+    """Leading vertex index of every corner of `count` newline-separated face records.
+
+    buf is the uint8 view of the record bodies; every record must have exactly `width`
+    corners. Returns ((count, width) int64 1-based indices, ok); ok is False when a record
+    has another corner count or a token is not an integer reference.
+    """
+    out = np.empty((count, width), dtype=np.int64)
+    row = 0
+    col = 0
+    val = 0
+    digits = 0
+    neg = False
+    in_tok = False
+    skip = False  # past the first '/' of a corner: vt/vn references are ignored
+    for i in range(len(buf) + 1):
+        c = buf[i] if i < len(buf) else 10
+        if c == 10 or c == 32 or c == 9 or c == 13:
+            if in_tok:
+                if digits == 0 or col >= width or row >= count:
+                    return out, False
+                out[row, col] = -val if neg else val
+                col += 1
+                val = 0
+                digits = 0
+                neg = False
+                in_tok = False
+                skip = False
+            if c == 10 and (col > 0 or i < len(buf)):
+                if col != width:
+                    return out, False
+                row += 1
+                col = 0
+        elif skip:
+            continue
+        elif c == 47:  # '/'
+            if digits == 0:
+                return out, False
+            skip = True
+        elif 48 <= c <= 57:
+            val = val * 10 + (c - 48)
+            digits += 1
+            in_tok = True
+        elif c == 45 and not in_tok:  # '-'
+            neg = True
+            in_tok = True
+        else:
+            return out, False
+    return out, row == count
+
+
+# Compiled single-pass face scanner; the numpy path is used when numba is unavailable
+_face_refs_kernel = njit(cache=True)(_face_refs) if njit is not None else None
+
+def _morton_codes(points: np.ndarray) -> np.ndarray:
+    """Z-order (Morton) code of each (N, 3) point, quantized to 16 bits per axis within their bounds"""
+    lo = points.min(axis=0)
+    extent = points.max(axis=0) - lo
+    extent[extent == 0] = 1
+    quantized = ((points - lo) / extent * 65535).astype(np.uint64)
+    
+    # Spread each axis' 16 bits two zeros apart, then interleave x, y, z
+    codes = np.zeros(len(points), dtype=np.uint64)
+    for axis in range(3):
+        x = quantized[:, axis]
+        for shift, mask in ((16, 0x0000FF0000FF), (8, 0x00F00F00F00F),
+                            (4, 0x0C30C30C30C3), (2, 0x249249249249)):
+            x = (x | (x << np.uint64(shift))) & np.uint64(mask)
+        codes |= x << np.uint64(axis)
+    return codes
+
+
+# Tom Forsyth's "Linear-Speed Vertex Cache Optimisation" parameters
+_CACHE_SIZE = 32
+_CACHE_DECAY_POWER = 1.5
+_LAST_TRI_SCORE = 0.75
+_VALENCE_BOOST_SCALE = 2.0
+_VALENCE_BOOST_POWER = 0.5
+
+
+def _forsyth_order(faces, num_vertices):
+    """Triangle order for faces ((F, 3) int32) that keeps an LRU vertex cache hot.
+
+    Greedily emits the best-scoring triangle among those touching the simulated cache, where a
+    vertex scores for its cache position and for how few unemitted triangles still use it.
+    Returns an (F,) int32 permutation of the face indices.
+    """
+    num_faces = faces.shape[0]
+    order = np.empty(num_faces, dtype=np.int32)
+    if num_faces == 0:
+        return order
+    
+    # Vertex -> triangles adjacency (CSR); each vertex's live triangles stay at the front of its run
+    valence = np.zeros(num_vertices, dtype=np.int32)
+    for t in range(num_faces):
+        for k in range(3):
+            valence[faces[t, k]] += 1
+    offsets = np.zeros(num_vertices + 1, dtype=np.int32)
+    for v in range(num_vertices):
+        offsets[v + 1] = offsets[v] + valence[v]
+    adjacency = np.empty(offsets[num_vertices], dtype=np.int32)
+    fill = offsets[:num_vertices].copy()
+    for t in range(num_faces):
+        for k in range(3):
+            v = faces[t, k]
+            adjacency[fill[v]] = t
+            fill[v] += 1
+    live = valence
+    
+    # Score tables: by cache position (index 0 = not cached) and by live triangle count
+    position_score = np.zeros(_CACHE_SIZE + 1, dtype=np.float64)
+    for pos in range(_CACHE_SIZE):
+        if pos < 3:
+            position_score[pos + 1] = _LAST_TRI_SCORE
+        else:
+            position_score[pos + 1] = (1.0 - (pos - 3) / (_CACHE_SIZE - 3)) ** _CACHE_DECAY_POWER
+    valence_score = np.zeros(live.max() + 1, dtype=np.float64)
+    for n in range(1, len(valence_score)):
+        valence_score[n] = _VALENCE_BOOST_SCALE * n ** -_VALENCE_BOOST_POWER
+    
+    vertex_score = np.empty(num_vertices, dtype=np.float64)
+    for v in range(num_vertices):
+        vertex_score[v] = valence_score[live[v]]
+    tri_score = np.empty(num_faces, dtype=np.float64)
+    for t in range(num_faces):
+        tri_score[t] = vertex_score[faces[t, 0]] + vertex_score[faces[t, 1]] + vertex_score[faces[t, 2]]
+    emitted = np.zeros(num_faces, dtype=np.bool_)
+    
+    cache = np.empty(_CACHE_SIZE, dtype=np.int32)
+    cache_len = 0
+    new_cache = np.empty(_CACHE_SIZE + 3, dtype=np.int32)
+    best = int(np.argmax(tri_score))
+    scan = 0
+    for i in range(num_faces):
+        if best < 0:
+            # Nothing in the cache has triangles left: continue from the next unemitted one
+            while emitted[scan]:
+                scan += 1
+            best = scan
+        t = best
+        emitted[t] = True
+        order[i] = t
+        
+        # Retire t from its vertices' live runs, and push them to the front of the cache
+        n = 0
+        for k in range(3):
+            v = faces[t, k]
+            start = offsets[v]
+            end = start + live[v]
+            for j in range(start, end):
+                if adjacency[j] == t:
+                    adjacency[j] = adjacency[end - 1]
+                    adjacency[end - 1] = t
+                    break
+            live[v] -= 1
+            duplicate = False
+            for j in range(n):
+                if new_cache[j] == v:
+                    duplicate = True
+            if not duplicate:
+                new_cache[n] = v
+                n += 1
+        for j in range(cache_len):
+            v = cache[j]
+            if v != faces[t, 0] and v != faces[t, 1] and v != faces[t, 2]:
+                new_cache[n] = v
+                n += 1
+        
+        # Rescore every vertex whose cache position changed (evicted ones drop out)
+        for j in range(n):
+            v = new_cache[j]
+            pos = j if j < _CACHE_SIZE else -1
+            score = position_score[pos + 1] + valence_score[live[v]]
+            delta = score - vertex_score[v]
+            vertex_score[v] = score
+            for a in range(offsets[v], offsets[v] + live[v]):
+                tri_score[adjacency[a]] += delta
+        cache_len = min(n, _CACHE_SIZE)
+        cache[:cache_len] = new_cache[:cache_len]
+        
+        # Next triangle: the best one touching the cache
+        best = -1
+        best_score = -1.0
+        for j in range(cache_len):
+            v = cache[j]
+            for a in range(offsets[v], offsets[v] + live[v]):
+                candidate = adjacency[a]
+                if tri_score[candidate] > best_score:
+                    best = candidate
+                    best_score = tri_score[candidate]
+    return order
+
+
+# Compiled vertex cache optimizer; without numba optimize_vertex_cache keeps the face order
+_forsyth_kernel = njit(cache=True)(_forsyth_order) if njit is not None else None
+
 
 class OBJLoader:
-    """Loader for OBJ 3D model files"""
+    """Loader for OBJ 3D model files.
+
+    vertices (N, 3) float32, faces (M, 3) int32, normals (K, 3) float32 and texture_coords
+    (T, 2) float32 are contiguous arrays; the get_* accessors return them without copying.
+    """
     
     def __init__(self):
-        self.vertices = []
-        self.faces = []
-        self.normals = []
-        self.texture_coords = []
+        self._reset()
+    
+    def _reset(self) -> None:
+        self.vertices = np.empty((0, 3), dtype=np.float32)
+        self.faces = np.empty((0, 3), dtype=np.int32)
+        self.normals = np.empty((0, 3), dtype=np.float32)
+        self.texture_coords = np.empty((0, 2), dtype=np.float32)
         
     def load_obj(self, filepath: str) -> bool:
         """Load an OBJ file and parse its contents"""
@@ -17,58 +276,18 @@ class OBJLoader:
             print(f"Error: OBJ file not found: {filepath}")
             return False
             
-        self.vertices = []
-        self.faces = []
-        self.normals = []
-        self.texture_coords = []
+        self._reset()
         
         try:
-            with open(filepath, 'r') as file:
-                for line_num, line in enumerate(file):
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                        
-                    parts = line.split()
-                    if not parts:
-                        continue
-                        
-                    if parts[0] == 'v':  # Vertex
-                        if len(parts) >= 4:
-                            vertex = [float(parts[1]), float(parts[2]), float(parts[3])]
-                            self.vertices.append(vertex)
-                            
-                    elif parts[0] == 'vn':  # Vertex normal
-                        if len(parts) >= 4:
-                            normal = [float(parts[1]), float(parts[2]), float(parts[3])]
-                            self.normals.append(normal)
-                            
-                    elif parts[0] == 'vt':  # Texture coordinate
-                        if len(parts) >= 3:
-                            tex_coord = [float(parts[1]), float(parts[2])]
-                            self.texture_coords.append(tex_coord)
-                            
-                    elif parts[0] == 'f':  # Face
-                        face_vertices = []
-                        valid_face = True
-                        for vertex_data in parts[1:]:
-                            # Handle different face formats: v, v/vt, v/vt/vn, v//vn
-                            vertex_indices = vertex_data.split('/')
-                            try:
-                                vertex_index = int(vertex_indices[0]) - 1  # OBJ indices start at 1
-                                face_vertices.append(vertex_index)
-                            except (ValueError, IndexError):
-                                print(f"Warning: Invalid vertex index in face: {vertex_data}")
-                                valid_face = False
-                                break
-                        
-                        # Convert to triangles if necessary
-                        if valid_face and len(face_vertices) >= 3:
-                            # For quads and higher polygons, triangulate
-                            for i in range(1, len(face_vertices) - 1):
-                                triangle = [face_vertices[0], face_vertices[i], face_vertices[i + 1]]
-                                # Only add triangle if all vertices are valid (will be checked later)
-                                self.faces.append(triangle)
+            with open(filepath, 'rb') as file:
+                data = file.read()
+            
+            # Collect the record bodies per type, then parse each type in one numpy call
+            records = _split_records(data)
+            self.vertices = self._parse_floats(*records[b'v'], 3).astype(np.float32)
+            self.normals = self._parse_floats(*records[b'vn'], 3).astype(np.float32)
+            self.texture_coords = self._parse_floats(*records[b'vt'], 2).astype(np.float32)
+            self.faces = self._parse_faces(*records[b'f']).astype(np.int32)
                                 
         except Exception as e:
             print(f"Error loading OBJ file: {e}")
@@ -79,88 +298,120 @@ class OBJLoader:
         
         print(f"Loaded OBJ: {len(self.vertices)} vertices, {len(self.faces)} faces")
         return True
+    
+    @staticmethod
+    def _parse_floats(bodies: bytes, count: int, ncols: int) -> np.ndarray:
+        """Parse `count` newline-separated records into an (N, ncols) float array (extra columns dropped)"""
+        if not count:
+            return np.empty((0, ncols), dtype=np.float64)
         
-    def _validate_faces(self) -> None:
-        """Remove faces that reference invalid vertex indices"""
-        if not self.faces or not self.vertices:
-            return
-            
-        num_vertices = len(self.vertices)
-        valid_faces = []
-        invalid_count = 0
+        # Fast path: every record has as many values as the first one
+        width = len(bodies.split(b'\n', 1)[0].split())
+        if width >= ncols:
+            values = _parse_numbers(bodies, np.float64)
+            if values is not None and values.size == width * count:
+                return values.reshape(-1, width)[:, :ncols]
+        
+        # Ragged records: parse one by one, skipping short ones
+        parsed = [[float(x) for x in row.split()[:ncols]] for row in bodies.split(b'\n')[:count]]
+        return np.array([r for r in parsed if len(r) == ncols], dtype=np.float64).reshape(-1, ncols)
+    
+    @staticmethod
+    def _parse_faces(bodies: bytes, count: int) -> np.ndarray:
+        """Parse `count` face records (v, v/vt, v/vt/vn, v//vn) into fan-triangulated (M, 3) 0-based indices"""
+        if not count:
+            return np.empty((0, 3), dtype=np.int64)
+        
+        # Fast path: every face has the corner count and v/vt/vn layout of the first one
+        tokens = bodies.split(b'\n', 1)[0].split()
+        width = len(tokens)
+        per_corner = sum(1 for ref in tokens[0].split(b'/') if ref)  # "1//3" -> 2 numbers
+        if width >= 3:
+            polys = None
+            if _face_refs_kernel is not None:
+                # One compiled scan that only converts the vertex reference of each corner
+                refs, ok = _face_refs_kernel(np.frombuffer(bodies, dtype=np.uint8), count, width)
+                if ok:
+                    polys = refs - 1  # OBJ indices start at 1
+            if polys is None:
+                # Parse every reference, then keep the leading vertex index of each corner
+                indices = _parse_numbers(bodies.replace(b'/', b' '), np.int64)
+                if indices is not None and indices.size == width * per_corner * count:
+                    polys = indices.reshape(-1, width, per_corner)[:, :, 0] - 1
+            if polys is not None:
+                # Fan triangulation (0, i, i+1), keeping each polygon's triangles together
+                fan = np.arange(1, width - 1)
+                return np.stack([np.broadcast_to(polys[:, :1], (len(polys), width - 2)),
+                                 polys[:, fan], polys[:, fan + 1]], axis=2).reshape(-1, 3)
         
-        for face in self.faces:
+        # Mixed polygon sizes or malformed records: triangulate one by one
+        faces = []
+        for row in bodies.split(b'\n')[:count]:
+            face_vertices = []
             valid_face = True
-            for vertex_idx in face:
-                if vertex_idx < 0 or vertex_idx >= num_vertices:
+            for vertex_data in row.split():
+                try:
+                    # partition stops at the first '/' and builds no list
+                    face_vertices.append(int(vertex_data.partition(b'/')[0]) - 1)
+                except ValueError:
+                    print(f"Warning: Invalid vertex index in face: {vertex_data.decode(errors='replace')}")
                     valid_face = False
-                    invalid_count += 1
                     break
+            if valid_face and len(face_vertices) >= 3:
+                for i in range(1, len(face_vertices) - 1):
+                    faces.append([face_vertices[0], face_vertices[i], face_vertices[i + 1]])
+        return np.array(faces, dtype=np.int64).reshape(-1, 3)
+        
+    def _validate_faces(self) -> None:
+        """Remove faces that reference invalid vertex indices"""
+        if len(self.faces) == 0 or len(self.vertices) == 0:
+            return
             
-            if valid_face:
-                valid_faces.append(face)
+        num_vertices = len(self.vertices)
+        valid = ((self.faces >= 0) & (self.faces < num_vertices)).all(axis=1)
+        invalid_count = len(valid) - int(np.count_nonzero(valid))
         
         if invalid_count > 0:
             print(f"Warning: Removed {invalid_count} faces with invalid vertex references")
             
-        self.faces = valid_faces
+        self.faces = self.faces[valid]
         
     def get_vertices(self) -> np.ndarray:
-        """Get vertices as numpy array"""
-        return np.array(self.vertices, dtype=np.float32)
+        """Get vertices as an (N, 3) float32 array (not a copy)"""
+        return self.vertices
         
     def get_faces(self) -> np.ndarray:
-        """Get faces as numpy array"""
-        return np.array(self.faces, dtype=np.int32)
+        """Get faces as an (M, 3) int32 array (not a copy)"""
+        return self.faces
         
     def get_normals(self) -> np.ndarray:
-        """Get normals as numpy array"""
-        return np.array(self.normals, dtype=np.float32)
+        """Get normals as a (K, 3) float32 array (not a copy)"""
+        return self.normals
         
     def calculate_face_normals(self) -> np.ndarray:
         """Calculate face normals if not provided in OBJ file"""
         if len(self.vertices) == 0 or len(self.faces) == 0:
             return np.array([])
             
-        vertices = self.get_vertices()
-        faces = self.get_faces()
-        face_normals = []
+        vertices = self.vertices
+        faces = self.faces
         num_vertices = len(vertices)
         
-        for face in faces:
-            if len(face) >= 3:
-                # Check if all face indices are valid
-                valid_face = True
-                for idx in face[:3]:  # Only check first 3 vertices for triangle
-                    if idx < 0 or idx >= num_vertices:
-                        print(f"Warning: Face references invalid vertex index {idx} (max: {num_vertices-1})")
-                        valid_face = False
-                        break
-                
-                if not valid_face:
-                    # Skip this face and use default normal
-                    face_normals.append(np.array([0, 0, 1], dtype=np.float32))
-                    continue
-                
-                v1 = vertices[face[0]]
-                v2 = vertices[face[1]]
-                v3 = vertices[face[2]]
-                
-                # Calculate normal using cross product
-                edge1 = v2 - v1
-                edge2 = v3 - v1
-                normal = np.cross(edge1, edge2)
-                
-                # Normalize
-                length = np.linalg.norm(normal)
-                if length > 0:
-                    normal = normal / length
-                else:
-                    normal = np.array([0, 0, 1])  # Default normal
-                    
-                face_normals.append(normal)
-                
-        return np.array(face_normals, dtype=np.float32)
+        # Faces with out-of-range indices (or degenerate area) get the default +Z normal
+        face_normals = np.zeros((len(faces), 3), dtype=np.float32)
+        face_normals[:, 2] = 1.0
+        valid = ((faces >= 0) & (faces < num_vertices)).all(axis=1)
+        
+        # Cross product of the two edges from the first corner, for all faces at once
+        tri = vertices[faces[valid]]
+        normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        lengths = np.linalg.norm(normals, axis=1)
+        nonzero = lengths > 0
+        normals[nonzero] /= lengths[nonzero, None]
+        normals[~nonzero] = (0.0, 0.0, 1.0)
+        face_normals[valid] = normals
+        
+        return face_normals
         
     def get_bounding_box(self) -> Tuple[np.ndarray, np.ndarray]:
         """Get the bounding box of the model (min, max)"""
@@ -178,16 +429,43 @@ class OBJLoader:
         if len(self.vertices) == 0:
             return
             
-        vertices = np.array(self.vertices)
+        vertices = self.vertices
         
-        # Center the model
-        center = np.mean(vertices, axis=0)
-        vertices -= center
+        # Center the model (in place; accumulate the mean in float64)
+        vertices -= vertices.mean(axis=0, dtype=np.float64).astype(np.float32)
         
-        # Scale to target size
-        max_extent = np.max(np.abs(vertices))
+        # Scale to target size (largest |coordinate| from the two reductions; no abs() temporary)
+        max_extent = max(vertices.max(), -vertices.min())
         if max_extent > 0:
-            scale_factor = target_size / max_extent
-            vertices *= scale_factor
-            
-        self.vertices = vertices.tolist()
+            vertices *= np.float32(target_size / max_extent)
+    
+    def optimize_vertex_cache(self) -> None:
+        """Renumber vertices so the per-frame projection and face gathers walk memory nearly sequentially.
+
+        A cache-friendly face order is computed (a Morton sort of the face centroids, then
+        Forsyth's linear-speed optimizer when numba is available) and vertices are renumbered
+        in the order it first references them, unreferenced ones last. The faces themselves
+        keep their order: render_solid paints in model order without a depth sort, so
+        reordering them would change how overlapping front faces composite.
+        """
+        if len(self.faces) == 0 or len(self.vertices) == 0:
+            return
+        
+        num_vertices = len(self.vertices)
+        
+        # Start from a Z-order sort of the face centroids: spatially close faces get close
+        # indices, which the optimizer's restarts and the numpy-only path both inherit
+        # (this order only drives the vertex layout)
+        faces = self.faces[np.argsort(_morton_codes(self.vertices[self.faces].mean(axis=1)), kind='stable')]
+        if _forsyth_kernel is not None:
+            faces = faces[_forsyth_kernel(faces, num_vertices)]
+        
+        # Vertex remap: referenced vertices in first-use order, then the rest in original order
+        used, first_use = np.unique(faces.ravel(), return_index=True)
+        new_order = np.concatenate((used[np.argsort(first_use)],
+                                    np.setdiff1d(np.arange(num_vertices), used, assume_unique=True)))
+        remap = np.empty(num_vertices, dtype=np.int32)
+        remap[new_order] = np.arange(num_vertices, dtype=np.int32)
+        
+        self.vertices = self.vertices[new_order]
+        self.faces = remap[self.faces]
@@ -3,6 +3,62 @@ import cv2
 from typing import List, Tuple, Optional
 import math
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional - projection then goes through numpy
+    njit = None
+
+
+def _project(verts, mvp, width, height, out):
+    """Model -> clip -> screen for each vertex in one pass, writing int32 (N, 2) pixels into out"""
+    for i in range(verts.shape[0]):
+        vx, vy, vz = float(verts[i, 0]), float(verts[i, 1]), float(verts[i, 2])
+        x = mvp[0, 0] * vx + mvp[0, 1] * vy + mvp[0, 2] * vz + mvp[0, 3]
+        y = mvp[1, 0] * vx + mvp[1, 1] * vy + mvp[1, 2] * vz + mvp[1, 3]
+        w = mvp[3, 0] * vx + mvp[3, 1] * vy + mvp[3, 2] * vz + mvp[3, 3]
+        out[i, 0] = np.int32((x / w + 1) * width / 2)
+        out[i, 1] = np.int32((1 - y / w) * height / 2)
+
+
+# Compiled projection kernel; project_vertices falls back to numpy when numba is unavailable
+_project_kernel = njit(cache=True)(_project) if njit is not None else None
+
+
+def _cull_and_light(tri, keep, normals, light, color, front, colors):
+    """Back-face cull and light (F, 3, 2) screen triangles in one pass.
+
+    Writes the indices of kept, front-facing faces to front and their int32 lit colors to
+    colors (both in face order); returns how many were written.
+    """
+    n = 0
+    for i in range(tri.shape[0]):
+        if not keep[i]:
+            continue
+        ax = tri[i, 1, 0] - tri[i, 0, 0]
+        ay = tri[i, 1, 1] - tri[i, 0, 1]
+        bx = tri[i, 2, 0] - tri[i, 0, 0]
+        by = tri[i, 2, 1] - tri[i, 0, 1]
+        if ax * by - ay * bx <= 0:
+            continue
+        if i < normals.shape[0]:
+            intensity = normals[i, 0] * light[0] + normals[i, 1] * light[1] + normals[i, 2] * light[2]
+            lighting = min(1.0, 0.3 + intensity * 0.7) if intensity > 0 else 0.3
+        else:
+            lighting = 0.7
+        for k in range(3):
+            colors[n, k] = np.int32(color[k] * lighting)
+        front[n] = i
+        n += 1
+    return n
+
+
+# Compiled culling + lighting kernel; render_solid falls back to numpy when numba is unavailable
+_cull_and_light_kernel = njit(cache=True)(_cull_and_light) if njit is not None else None
+
+# Stand-in (0, 3) normals for models without any, so both culling paths see one array shape
+_NO_NORMALS = np.empty((0, 3), dtype=np.float32)
+
+
 class Transform3D:
     """3D transformation matrix operations"""
     
@@ -72,19 +128,29 @@ class Transform3D:
     
     @staticmethod
     def look_at(eye: np.ndarray, target: np.ndarray, up: np.ndarray) -> np.ndarray:
-        """Create view matrix using look-at"""
-        forward = target - eye
-        forward = forward / np.linalg.norm(forward)
+        """Create view matrix using look-at.
+
+        Built from scalar math on Python floats.
+        """
+        ex, ey, ez = float(eye[0]), float(eye[1]), float(eye[2])
+        ux, uy, uz = float(up[0]), float(up[1]), float(up[2])
         
-        right = np.cross(forward, up)
-        right = right / np.linalg.norm(right)
+        fx, fy, fz = float(target[0]) - ex, float(target[1]) - ey, float(target[2]) - ez
+        inv = 1.0 / math.sqrt(fx * fx + fy * fy + fz * fz)
+        fx, fy, fz = fx * inv, fy * inv, fz * inv
         
-        up = np.cross(right, forward)
+        # right = forward x up
+        rx, ry, rz = fy * uz - fz * uy, fz * ux - fx * uz, fx * uy - fy * ux
+        inv = 1.0 / math.sqrt(rx * rx + ry * ry + rz * rz)
+        rx, ry, rz = rx * inv, ry * inv, rz * inv
+        
+        # up = right x forward (already unit length)
+        ux, uy, uz = ry * fz - rz * fy, rz * fx - rx * fz, rx * fy - ry * fx
         
         return np.array([
-            [right[0], right[1], right[2], -np.dot(right, eye)],
-            [up[0], up[1], up[2], -np.dot(up, eye)],
-            [-forward[0], -forward[1], -forward[2], np.dot(forward, eye)],
+            [rx, ry, rz, -(rx * ex + ry * ey + rz * ez)],
+            [ux, uy, uz, -(ux * ex + uy * ey + uz * ez)],
+            [-fx, -fy, -fz, fx * ex + fy * ey + fz * ez],
             [0, 0, 0, 1]
         ], dtype=np.float32)
 
@@ -113,35 +179,89 @@ class Renderer3D:
             self.fov, width / height, self.near, self.far)
         self.view_matrix = Transform3D.look_at(
             self.camera_pos, self.camera_target, self.camera_up)
+        self._update_view_projection()
+        
+        # Reused screen-coordinate output, grown to the largest vertex count seen
+        self._screen_buf = np.empty((0, 2), dtype=np.int32)
+        # Reused homogeneous vertex input for the numpy path, w column preset to 1
+        self._v4_buf = np.ones((0, 4), dtype=np.float64)
+    
+    def _get_mvp(self, model_matrix: np.ndarray) -> np.ndarray:
+        """float64 projection @ view @ model: one 4x4 product on the cached view-projection"""
+        return (self.vp_matrix @ model_matrix).astype(np.float64)
+    
+    def _update_view_projection(self):
+        """Cache projection @ view, plus its x/y/w rows as Python floats for single-point projection"""
+        self.vp_matrix = self.projection_matrix @ self.view_matrix
+        self.vp_rows = self.vp_matrix[[0, 1, 3]].tolist()
+        
+        # World-space frustum planes (Gribb-Hartmann): left, right, bottom, top, near, far as
+        # rows (a, b, c, d) with unit normals pointing inside
+        m = self.vp_matrix.astype(np.float64)
+        planes = np.array([m[3] + m[0], m[3] - m[0], m[3] + m[1], m[3] - m[1], m[3] + m[2], m[3] - m[2]])
+        planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+        self.frustum_planes = planes
+        self.frustum_rows = planes.tolist()
+    
+    def sphere_in_frustum(self, x: float, y: float, z: float, radius: float) -> bool:
+        """False when the world-space sphere lies entirely outside one of the frustum planes"""
+        for a, b, c, d in self.frustum_rows:
+            if a * x + b * y + c * z + d < -radius:
+                return False
+        return True
         
     def project_vertices(self, vertices: np.ndarray, model_matrix: np.ndarray) -> np.ndarray:
-        """Project 3D vertices to 2D screen coordinates"""
+        """Project 3D vertices to 2D screen coordinates.
+
+        The result is a view into a reused int32 buffer, valid until the next call.
+        """
         if len(vertices) == 0:
             return np.array([])
         
-        # Add homogeneous coordinate
-        vertices_4d = np.hstack([vertices, np.ones((vertices.shape[0], 1))])
+        n = vertices.shape[0]
+        if self._screen_buf.shape[0] < n:
+            self._screen_buf = np.empty((n, 2), dtype=np.int32)
+        out = self._screen_buf[:n]
+        
+        if _project_kernel is not None:
+            _project_kernel(vertices, self._get_mvp(model_matrix), self.width, self.height, out)
+            return out
+        
+        # Add homogeneous coordinate: copy xyz into the reused buffer, doubling it on overflow
+        if self._v4_buf.shape[0] < n:
+            self._v4_buf = np.ones((max(n, 2 * self._v4_buf.shape[0]), 4), dtype=np.float64)
+        vertices_4d = self._v4_buf[:n]
+        vertices_4d[:, :3] = vertices
         
         # Apply transformations: Model -> View -> Projection
-        mvp_matrix = self.projection_matrix @ self.view_matrix @ model_matrix
-        projected = vertices_4d @ mvp_matrix.T
+        projected = vertices_4d @ self._get_mvp(model_matrix).T
         
         # Perspective divide
         projected[:, :3] /= projected[:, 3:4]
         
-        # Convert to screen coordinates
-        screen_coords = np.zeros((projected.shape[0], 2))
-        screen_coords[:, 0] = (projected[:, 0] + 1) * self.width / 2
-        screen_coords[:, 1] = (1 - projected[:, 1]) * self.height / 2
+        # Convert to screen coordinates, truncated straight into the int32 buffer
+        out[:, 0] = (projected[:, 0] + 1) * self.width / 2
+        out[:, 1] = (1 - projected[:, 1]) * self.height / 2
         
-        return screen_coords.astype(np.int32)
+        return out
     
-    def calculate_lighting(self, normal: np.ndarray) -> float:
-        """Calculate simple diffuse lighting"""
-        # Normalize the normal vector
-        if np.linalg.norm(normal) > 0:
-            normal = normal / np.linalg.norm(normal)
+    def project_points_batch(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Project (M, 3) world points under the camera only, in one matmul.
+
+        Returns (screen (M, 2) float64, valid (M,)); valid is False for points behind the camera.
+        """
+        clip = points @ self.vp_matrix[:, :3].T + self.vp_matrix[:, 3]
         
+        w = clip[:, 3]
+        valid = w > 0
+        w_safe = np.where(valid, w, 1.0)
+        screen = np.empty((len(points), 2), dtype=np.float64)
+        screen[:, 0] = (clip[:, 0] / w_safe + 1) * self.width / 2
+        screen[:, 1] = (1 - clip[:, 1] / w_safe) * self.height / 2
+        return screen, valid
+    
+    def calculate_lighting(self, normal: np.ndarray) -> float:
+        """Calculate simple diffuse lighting for a unit normal"""
         # Calculate dot product with light direction
         intensity = max(0.0, np.dot(normal, self.light_dir))
         
@@ -149,6 +269,18 @@ class Renderer3D:
         ambient = 0.3
         return min(1.0, ambient + intensity * 0.7)
     
+    def _gather_faces(self, screen_coords: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Gather every face's screen points at once.
+
+        Returns (tri (F, 3, 2), keep (F,)); keep is False for faces referencing missing
+        vertices or projecting far off-screen.
+        """
+        in_range = (faces < len(screen_coords)).all(axis=1)
+        tri = screen_coords[np.where(in_range[:, None], faces, 0)]
+        xs, ys = tri[..., 0], tri[..., 1]
+        near = ((xs >= -100) & (xs <= self.width + 100) & (ys >= -100) & (ys <= self.height + 100)).all(axis=1)
+        return tri, in_range & near
+    
     def render_wireframe(self, frame: np.ndarray, vertices: np.ndarray, faces: np.ndarray, 
                         model_matrix: np.ndarray, color: Tuple[int, int, int] = (255, 255, 255)) -> np.ndarray:
         """Render model as wireframe"""
@@ -158,87 +290,69 @@ class Renderer3D:
         # Project vertices to screen space
         screen_coords = self.project_vertices(vertices, model_matrix)
         
-        # Draw edges
-        for face in faces:
-            if len(face) >= 3:
-                for i in range(len(face)):
-                    start_idx = face[i]
-                    end_idx = face[(i + 1) % len(face)]
-                    
-                    if start_idx < len(screen_coords) and end_idx < len(screen_coords):
-                        start_point = tuple(screen_coords[start_idx])
-                        end_point = tuple(screen_coords[end_idx])
-                        
-                        # Check if points are within screen bounds
-                        if (0 <= start_point[0] < self.width and 0 <= start_point[1] < self.height and
-                            0 <= end_point[0] < self.width and 0 <= end_point[1] < self.height):
-                            cv2.line(frame, start_point, end_point, color, 1)
+        # OpenCV clips edges of the kept faces while drawing
+        tri, keep = self._gather_faces(screen_coords, faces)
+        tri = tri[keep]
+        
+        # Draw all edges in one call
+        if len(tri) > 0:
+            cv2.polylines(frame, list(tri), True, color, 1)
         
         return frame
     
     def render_solid(self, frame: np.ndarray, vertices: np.ndarray, faces: np.ndarray,
                     face_normals: np.ndarray, model_matrix: np.ndarray, 
-                    color: Tuple[int, int, int] = (100, 150, 255)) -> np.ndarray:
-        """Render model with solid faces and lighting"""
+                    color: Tuple[int, int, int] = (100, 150, 255), outline: bool = False) -> np.ndarray:
+        """Render model with solid faces and lighting, optionally outlining each face in black"""
         if len(vertices) == 0 or len(faces) == 0:
             return frame
         
         # Project vertices to screen space
         screen_coords = self.project_vertices(vertices, model_matrix)
+        tri, keep = self._gather_faces(screen_coords, faces)
         
-        # Transform normals (only rotation part of model matrix)
-        rotation_matrix = model_matrix[:3, :3]
+        # Normals are unit length and the model matrix is rotation times uniform scale, so
+        # n' . l == n . (M^T l) / scale: bring the light into model space instead of
+        # transforming and re-normalizing every normal
         if len(face_normals) > 0:
-            transformed_normals = face_normals @ rotation_matrix.T
+            rotation_scale = model_matrix[:3, :3]
+            light = rotation_scale.T @ self.light_dir / np.linalg.norm(rotation_scale[:, 0])
+        else:
+            face_normals = _NO_NORMALS
+            light = self.light_dir
+        
+        # Back-face culling (simple version: screen-space winding of the first three vertices)
+        # and a lit color per front face (same diffuse + ambient model as calculate_lighting;
+        # faces without a normal get the default 0.7)
+        if _cull_and_light_kernel is not None:
+            front = np.empty(len(tri), dtype=np.int64)
+            lit_colors = np.empty((len(tri), 3), dtype=np.int32)
+            n = _cull_and_light_kernel(tri, keep, face_normals, light.astype(np.float64),
+                                       np.asarray(color, dtype=np.float64), front, lit_colors)
+            front, lit_colors = front[:n], lit_colors[:n]
         else:
-            transformed_normals = []
+            v1 = tri[:, 1] - tri[:, 0]
+            v2 = tri[:, 2] - tri[:, 0]
+            cross = v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0]
+            front = np.flatnonzero(keep & (cross > 0))
+            
+            lit_colors = np.empty((len(front), 3), dtype=np.int32)
+            lit_colors[:] = tuple(int(c * 0.7) for c in color)
+            has_normal = front < len(face_normals)
+            intensity = face_normals[front[has_normal]] @ light
+            lighting = np.minimum(1.0, 0.3 + intensity * 0.7)
+            lit = lighting[:, None] * np.asarray(color, dtype=lighting.dtype)
+            lit[~(intensity > 0)] = tuple(int(c * 0.3) for c in color)  # ambient only
+            lit_colors[has_normal] = lit
+        if len(front) == 0:
+            return frame
         
-        # Draw faces with back-face culling and lighting
-        for i, face in enumerate(faces):
-            if len(face) >= 3:
-                # Get screen coordinates for this face
-                face_points = []
-                valid_face = True
-                
-                for vertex_idx in face:
-                    if vertex_idx < len(screen_coords):
-                        point = screen_coords[vertex_idx]
-                        # Basic bounds checking
-                        if (-100 <= point[0] <= self.width + 100 and 
-                            -100 <= point[1] <= self.height + 100):
-                            face_points.append(point)
-                        else:
-                            valid_face = False
-                            break
-                    else:
-                        valid_face = False
-                        break
-                
-                if not valid_face or len(face_points) < 3:
-                    continue
-                
-                # Back-face culling (simple version)
-                if len(face_points) >= 3:
-                    v1 = face_points[1] - face_points[0]
-                    v2 = face_points[2] - face_points[0]
-                    cross = v1[0] * v2[1] - v1[1] * v2[0]
-                    
-                    if cross > 0:  # Front-facing
-                        # Calculate lighting
-                        if i < len(transformed_normals):
-                            lighting = self.calculate_lighting(transformed_normals[i])
-                        else:
-                            lighting = 0.7  # Default lighting
-                        
-                        # Apply lighting to color
-                        lit_color = tuple(int(c * lighting) for c in color)
-                        
-                        # Draw filled triangle/polygon
-                        points = np.array(face_points, dtype=np.int32)
-                        cv2.fillPoly(frame, [points], lit_color)
-                        
-                        # Optional: draw wireframe on top
-                        cv2.polylines(frame, [points], True, (0, 0, 0), 1)
+        # Draw front faces in model order; faces are triangles, so the convex rasterizer applies
+        for points, lit_color in zip(tri[front], lit_colors.tolist()):
+            cv2.fillConvexPoly(frame, points, lit_color, lineType=cv2.LINE_8)
+            
+            if outline:
+                cv2.polylines(frame, [points], True, (0, 0, 0), 1)
         
         return frame
     
@@ -267,3 +381,4 @@ class Renderer3D:
             
         self.view_matrix = Transform3D.look_at(
             self.camera_pos, self.camera_target, self.camera_up)
+        self._update_view_projection()
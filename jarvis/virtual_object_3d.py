@@ -1,15 +1,108 @@
 import numpy as np
 import cv2
 import math
-from typing import Tuple, Optional
+from enum import IntEnum
+from typing import Tuple, Optional, Union
 from obj_loader import OBJLoader
-from renderer_3d import Renderer3D, Transform3D
+from renderer_3d import Renderer3D
+
+_TAU = math.tau
+
+# Unit cube corners (back face 0-3, front face 4-7) and its 12 edges as corner index pairs:
+# the back and front loops plus the four connecting edges
+_BOX_CORNERS = np.array([
+    [-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],
+    [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]
+], dtype=np.float32)
+_BOX_EDGES = np.array([
+    [0, 1], [1, 2], [2, 3], [3, 0],
+    [4, 5], [5, 6], [6, 7], [7, 4],
+    [0, 4], [1, 5], [2, 6], [3, 7]
+])
+
+
+class RenderMode(IntEnum):
+    """How a VirtualObject3D is drawn; SOLID ^ 1 == WIREFRAME so the two toggle with XOR"""
+    SOLID = 0
+    WIREFRAME = 1
+    POINTS = 2
+    SOLID_OUTLINED = 3  # SOLID with a black edge drawn over every face
+    
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+class Scene:
+    """Structure-of-arrays interaction state for a set of VirtualObject3D instances.
+
+    Row i of every array belongs to objects[i], so per-frame bookkeeping (who is grabbed,
+    selected or rotating) can be queried with boolean masks instead of Python loops.
+    """
+    
+    _fields = ('pos', 'scale', 'bbox_size', 'grabbed', 'is_selected', 'in_rotation', 'rotation_hand',
+               'rot', 'render_mode')
+    
+    def __init__(self, capacity: int = 16):
+        self.objects = []
+        self.pos = np.zeros((capacity, 3), dtype=np.float64)  # x/y/z world position
+        self.scale = np.ones(capacity, dtype=np.float64)
+        self.bbox_size = np.ones(capacity, dtype=np.float64)  # scaled bounding box extent
+        self.grabbed = np.zeros(capacity, dtype=np.int8)  # number of hands grabbing
+        self.is_selected = np.zeros(capacity, dtype=bool)  # two-hand selection mode
+        self.in_rotation = np.zeros(capacity, dtype=bool)
+        self.rotation_hand = np.full(capacity, -1, dtype=np.int8)  # -1 = no rotation hand
+        self.rot = np.zeros((capacity, 3), dtype=np.float64)  # rotation_x/y/z in radians
+        self.render_mode = np.zeros(capacity, dtype=np.uint8)  # RenderMode values
+    
+    def __len__(self) -> int:
+        return len(self.objects)
+    
+    def add(self, obj: 'VirtualObject3D') -> int:
+        """Register obj and return its row, growing the arrays when full"""
+        i = len(self.objects)
+        if i == len(self.grabbed):
+            cap = max(1, 2 * i)
+            for name in self._fields:
+                arr = getattr(self, name)
+                setattr(self, name, np.resize(arr, (cap,) + arr.shape[1:]))
+        self.objects.append(obj)
+        return i
+    
+    def project_centers(self, renderer: Renderer3D) -> Tuple[np.ndarray, np.ndarray]:
+        """Screen positions of every object's center in one batch: (screen (M, 2), valid (M,))"""
+        return renderer.project_points_batch(self.pos[:len(self.objects)])
+    
+    def hit_radii(self) -> np.ndarray:
+        """Per-object grab radius in pixels, as used by VirtualObject3D.is_point_inside"""
+        n = len(self.objects)
+        return np.maximum(45, self.bbox_size[:n] * 65 * self.scale[:n])
+
 
 class VirtualObject3D:
-    """3D virtual object that can be manipulated in AR space"""
+    """3D virtual object that can be manipulated in AR space.
+
+    x/y/z, scale, bounding_box_size, is_grabbed, is_selected, is_in_rotation_mode,
+    rotation_hand_idx, rotation_x/y/z and render_mode live in a Scene row.
+    """
+    
+    __slots__ = (
+        '_scene', '_idx',
+        'obj_path', 'original_scale', 'color',
+        'grabbed_by_hand_mask', 'highlighted', 'selected',
+        'selection_hand_idx', 'last_selection_hand_pos',
+        'last_rotation_hand_pos', 'rotation_axis',
+        'auto_rotate', 'auto_rotation_speed',
+        'loader', 'vertices', 'faces', 'face_normals', 'bound_radius', 'bbox_extent',
+        'vertices_q', 'vertex_scale',
+        '_center_cache', '_model_cache', '_model_q_cache', '_state_colors',
+    )
     
     def __init__(self, obj_path: str, x: float = 0, y: float = 0, z: float = 0, 
-                 scale: float = 1.0, color: Tuple[int, int, int] = (100, 150, 255)):
+                 scale: float = 1.0, color: Tuple[int, int, int] = (100, 150, 255),
+                 scene: Optional[Scene] = None):
+        # Registers itself in the scene (a private one if none is given)
+        self._scene = scene if scene is not None else Scene(1)
+        self._idx = self._scene.add(self)
         self.obj_path = obj_path
         self.x = x
         self.y = y
@@ -25,7 +118,7 @@ class VirtualObject3D:
         
         # Interaction state
         self.is_grabbed = 0  # 0 = not grabbed, 1 = grabbed with 1 hand, 2 = grabbed with 2 hands
-        self.grabbed_by_hand = []  # List of hand indices that are grabbing this object
+        self.grabbed_by_hand_mask = 0  # Bit h set = hand h is grabbing this object
         self.highlighted = False  # For object selection
         self.selected = False  # Track selection state for highlighting
         
@@ -38,6 +131,7 @@ class VirtualObject3D:
         self.is_in_rotation_mode = False  # True when object is in rotation mode (1 hand grabbing)
         self.rotation_hand_idx = None  # Hand index that is controlling rotation (the open hand)
         self.last_rotation_hand_pos = None  # Last position of the rotation hand
+        self.rotation_axis = -1  # Axis driven by the rotation hand (0=x, 1=y, 2=z, -1=none)
         
         # Auto-rotation disabled by default - objects only rotate when pinched
         self.auto_rotate = False
@@ -49,53 +143,209 @@ class VirtualObject3D:
         self.faces = np.array([])
         self.face_normals = np.array([])
         self.bounding_box_size = 1.0
+        self.bbox_extent = 1.0  # largest model-space bounding box side (unscaled)
+        self.bound_radius = 0.0  # model-space bounding sphere radius around the origin
+        # int16 fixed-point copy of vertices for the projection pass (vertices ~= vertices_q * vertex_scale)
+        self.vertices_q = np.empty((0, 3), dtype=np.int16)
+        self.vertex_scale = 1.0
+        # ((x, y, z), renderer, view, projection, screen position) of the last center projection
+        self._center_cache = None
+        # ((x, y, z, scale, rx, ry, rz), model matrix) of the last get_model_matrix call
+        self._model_cache = None
+        # (model matrix, model matrix with the vertex_scale dequantization folded in)
+        self._model_q_cache = None
+        # (color, grabbed color, highlighted color) for the color the brightened tuples came from
+        self._state_colors = None
         
         # Rendering mode
-        self.render_mode = "solid"  # "wireframe", "solid", "points"
+        self.render_mode = RenderMode.SOLID
         
         self.load_model()
+    
+    @property
+    def x(self) -> float:
+        return float(self._scene.pos[self._idx, 0])
+    
+    @x.setter
+    def x(self, value: float):
+        self._scene.pos[self._idx, 0] = value
+    
+    @property
+    def y(self) -> float:
+        return float(self._scene.pos[self._idx, 1])
+    
+    @y.setter
+    def y(self, value: float):
+        self._scene.pos[self._idx, 1] = value
+    
+    @property
+    def z(self) -> float:
+        return float(self._scene.pos[self._idx, 2])
+    
+    @z.setter
+    def z(self, value: float):
+        self._scene.pos[self._idx, 2] = value
+    
+    @property
+    def scale(self) -> float:
+        return float(self._scene.scale[self._idx])
+    
+    @scale.setter
+    def scale(self, value: float):
+        self._scene.scale[self._idx] = value
+    
+    @property
+    def bounding_box_size(self) -> float:
+        return float(self._scene.bbox_size[self._idx])
+    
+    @bounding_box_size.setter
+    def bounding_box_size(self, value: float):
+        self._scene.bbox_size[self._idx] = value
+    
+    @property
+    def is_grabbed(self) -> int:
+        return int(self._scene.grabbed[self._idx])
+    
+    @is_grabbed.setter
+    def is_grabbed(self, value: int):
+        self._scene.grabbed[self._idx] = value
+    
+    @property
+    def rotation_x(self) -> float:
+        return float(self._scene.rot[self._idx, 0])
+    
+    @rotation_x.setter
+    def rotation_x(self, value: float):
+        self._scene.rot[self._idx, 0] = value
+    
+    @property
+    def rotation_y(self) -> float:
+        return float(self._scene.rot[self._idx, 1])
+    
+    @rotation_y.setter
+    def rotation_y(self, value: float):
+        self._scene.rot[self._idx, 1] = value
+    
+    @property
+    def rotation_z(self) -> float:
+        return float(self._scene.rot[self._idx, 2])
+    
+    @rotation_z.setter
+    def rotation_z(self, value: float):
+        self._scene.rot[self._idx, 2] = value
+    
+    @property
+    def render_mode(self) -> RenderMode:
+        return RenderMode(self._scene.render_mode[self._idx])
+    
+    @render_mode.setter
+    def render_mode(self, value: RenderMode):
+        self._scene.render_mode[self._idx] = value
+    
+    @property
+    def is_selected(self) -> bool:
+        return bool(self._scene.is_selected[self._idx])
+    
+    @is_selected.setter
+    def is_selected(self, value: bool):
+        self._scene.is_selected[self._idx] = value
+    
+    @property
+    def is_in_rotation_mode(self) -> bool:
+        return bool(self._scene.in_rotation[self._idx])
+    
+    @is_in_rotation_mode.setter
+    def is_in_rotation_mode(self, value: bool):
+        self._scene.in_rotation[self._idx] = value
+    
+    @property
+    def rotation_hand_idx(self) -> Optional[int]:
+        hand = int(self._scene.rotation_hand[self._idx])
+        return hand if hand >= 0 else None
+    
+    @rotation_hand_idx.setter
+    def rotation_hand_idx(self, value: Optional[int]):
+        self._scene.rotation_hand[self._idx] = -1 if value is None else value
         
     def load_model(self) -> bool:
         """Load the 3D model from OBJ file"""
         if not self.loader.load_obj(self.obj_path):
             print(f"Failed to load 3D model: {self.obj_path}")
             return False
+        
+        # Lay vertices out for cache-friendly per-frame gathers
+        self.loader.optimize_vertex_cache()
             
         self.vertices = self.loader.get_vertices()
         self.faces = self.loader.get_faces()
         
-        # Calculate face normals if not provided
-        if len(self.loader.get_normals()) > 0:
-            self.face_normals = self.loader.get_normals()
-        else:
-            self.face_normals = self.loader.calculate_face_normals()
+        # Faces arrive fan-triangulated as a contiguous (F, 3) int32 array, so derive one unit
+        # normal per triangle (the file's vn records are per-vertex and don't line up with faces);
+        # being unit length, the renderer never has to re-normalize them per frame
+        self.face_normals = self.loader.calculate_face_normals()
         
         # Normalize model to reasonable size
         self.loader.normalize_model(target_size=2.0)
         self.vertices = self.loader.get_vertices()
         
-        # Calculate bounding box for collision detection
+        # Calculate bounding box for collision detection, and the bounding sphere for culling
         if len(self.vertices) > 0:
             min_bounds, max_bounds = self.loader.get_bounding_box()
-            self.bounding_box_size = np.max(max_bounds - min_bounds) * self.scale
+            self.bbox_extent = float(np.max(max_bounds - min_bounds))
+            self.bounding_box_size = self.bbox_extent * self.scale
+            self.bound_radius = float(np.sqrt(np.einsum('ij,ij->i', self.vertices, self.vertices).max()))
+            
+            # Quantize to int16 over the largest |coordinate|: half the float32 bytes to
+            # stream per frame, at ~1e-5 of the model size in precision
+            extent = float(np.abs(self.vertices).max())
+            self.vertex_scale = extent / 32767 if extent > 0 else 1.0
+            self.vertices_q = np.rint(self.vertices / self.vertex_scale).astype(np.int16)
+            self._model_q_cache = None
         
         print(f"Loaded 3D model: {len(self.vertices)} vertices, {len(self.faces)} faces")
         return True
     
     def get_model_matrix(self) -> np.ndarray:
-        """Get the transformation matrix for this object"""
-        # Create transformation matrices
-        translation = Transform3D.translation_matrix(self.x, self.y, self.z)
-        rotation_x = Transform3D.rotation_matrix_x(self.rotation_x)
-        rotation_y = Transform3D.rotation_matrix_y(self.rotation_y)
-        rotation_z = Transform3D.rotation_matrix_z(self.rotation_z)
-        scale_matrix = Transform3D.scale_matrix(self.scale, self.scale, self.scale)
-        
-        # Combine transformations: Scale -> Rotate -> Translate
-        model_matrix = translation @ rotation_z @ rotation_y @ rotation_x @ scale_matrix
+        """Get the transformation matrix for this object.
+
+        Translate @ Rz @ Ry @ Rx @ Scale built in closed form, and cached until the transform
+        changes. Callers must not modify the returned matrix: it is shared until then.
+        """
+        rx, ry, rz = self._scene.rot[self._idx].tolist()
+        key = (self.x, self.y, self.z, self.scale, rx, ry, rz)
+        cache = self._model_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        
+        cx, sx = math.cos(rx), math.sin(rx)
+        cy, sy = math.cos(ry), math.sin(ry)
+        cz, sz = math.cos(rz), math.sin(rz)
+        s = self.scale
+        # Scale folded into the shared ZYX products: 18 multiplies for the 3x3 block
+        czs, szs, cys = cz * s, sz * s, cy * s
+        sysx, sycx = sy * sx, sy * cx
+        model_matrix = np.array([
+            [czs * cy, czs * sysx - szs * cx, czs * sycx + szs * sx, self.x],
+            [szs * cy, szs * sysx + czs * cx, szs * sycx - czs * sx, self.y],
+            [-sy * s, cys * sx, cys * cx, self.z],
+            [0, 0, 0, 1]
+        ], dtype=np.float32)
         
+        self._model_cache = (key, model_matrix)
         return model_matrix
     
+    def _get_quantized_model_matrix(self, model_matrix: np.ndarray) -> np.ndarray:
+        """model_matrix with vertex_scale folded into its linear part, for drawing vertices_q.
+
+        Cached on model_matrix's identity, so it is rebuilt only when the transform changes.
+        """
+        cache = self._model_q_cache
+        if cache is None or cache[0] is not model_matrix:
+            quantized = model_matrix.copy()
+            quantized[:3, :3] *= self.vertex_scale
+            cache = self._model_q_cache = (model_matrix, quantized)
+        return cache[1]
+    
     def draw(self, frame: np.ndarray, renderer: Renderer3D) -> np.ndarray:
         """Draw the 3D object on the frame"""
         if len(self.vertices) == 0 or len(self.faces) == 0:
@@ -104,8 +354,12 @@ class VirtualObject3D:
         # Update auto-rotation
         if self.auto_rotate and not self.is_grabbed:
             self.rotation_y += self.auto_rotation_speed
-            if self.rotation_y > 2 * math.pi:
-                self.rotation_y -= 2 * math.pi
+            if self.rotation_y > _TAU:
+                self.rotation_y -= _TAU
+        
+        # Skip the mesh entirely when its bounding sphere is outside the view frustum
+        if not renderer.sphere_in_frustum(self.x, self.y, self.z, self.bound_radius * self.scale):
+            return self._draw_pinchable_radius(frame, renderer)
         
         # Get transformation matrix
         model_matrix = self.get_model_matrix()
@@ -116,19 +370,23 @@ class VirtualObject3D:
         elif self.is_selected:
             color = (255, 255, 0)  # Bright yellow when selected for rotation
         elif self.is_grabbed:
-            color = tuple(min(255, c + 80) for c in self.color)  # Brighter when grabbed
+            color = self._get_state_colors()[1]  # Brighter when grabbed
         elif self.highlighted:
-            color = tuple(min(255, c + 40) for c in self.color)  # Slightly brighter when highlighted
+            color = self._get_state_colors()[2]  # Slightly brighter when highlighted
         else:
             color = self.color
         
-        # Choose rendering method based on mode
-        if self.render_mode == "wireframe":
-            frame = renderer.render_wireframe(frame, self.vertices, self.faces, model_matrix, color)
-        elif self.render_mode == "solid":
-            frame = renderer.render_solid(frame, self.vertices, self.faces, self.face_normals, model_matrix, color)
-        elif self.render_mode == "points":
-            frame = renderer.render_points(frame, self.vertices, model_matrix, color)
+        # Choose rendering method based on mode; the mesh is drawn from its int16 vertices
+        render_mode = self._scene.render_mode[self._idx]
+        vertices_q = self.vertices_q
+        model_q = self._get_quantized_model_matrix(model_matrix)
+        if render_mode == RenderMode.WIREFRAME:
+            frame = renderer.render_wireframe(frame, vertices_q, self.faces, model_q, color)
+        elif render_mode == RenderMode.SOLID or render_mode == RenderMode.SOLID_OUTLINED:
+            frame = renderer.render_solid(frame, vertices_q, self.faces, self.face_normals, model_q, color,
+                                          outline=render_mode == RenderMode.SOLID_OUTLINED)
+        elif render_mode == RenderMode.POINTS:
+            frame = renderer.render_points(frame, vertices_q, model_q, color)
         
         # Draw bounding box if grabbed
         if self.is_grabbed:
@@ -139,35 +397,28 @@ class VirtualObject3D:
         
         return frame
     
+    def _get_state_colors(self) -> Tuple[Tuple[int, int, int], Tuple[int, int, int], Tuple[int, int, int]]:
+        """(color, grabbed color, highlighted color), rebuilt only when self.color changes"""
+        cache = self._state_colors
+        if cache is None or cache[0] != self.color:
+            color = self.color
+            cache = self._state_colors = (color, tuple(min(255, c + 80) for c in color),
+                                          tuple(min(255, c + 40) for c in color))
+        return cache
+    
     def _draw_bounding_box(self, frame: np.ndarray, renderer: Renderer3D, model_matrix: np.ndarray) -> np.ndarray:
         """Draw a bounding box around the object when grabbed"""
-        # Create a simple cube for bounding box
-        size = self.bounding_box_size * 0.6
-        box_vertices = np.array([
-            [-size, -size, -size], [size, -size, -size], [size, size, -size], [-size, size, -size],  # Back face
-            [-size, -size, size], [size, -size, size], [size, size, size], [-size, size, size]       # Front face
-        ], dtype=np.float32)
-        
-        box_edges = [
-            [0, 1], [1, 2], [2, 3], [3, 0],  # Back face
-            [4, 5], [5, 6], [6, 7], [7, 4],  # Front face
-            [0, 4], [1, 5], [2, 6], [3, 7]   # Connecting edges
-        ]
-        
-        # Project box vertices
+        # Project the cube's corners
+        box_vertices = _BOX_CORNERS * np.float32(self.bounding_box_size * 0.6)
         screen_coords = renderer.project_vertices(box_vertices, model_matrix)
         
-        # Draw box edges
-        for edge in box_edges:
-            start_idx, end_idx = edge
-            if start_idx < len(screen_coords) and end_idx < len(screen_coords):
-                start_point = tuple(screen_coords[start_idx])
-                end_point = tuple(screen_coords[end_idx])
-                
-                # Check bounds
-                if (0 <= start_point[0] < renderer.width and 0 <= start_point[1] < renderer.height and
-                    0 <= end_point[0] < renderer.width and 0 <= end_point[1] < renderer.height):
-                    cv2.line(frame, start_point, end_point, (255, 255, 0), 2)
+        # Draw all 12 edges as 2-point segments in one call; OpenCV clips segments that leave
+        # the frame, so only edges with a far off-screen endpoint are dropped
+        near = ((screen_coords[:, 0] >= -100) & (screen_coords[:, 0] <= renderer.width + 100) &
+                (screen_coords[:, 1] >= -100) & (screen_coords[:, 1] <= renderer.height + 100))
+        edges = screen_coords[_BOX_EDGES[near[_BOX_EDGES].all(axis=1)]]
+        if len(edges) > 0:
+            cv2.polylines(frame, list(edges), False, (255, 255, 0), 2)
         
         return frame
     
@@ -178,25 +429,12 @@ class VirtualObject3D:
         if not hasattr(self, 'selected') or self.selected is None:
             return frame
             
-        # Calculate screen position directly without model matrix transformations
-        # This ensures the radius is always centered on the object's actual position
-        center_3d = np.array([[self.x, self.y, self.z, 1.0]])
-        
-        # Use only view and projection matrices, not the model matrix
-        vp_matrix = renderer.projection_matrix @ renderer.view_matrix
-        projected_center = center_3d @ vp_matrix.T
-        
-        if projected_center[0, 3] <= 0:  # Behind camera
+        # Screen position of the object's actual position (no model matrix), so the
+        # radius is always centered on it
+        screen_pos = self._project_center(renderer)
+        if screen_pos is None:  # Behind camera
             return frame
-        
-        # Perspective divide
-        projected_center[:, :3] /= projected_center[:, 3:4]
-        
-        # Convert to screen coordinates
-        screen_x = (projected_center[0, 0] + 1) * renderer.width / 2
-        screen_y = (1 - projected_center[0, 1]) * renderer.height / 2
-        
-        center = (int(screen_x), int(screen_y))
+        center = (int(screen_pos[0]), int(screen_pos[1]))
         
         # Calculate pinchable radius based on the same logic as is_point_inside
         pinchable_radius = int(max(45, self.bounding_box_size * 65 * self.scale))
@@ -219,52 +457,55 @@ class VirtualObject3D:
         if len(self.vertices) == 0:
             return False
         
-        # Project object center to screen space directly without model matrix transformations
-        center_3d = np.array([[self.x, self.y, self.z, 1.0]])
-        
-        # Use only view and projection matrices, not the model matrix
-        vp_matrix = renderer.projection_matrix @ renderer.view_matrix
-        projected_center = center_3d @ vp_matrix.T
-        
-        if projected_center[0, 3] <= 0:  # Behind camera
+        screen_pos = self._project_center(renderer)
+        if screen_pos is None:  # Behind camera
             return False
-        
-        # Perspective divide
-        projected_center[:, :3] /= projected_center[:, 3:4]
-        
-        # Convert to screen coordinates
-        screen_x = (projected_center[0, 0] + 1) * renderer.width / 2
-        screen_y = (1 - projected_center[0, 1]) * renderer.height / 2
+        screen_x, screen_y = screen_pos
         
         # Use scaled bounding box for hit detection (moderately increased for easier grabbing)
         hit_radius = max(45, self.bounding_box_size * 65 * self.scale)  # Balanced grab area
-        distance = math.sqrt((x - screen_x) ** 2 + (y - screen_y) ** 2)
+        dx = x - screen_x
+        dy = y - screen_y
         
-        return distance <= hit_radius
+        return dx * dx + dy * dy <= hit_radius * hit_radius
     
     def get_screen_position(self, renderer: Renderer3D) -> Optional[Tuple[float, float]]:
         """Get the screen position of the object's center"""
         if len(self.vertices) == 0:
             return None
+        return self._project_center(renderer)
+    
+    def _project_center(self, renderer: Renderer3D) -> Optional[Tuple[float, float]]:
+        """Screen position of (x, y, z) under the camera only (no model matrix); None if behind it.
+
+        Scalar math on the renderer's cached view-projection rows; memoized until the object
+        moves or the camera changes, so the grab test, the hit test and the radius overlay
+        share one projection.
+        """
+        pos = (self.x, self.y, self.z)
+        vp_rows = renderer.vp_rows
+        cache = self._center_cache
+        if cache is not None and cache[0] == pos and cache[1] is renderer and cache[2] is vp_rows:
+            return cache[3]
+        
+        x, y, z = pos
+        row_x, row_y, row_w = vp_rows
+        w = row_w[0] * x + row_w[1] * y + row_w[2] * z + row_w[3]
+        if w <= 0:  # Behind camera
+            screen_pos = None
+        else:
+            # Perspective divide and viewport mapping
+            cx = row_x[0] * x + row_x[1] * y + row_x[2] * z + row_x[3]
+            cy = row_y[0] * x + row_y[1] * y + row_y[2] * z + row_y[3]
+            screen_pos = ((cx / w + 1) * renderer.width / 2, (1 - cy / w) * renderer.height / 2)
         
-        # Project object center to screen space directly without model matrix transformations
-        center_3d = np.array([[self.x, self.y, self.z, 1.0]])
-        
-        # Use only view and projection matrices, not the model matrix
-        vp_matrix = renderer.projection_matrix @ renderer.view_matrix
-        projected_center = center_3d @ vp_matrix.T
-        
-        if projected_center[0, 3] <= 0:  # Behind camera
-            return None
-        
-        # Perspective divide
-        projected_center[:, :3] /= projected_center[:, 3:4]
-        
-        # Convert to screen coordinates
-        screen_x = (projected_center[0, 0] + 1) * renderer.width / 2
-        screen_y = (1 - projected_center[0, 1]) * renderer.height / 2
-        
-        return (screen_x, screen_y)
+        self._center_cache = (pos, renderer, vp_rows, screen_pos)
+        return screen_pos
+    
+    def cache_screen_position(self, renderer: Renderer3D, center: Tuple[float, float, float],
+                              screen_pos: Optional[Tuple[float, float]]):
+        """Seed the center projection memo with a result computed elsewhere (e.g. a batch)"""
+        self._center_cache = (tuple(center), renderer, renderer.vp_rows, screen_pos)
     
     def move_to(self, x: float, y: float, z: Optional[float] = None):
         """Move the object to a new position"""
@@ -284,23 +525,36 @@ class VirtualObject3D:
     def scale_object(self, scale_factor: float):
         """Scale the object"""
         self.scale = max(0.1, min(5.0, self.original_scale * scale_factor))
-        self.bounding_box_size = np.max(self.loader.get_bounding_box()[1] - self.loader.get_bounding_box()[0]) * self.scale
+        self.bounding_box_size = self.bbox_extent * self.scale
     
     def rotate(self, delta_x: float, delta_y: float, delta_z: float = 0.0):
-        """Rotate the object"""
-        self.rotation_x += delta_x
-        self.rotation_y += delta_y
-        self.rotation_z += delta_z
-        
-        # Keep angles in reasonable range
-        self.rotation_x = self.rotation_x % (2 * math.pi)
-        self.rotation_y = self.rotation_y % (2 * math.pi)
-        self.rotation_z = self.rotation_z % (2 * math.pi)
+        """Rotate the object (any delta; angles are wrapped to [0, 2*pi))"""
+        rot = self._scene.rot[self._idx]
+        rot[0] = (rot[0] + delta_x) % _TAU
+        rot[1] = (rot[1] + delta_y) % _TAU
+        rot[2] = (rot[2] + delta_z) % _TAU
     
-    def set_render_mode(self, mode: str):
-        """Set the rendering mode"""
-        if mode in ["wireframe", "solid", "points"]:
-            self.render_mode = mode
+    def rotate_axis(self, axis: int, delta: float):
+        """Rotate about one axis (0=x, 1=y, 2=z) by a per-frame step, wrapped to [0, 2*pi).
+
+        Requires |delta| < 2*pi: a single conditional wrap replaces the modulo. Use rotate()
+        for arbitrary deltas.
+        """
+        rot = self._scene.rot
+        angle = rot[self._idx, axis] + delta
+        if angle >= _TAU:
+            angle -= _TAU
+        elif angle < 0.0:
+            angle += _TAU
+        rot[self._idx, axis] = angle
+    
+    def set_render_mode(self, mode: Union[RenderMode, str]):
+        """Set the rendering mode ("wireframe", "solid", "solid_outlined", "points" or a RenderMode)"""
+        if isinstance(mode, str):
+            mode = RenderMode.__members__.get(mode.upper())
+            if mode is None:
+                return
+        self.render_mode = mode
     
     def toggle_auto_rotation(self):
         """Toggle auto-rotation"""
@@ -308,6 +562,4 @@ class VirtualObject3D:
     
     def reset_rotation(self):
         """Reset rotation to default"""
-        self.rotation_x = 0.0
-        self.rotation_y = 0.0
-        self.rotation_z = 0.0
+        self._scene.rot[self._idx] = 0.0
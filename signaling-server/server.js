@@ -6,7 +6,24 @@ const path = require('path');
 
 const app = express();
 const server = http.createServer(app);
+// Optional binary wire format: SOCKETIO_PARSER=msgpack encodes events (e.g. hand-skeleton
+// landmark floats) as MessagePack instead of JSON text. Every client must use the matching
+// parser: Python clients need SOCKETIO_SERIALIZER=msgpack, and the browser apps pick the
+// msgpack client bundle from GET /socket.io-config.
+const SOCKETIO_PARSER = process.env.SOCKETIO_PARSER === 'msgpack' ? 'msgpack' : 'json';
+const parserOpts = {};
+if (SOCKETIO_PARSER === 'msgpack') {
+  try {
+    parserOpts.parser = require('socket.io-msgpack-parser');
+    console.log('Socket.IO using msgpack parser');
+  } catch (e) {
+    // Falling back to JSON would silently cut off msgpack clients, so refuse to start
+    console.error('SOCKETIO_PARSER=msgpack but socket.io-msgpack-parser is not installed (npm install)');
+    process.exit(1);
+  }
+}
 const io = socketIO(server, {
+  ...parserOpts,
   cors: {
     origin: "*",
     methods: ["GET", "POST"]
@@ -30,9 +47,34 @@ const staticOpts = {
 app.use('/clinician', express.static(path.join(__dirname, '../clinician-app'), staticOpts));
 app.use('/expert', express.static(path.join(__dirname, '../expert-app'), staticOpts));
 
+// Wire format the browser apps must load the matching Socket.IO client bundle for
+app.get('/socket.io-config', (req, res) => {
+  res.json({ parser: SOCKETIO_PARSER });
+});
+
 // In-memory storage for latest expert hand landmarks per room
 const lastSkeletonByRoom = new Map();
 
+// Experts may send landmarks packed as int16 (`landmarksQ`, value * LANDMARK_Q_SCALE).
+// Socket.IO forwards the binary as-is; the REST endpoints get plain {x,y,z} landmarks.
+const LANDMARK_Q_SCALE = 16384;
+function dequantizeSkeleton(skel) {
+  if (!skel || !skel.landmarksQ) {
+    return skel;
+  }
+  const buf = Buffer.from(skel.landmarksQ);
+  const landmarks = [];
+  for (let o = 0; o + 6 <= buf.length; o += 6) {
+    landmarks.push({
+      x: buf.readInt16LE(o) / LANDMARK_Q_SCALE,
+      y: buf.readInt16LE(o + 2) / LANDMARK_Q_SCALE,
+      z: buf.readInt16LE(o + 4) / LANDMARK_Q_SCALE,
+    });
+  }
+  const { landmarksQ, ...rest } = skel;
+  return { ...rest, landmarks };
+}
+
 // Expose latest hand landmarks for a given room
 // Example: GET /expert/hand-landmarks?roomId=ROOM123
 app.get('/expert/hand-landmarks', (req, res) => {
@@ -282,8 +324,8 @@ io.on('connection', (socket) => {
     try {
       const multi = Array.isArray(skeletons) ? skeletons : (skeleton ? [skeleton] : []);
       lastSkeletonByRoom.set(roomId, {
-        skeleton,      // keep single for backward compatibility
-        skeletons: multi,
+        skeleton: dequantizeSkeleton(skeleton),      // keep single for backward compatibility
+        skeletons: multi.map(dequantizeSkeleton),
         updatedAt: Date.now(),
         senderId: socket.id,
       });